@@ -1,23 +1,10 @@
-import math
-import heapq
 import numpy as np
 
-#define a classe Cell (célula)
-class Cell:
-    def __init__(self):
-        self.parent_i=0 #indice da linha do pai da celula
-        self.parent_j=0 #indice da coluna do pai da celula
-        self.f=float('inf') #custo total da celula (g+h)
-        self.g=float('inf') #custo do inicio ate esta celula
-        self.h=0 #custo heuristico desta celula ate o destino
-
-#define o tamanho da grade (grid)
-ROW = 9
-COL = 10
+from grid_engine import GridEngine
 
 #verifica se uma celula eh valida (esta dentro da grade)
-def is_valid(row,col):
-    return (row>=0) and (row<ROW) and (col>=0) and (col<COL)
+def is_valid(grid,row,col):
+    return (row>=0) and (row<len(grid)) and (col>=0) and (col<len(grid[0]))
 
 #verifica se uma celula nao esta bloqueada
 def is_unblocked(grid,row,col):
@@ -31,117 +18,64 @@ def is_destination(row,col,dest):
 def calculate_h_value(row,col,dest):
     return ((row-dest[0])**2+(col-dest[1])**2)**0.5
 
-#traça o caminho do inicio até o destino
-def trace_path(cell_details,dest):
+#exibe o caminho do inicio até o destino
+def trace_path(path):
     print("O caminho encontrado eh:")
-    path = []
-    row = dest[0]
-    col = dest[1]
-
-    #traça o caminho do destino até a origem usando as celulas pai
-    while not(cell_details[row][col].parent_i==row and cell_details[row][col].parent_j==col):
-        path.append((row,col))
-        temp_row=cell_details[row][col].parent_i
-        temp_col=cell_details[row][col].parent_j
-        row=temp_row
-        col=temp_col
-
-    #adiciona a celula de origem ao caminho
-    path.append((row,col))
-
-    #inverte o caminho para exibi-lo da origem até o destino
-    path.reverse()
-
-    for i in path:
-        print("->",i,end=" ")
+    for row, col in path:
+        print("->",(int(row),int(col)),end=" ")
     print()
 
-#implementa o algoritmo de busca A*
-def a_star_search(grid,src,dest):
+#ultimo motor montado por a_star_search e a copia da grade (livre/bloqueada) que ele representa
+_cached_grid = None
+_cached_engine = None
+
+#motor da grade no modelo de custo de antes: diagonais custam 1 e podem passar rente a quinas
+#consultas seguidas na mesma grade reaproveitam o motor (arrays de busca e tabela de landmarks);
+#se a grade mudou desde a ultima chamada, um motor novo eh montado
+def engine_for(grid):
+    global _cached_grid, _cached_engine
+    cells = np.asarray(grid) != 0
+    if _cached_engine is None or _cached_grid.shape != cells.shape or not np.array_equal(_cached_grid, cells):
+        _cached_engine = GridEngine(cells, diagonal_cost=1.0, corner_cutting=True)
+        _cached_grid = cells
+    return _cached_engine
+
+#implementa o algoritmo de busca A* sem escrever nada na saida
+#retorna um SearchResult (caminho como array (k, 2), custo, expansoes, insercoes e tempo);
+#origem ou destino invalidos/bloqueados geram ValueError
+#engine: GridEngine opcional ja montado para a grade (grid eh ignorada); sem ele usa engine_for(grid)
+#heuristic: "euclidean" (calculate_h_value) ou "landmarks" (ALT, melhor em labirintos)
+#observer: SearchObserver opcional (search_observer.py); o perfil fica em result.profile
+def a_star_search(grid,src,dest,heuristic="euclidean",observer=None,engine=None):
+    if engine is None:
+        engine = engine_for(grid)
+    return engine.query((src[0],src[1]), (dest[0],dest[1]), heuristic=heuristic, observer=observer)
+
+#versao para o console: mesmas mensagens de antes, em volta de a_star_search
+def print_a_star_search(grid,src,dest,heuristic="euclidean"):
     #verifica se a origem e o destino sao validos
-    if not is_valid(src[0],src[1]) or not is_valid(dest[0],dest[1]):
+    if not is_valid(grid,src[0],src[1]) or not is_valid(grid,dest[0],dest[1]):
         print("A origem ou o destino são inválidos")
-        return
+        return None
 
     #verifica se a origem e o destino nao estao bloqueados
     if not is_unblocked(grid,src[0],src[1]) or not is_unblocked(grid,dest[0],dest[1]):
         print("A origem ou o destino estao bloqueados")
-        return
+        return None
 
     #verifica se ja estamos no destino
     if is_destination(src[0],src[1],dest):
         print("Ja estamos no destino")
-        return
-
-    #inicializa a lista fechada(celulas ja visitadas)
-    closed_list = np.full((ROW,COL),False) 
-
-    #inicializa os detalhes de cada celula
-    cell_details = np.empty((ROW, COL), dtype=object)  # Cria um array de objetos vazios
-    for i in range(ROW):
-        for j in range(COL):
-            cell_details[i, j] = Cell()
-
-
-    #configura os detalhes da celula inicial 
-    i = src[0]
-    j = src[1]
-
-    #inicializa a lista aberta (celulas a serem visitadas) com a celula inicial
-    open_list = []
-    heapq.heappush(open_list,(0.0,i,j))
-
-    #flag para indicar se o destino foi encontrado
-    found_dest = False
-
-    #loop principal do algoritmo A*
-    while len(open_list)>0:
-        #remove a celula com o menor valor de f da lista aberta
-        p = heapq.heappop(open_list)
-
-        #marca a celula como visitada
-        i=p[1]
-        j=p[2]
-        closed_list[i][j]=True
-
-        #para cada direcao possivel, verifica os sucessores
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
-        for dir in directions:
-            new_i = i + dir[0]
-            new_j = j + dir[1]
-
-            # Se o sucessor for válido, não estiver bloqueado e ainda não tiver sido visitado
-            if is_valid(new_i, new_j) and is_unblocked(grid, new_i, new_j) and not closed_list[new_i][new_j]:
-                # Se o sucessor for o destino
-                if is_destination(new_i, new_j, dest):
-                    # Define o pai da célula de destino
-                    cell_details[new_i][new_j].parent_i = i
-                    cell_details[new_i][new_j].parent_j = j
-                    print("A célula de destino foi encontrada")
-                    # Traça e exibe o caminho do início até o destino
-                    trace_path(cell_details, dest)
-                    found_dest = True
-                    return
-                else:
-                    # Calcula os novos valores de f, g e h
-                    g_new = cell_details[i][j].g + 1.0
-                    h_new = calculate_h_value(new_i, new_j, dest)
-                    f_new = g_new + h_new
-
-                    # Se a célula ainda não estiver na lista aberta ou o novo f for menor
-                    if cell_details[new_i][new_j].f == float('inf') or cell_details[new_i][new_j].f > f_new:
-                        # Adiciona a célula à lista aberta
-                        heapq.heappush(open_list, (f_new, new_i, new_j))
-                        # Atualiza os detalhes da célula
-                        cell_details[new_i][new_j].f = f_new
-                        cell_details[new_i][new_j].g = g_new
-                        cell_details[new_i][new_j].h = h_new
-                        cell_details[new_i][new_j].parent_i = i
-                        cell_details[new_i][new_j].parent_j = j
-
-    # Se o destino não foi encontrado após visitar todas as células
-    if not found_dest:
+        return None
+
+    result = a_star_search(grid,src,dest,heuristic)
+    if not result.found:
         print("Falha ao encontrar a célula de destino")
+        return result
+
+    print("A célula de destino foi encontrada")
+    trace_path(result.path)
+    return result
 
 def main():
     # Define a grade (1 para caminho livre, 0 para bloqueado)
@@ -162,7 +96,7 @@ def main():
     dest = [0, 0]
 
     # Executa o algoritmo de busca A*
-    a_star_search(grid, src, dest)
+    print_a_star_search(grid, src, dest)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,358 @@
+import argparse
+import csv
+import glob
+import json
+import math
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = os.path.join(ROOT, "benchmarks")
+INSTANCE_DIR = os.path.join(BENCH_DIR, "instancias")
+MAP_DIR = os.path.join(BENCH_DIR, "mapas")
+#instancias de Korf disponiveis: subconjunto (1 a 5) das 100 do artigo, ver o cabecalho do arquivo
+KORF_FILE = os.path.join(INSTANCE_DIR, "korf5.txt")
+#pasta do SlidingPuzzle (supremacy.py e modulos vizinhos)
+PUZZLE_DIR = os.path.dirname(glob.glob(os.path.join(ROOT, "trabalho-1", "*", "supremacy.py"))[0])
+
+SUITES = ("puzzle8", "korf", "grid")
+
+#piora relativa aceita antes de acusar regressao (10%)
+THRESHOLD = 0.10
+
+#semente fixa de --generate: os arquivos gerados sao sempre os mesmos
+SEED = 2024
+
+#profundidades exatas do 8-puzzle sorteadas por --generate e instancias por profundidade
+PUZZLE8_DEPTHS = (4, 8, 12, 16, 20, 24, 28)
+PUZZLE8_PER_DEPTH = 5
+
+#mapas gerados: (nome, linhas, colunas) e cenarios por mapa
+GRID_MAPS = (("random25_128", 128, 128), ("rooms_128", 128, 128))
+SCENARIOS_PER_MAP = 40
+
+
+#--- conjuntos de instancias ------------------------------------------------
+
+def read_puzzle8(path=None):
+    """Linhas "profundidade p0 p1 ... p8" (destino 1..8 com o vazio no fim) -> [(profundidade, matriz)]"""
+    path = path or os.path.join(INSTANCE_DIR, "puzzle8_profundidade.txt")
+    instances = []
+    with open(path) as file:
+        for line in file:
+            if line.strip() and not line.startswith("#"):
+                depth, *tiles = (int(value) for value in line.split())
+                instances.append((depth, np.array(tiles).reshape(3, 3)))
+    return instances
+
+
+def read_korf(path=None):
+    """
+    Linhas "numero p0 ... p15 otimo" (numero da instancia no artigo de Korf; destino 0..15,
+    vazio no canto superior esquerdo) -> [(numero, otimo, matriz)]
+    O arquivo padrao (KORF_FILE) so tem as instancias 1 a 5 do artigo.
+    """
+    path = path or KORF_FILE
+    instances = []
+    with open(path) as file:
+        for line in file:
+            if line.strip() and not line.startswith("#"):
+                number, *tiles, optimal = (int(value) for value in line.split())
+                instances.append((number, optimal, np.array(tiles).reshape(4, 4)))
+    return instances
+
+
+def scenario_files():
+    return sorted(glob.glob(os.path.join(MAP_DIR, "*.scen")))
+
+
+#--- execucao das suites ----------------------------------------------------
+
+def _puzzle():
+    if PUZZLE_DIR not in sys.path:
+        sys.path.insert(0, PUZZLE_DIR)
+    from supremacy import SlidingPuzzle
+    return SlidingPuzzle
+
+
+def run_puzzle8(limit=None):
+    """A* com Manhattan em cada instancia do 8-puzzle"""
+    puzzle = _puzzle()(3)
+    records = []
+    for i, (depth, board) in enumerate(read_puzzle8()[:limit]):
+        start = time.perf_counter()
+        _, metrics = puzzle.busca_a_estrela(board, puzzle.matriz_destino, 1)
+        records.append({"instance": f"d{depth}_{i}", "expected": depth, "cost": metrics.profundidade,
+                        "expansions": metrics.nodos_expandidos, "time": time.perf_counter() - start})
+    return records
+
+
+def run_korf(limit=None):
+    """IDA* com os bancos de padroes aditivos nas instancias de KORF_FILE (lento em Python: use --limit)"""
+    puzzle = _puzzle()(4)
+    goal = np.arange(16).reshape(4, 4)
+    records = []
+    for number, optimal, board in read_korf()[:limit]:
+        start = time.perf_counter()
+        _, metrics = puzzle.busca_ida_estrela(board, goal, 6)
+        records.append({"instance": f"korf{number}", "expected": optimal, "cost": metrics.profundidade,
+                        "expansions": metrics.nodos_expandidos, "time": time.perf_counter() - start})
+    return records
+
+
+def run_grid(limit=None, algorithm="astar"):
+    """Todos os cenarios .scen de benchmarks/mapas no GridEngine (custo octil, sem cortar quinas)"""
+    from map_io import iter_scenarios, open_map
+    records = []
+    for scen in scenario_files():
+        engines = {}
+        scenarios = list(iter_scenarios(scen))[:limit]
+        for i, (bucket, map_name, src, dest, optimal) in enumerate(scenarios):
+            if map_name not in engines:
+                engines[map_name] = open_map(os.path.join(MAP_DIR, map_name))
+            result = engines[map_name].query(src, dest, algorithm=algorithm)
+            records.append({"instance": f"{map_name}_{i}_b{bucket}", "expected": optimal, "cost": result.cost,
+                            "expansions": result.expansions, "time": result.time})
+    return records
+
+
+def _run_suite(suite, limit, grid_algorithm):
+    """Executa uma suite (num processo proprio, para o pico de memoria ser so dela)"""
+    if suite == "puzzle8":
+        records = run_puzzle8(limit)
+    elif suite == "korf":
+        records = run_korf(limit)
+    elif suite == "grid":
+        records = run_grid(limit, grid_algorithm)
+    else:
+        raise ValueError(f"Suite desconhecida: {suite}")
+    #ru_maxrss vem em KiB no Linux
+    return records, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def summarize(records, peak_rss_kb):
+    times = np.array([record["time"] for record in records])
+    expansions = sum(record["expansions"] for record in records)
+    wrong = sum(not math.isclose(record["cost"], record["expected"], rel_tol=1e-6, abs_tol=1e-6)
+                for record in records)
+    summary = {
+        "instances": len(records),
+        "wrong_cost": wrong,
+        "expansions": expansions,
+        "total_time": float(times.sum()),
+        "nodes_per_s": expansions / times.sum() if times.sum() > 0 else 0.0,
+        "peak_rss_kb": peak_rss_kb,
+    }
+    for p in (50, 90, 99):
+        summary[f"latency_p{p}_ms"] = float(np.percentile(times, p) * 1000) if len(times) else 0.0
+    return summary
+
+
+def run(suites, limit=None, grid_algorithm="astar"):
+    """Roda as suites e retorna o dicionario de resultados (o que vai para o JSON)"""
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "limit": limit,
+        "grid_algorithm": grid_algorithm,
+        "suites": {},
+    }
+    for suite in suites:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            records, peak_rss = executor.submit(_run_suite, suite, limit, grid_algorithm).result()
+        results["suites"][suite] = {"summary": summarize(records, peak_rss), "records": records}
+    return results
+
+
+#--- comparacao com a linha de base -----------------------------------------
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Lista de regressoes (texto) em relacao a baseline: custo errado, nos/s
+    abaixo de (1 - threshold) da baseline ou latencia p50/p90 acima de
+    (1 + threshold). O total de expansoes tambem nao pode crescer mais que
+    threshold: as buscas sao deterministicas, entao isso eh mudanca de algoritmo.
+    Suites ausentes de um dos lados sao ignoradas.
+    """
+    problems = []
+    for suite, data in results["suites"].items():
+        current = data["summary"]
+        if current["wrong_cost"]:
+            problems.append(f"{suite}: {current['wrong_cost']} instancias com custo diferente do otimo")
+        base_suite = baseline.get("suites", {}).get(suite)
+        if base_suite is None:
+            continue
+        base = base_suite["summary"]
+        if current["instances"] != base["instances"]:
+            problems.append(f"{suite}: {current['instances']} instancias contra {base['instances']} na baseline")
+            continue
+        if current["expansions"] > base["expansions"] * (1 + threshold):
+            problems.append(f"{suite}: expansoes {current['expansions']} contra {base['expansions']} na baseline")
+        if current["nodes_per_s"] < base["nodes_per_s"] * (1 - threshold):
+            problems.append(f"{suite}: nos/s {current['nodes_per_s']:.0f} contra {base['nodes_per_s']:.0f}")
+        for key in ("latency_p50_ms", "latency_p90_ms"):
+            if current[key] > base[key] * (1 + threshold):
+                problems.append(f"{suite}: {key} {current[key]:.3f} contra {base[key]:.3f}")
+    return problems
+
+
+def write_csv(results, path):
+    """Um registro por instancia: suite, instancia, custo esperado e obtido, expansoes, tempo"""
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["suite", "instance", "expected", "cost", "expansions", "time"])
+        for suite, data in results["suites"].items():
+            for record in data["records"]:
+                writer.writerow([suite, record["instance"], record["expected"], record["cost"],
+                                 record["expansions"], record["time"]])
+
+
+#--- geracao dos conjuntos fixos --------------------------------------------
+
+def generate_puzzle8(rng):
+    """Instancias do 8-puzzle com profundidade exata (tabela de distancias), PUZZLE8_PER_DEPTH por profundidade"""
+    puzzle = _puzzle()(3)
+    codec = puzzle.codificador
+    table = puzzle.tabela_distancias(puzzle.matriz_destino)
+    found = {depth: [] for depth in PUZZLE8_DEPTHS}
+    seen = set()
+    while any(len(boards) < PUZZLE8_PER_DEPTH for boards in found.values()):
+        #passeio aleatorio curto para as profundidades rasas; tabuleiro uniforme para as demais
+        walk = rng.integers(1, 40)
+        if walk < 20:
+            code = codec.empacotar(puzzle.matriz_destino)
+            blank = codec.posicao_vazio(code)
+            for _ in range(walk):
+                moves = codec.movimentos[blank]
+                target = moves[rng.integers(len(moves))]
+                code, _ = codec.mover(code, blank, target)
+                blank = target
+        else:
+            code = codec.empacotar(puzzle.gerar_instancia(rng))
+        depth = table.distancia(code)
+        if depth in found and len(found[depth]) < PUZZLE8_PER_DEPTH and code not in seen:
+            seen.add(code)
+            found[depth].append(codec.desempacotar(code).ravel())
+
+    path = os.path.join(INSTANCE_DIR, "puzzle8_profundidade.txt")
+    with open(path, "w") as file:
+        file.write(f"# 8-puzzle por profundidade otima (gerado por benchmark.py --generate, semente {SEED})\n")
+        file.write("# profundidade e as pecas linha a linha; destino 1 2 3 / 4 5 6 / 7 8 0\n")
+        for depth in PUZZLE8_DEPTHS:
+            for board in found[depth]:
+                file.write(f"{depth} " + " ".join(str(int(tile)) for tile in board) + "\n")
+
+
+def _grid_layout(kind, rows, cols, rng):
+    """Grade 1 = livre: obstaculos aleatorios ou salas com portas"""
+    if kind.startswith("random"):
+        return (rng.random((rows, cols)) >= 0.25).astype(np.uint8)
+    grid = np.ones((rows, cols), dtype=np.uint8)
+    room = 16
+    for wall in range(room - 1, rows, room):
+        grid[wall, :] = 0
+        for start in range(0, cols, room):
+            grid[wall, start + rng.integers(0, room - 1)] = 1
+    for wall in range(room - 1, cols, room):
+        grid[:, wall] = 0
+        for start in range(0, rows, room):
+            grid[start + rng.integers(0, room - 1), wall] = 1
+    return grid
+
+
+def generate_grids(rng):
+    """Mapas .map e cenarios .scen no formato do MovingAI, com o custo otimo de cada cenario"""
+    from distance_field import DistanceField
+    from grid_engine import GridEngine
+
+    os.makedirs(MAP_DIR, exist_ok=True)
+    for name, rows, cols in GRID_MAPS:
+        grid = _grid_layout(name, rows, cols, rng)
+        map_name = f"{name}.map"
+        with open(os.path.join(MAP_DIR, map_name), "w") as file:
+            file.write(f"type octile\nheight {rows}\nwidth {cols}\nmap\n")
+            for row in grid:
+                file.write("".join("." if cell else "@" for cell in row) + "\n")
+
+        engine = GridEngine(grid)
+        free = np.argwhere(grid)
+        scenarios = []
+        while len(scenarios) < SCENARIOS_PER_MAP:
+            src = tuple(int(v) for v in free[rng.integers(len(free))])
+            field = DistanceField(engine, src)  #distancias simetricas: de src para todos
+            reachable = np.argwhere(np.isfinite(field.distances) & (field.distances > 0))
+            if len(reachable) < 100:
+                continue  #origem isolada
+            dest = tuple(int(v) for v in reachable[rng.integers(len(reachable))])
+            scenarios.append((src, dest, field.distance(dest)))
+        scenarios.sort(key=lambda scenario: scenario[2])
+        with open(os.path.join(MAP_DIR, f"{name}.map.scen"), "w") as file:
+            file.write("version 1\n")
+            for (sr, sc), (dr, dc), cost in scenarios:
+                #colunas do MovingAI: bucket mapa largura altura x0 y0 x1 y1 otimo (x = coluna)
+                file.write(f"{int(cost // 4)}\t{map_name}\t{cols}\t{rows}\t{sc}\t{sr}\t{dc}\t{dr}\t{cost:.8f}\n")
+
+
+def generate():
+    """Regera os conjuntos fixos (exceto as instancias de Korf, que vem da literatura)"""
+    rng = np.random.default_rng(SEED)
+    os.makedirs(INSTANCE_DIR, exist_ok=True)
+    generate_puzzle8(rng)
+    generate_grids(rng)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks reprodutiveis das buscas (puzzle e grade)")
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=["puzzle8", "grid"],
+                        help="suites a rodar (korf, so as instancias 1 a 5 do artigo, fica de fora por padrao: "
+                             "minutos por instancia)")
+    parser.add_argument("--limit", type=int, help="so as primeiras N instancias de cada suite (ou mapa)")
+    parser.add_argument("--grid-algorithm", default="astar", choices=("astar", "jps"))
+    parser.add_argument("--output", help="arquivo JSON dos resultados")
+    parser.add_argument("--csv", help="arquivo CSV com um registro por instancia")
+    parser.add_argument("--baseline", help="JSON de uma execucao anterior para comparar")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="piora relativa aceita (0.10 = 10%%)")
+    parser.add_argument("--save-baseline", help="grava os resultados tambem como baseline neste arquivo")
+    parser.add_argument("--generate", action="store_true", help="regera as instancias e mapas fixos e sai")
+    args = parser.parse_args()
+
+    if args.generate:
+        generate()
+        print(f"Instancias gravadas em {INSTANCE_DIR} e {MAP_DIR}")
+        return 0
+
+    results = run(args.suites, args.limit, args.grid_algorithm)
+    for suite, data in results["suites"].items():
+        summary = data["summary"]
+        print(f"{suite}: {summary['instances']} instancias, {summary['nodes_per_s']:.0f} nos/s, "
+              f"p50 {summary['latency_p50_ms']:.2f} ms, p90 {summary['latency_p90_ms']:.2f} ms, "
+              f"p99 {summary['latency_p99_ms']:.2f} ms, pico RSS {summary['peak_rss_kb'] / 1024:.1f} MiB, "
+              f"custos errados: {summary['wrong_cost']}")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as file:
+                json.dump(results, file, indent=2)
+    if args.csv:
+        write_csv(results, args.csv)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    problems = compare(results, baseline, args.threshold)
+    for problem in problems:
+        print(f"REGRESSAO: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
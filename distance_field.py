@@ -0,0 +1,152 @@
+import heapq
+from array import array
+
+import numpy as np
+
+INF = float("inf")
+
+METHODS = ("dijkstra", "wavefront")
+
+
+class DistanceField:
+    """
+    Campo de distancias exatas de todas as celulas ate um destino, com o
+    mesmo modelo de custo do GridEngine (octil, com ou sem cortar quinas).
+
+    Calculado uma vez, serve para qualquer numero de agentes indo ao mesmo
+    destino: o caminho de cada um eh so uma descida gulosa pelo campo. O
+    campo tambem eh uma heuristica exata para o A* do motor ate esse destino
+    (engine.search(src, dest, heuristic=campo.heuristic())).
+
+    distances eh um array NumPy (linhas, colunas) com inf nas celulas
+    bloqueadas ou sem caminho; eh uma visao do array plano com borda usado
+    nas consultas. Se a grade mudar, o campo eh recalculado no proximo uso.
+    """
+    def __init__(self, engine, dest, method="dijkstra"):
+        if method not in METHODS:
+            raise ValueError(f"Metodo desconhecido: {method}")
+        engine._check_endpoints(dest, dest)
+        self.engine = engine
+        self.dest = (int(dest[0]), int(dest[1]))
+        self.goal = engine.index(*dest)
+        self.method = method
+        self.compute()
+
+    def compute(self):
+        """(Re)calcula o campo para a grade atual"""
+        engine = self.engine
+        if self.method == "dijkstra":
+            flat = self._dijkstra()
+        else:
+            flat = self._wavefront()
+        self.flat = flat
+        self.distances = flat.reshape(engine.padded.shape)[1:-1, 1:-1]
+        self.version = engine.version
+
+    def _ensure_current(self):
+        if self.version != self.engine.version:
+            self.compute()
+
+    def _dijkstra(self):
+        """Dijkstra a partir do destino sobre o array plano com borda (o grafo eh nao direcionado)"""
+        engine = self.engine
+        free = engine.free
+        moves = engine.moves
+        dist = array("d", [INF]) * engine.padded.size
+        dist[self.goal] = 0.0
+        open_list = [(0.0, self.goal)]
+        while open_list:
+            d_idx, idx = heapq.heappop(open_list)
+            if d_idx > dist[idx]:
+                continue  #entrada antiga
+            for offset, cost, side_a, side_b in moves:
+                nb = idx + offset
+                if not free[nb]:
+                    continue
+                if side_a and not (free[idx + side_a] and free[idx + side_b]):
+                    continue
+                d_new = d_idx + cost
+                if d_new < dist[nb]:
+                    dist[nb] = d_new
+                    heapq.heappush(open_list, (d_new, nb))
+        return np.frombuffer(dist, dtype=np.float64)
+
+    def _wavefront(self):
+        """
+        Relaxacao vetorizada (Bellman-Ford em NumPy): a cada rodada cada celula
+        olha os 8 vizinhos deslocando o campo inteiro, ate nada mudar.
+        Numero de rodadas ~ comprimento do maior caminho em celulas.
+        """
+        engine = self.engine
+        padded = engine.padded.astype(bool)
+        height, width = padded.shape
+        inner = (slice(1, height - 1), slice(1, width - 1))
+
+        def shifted(grid, dr, dc):
+            return grid[1 + dr:height - 1 + dr, 1 + dc:width - 1 + dc]
+
+        #para cada movimento: custo do passo por celula interna (inf onde o passo nao pode ser feito)
+        steps = []
+        for offset, cost, side_a, side_b in engine.moves:
+            dr, dc = divmod(offset, width)
+            if dc > 1:  #divmod de deslocamento negativo na coluna
+                dr, dc = dr + 1, dc - width
+            allowed = padded[inner] & shifted(padded, dr, dc)
+            if side_a:
+                allowed &= shifted(padded, dr, 0) & shifted(padded, 0, dc)
+            steps.append((dr, dc, np.where(allowed, cost, INF)))
+
+        dist = np.full((height, width), INF)
+        dist[divmod(self.goal, width)] = 0.0
+        inner_dist = dist[inner]
+        while True:
+            best = inner_dist.copy()
+            for dr, dc, step_cost in steps:
+                np.minimum(best, shifted(dist, dr, dc) + step_cost, out=best)
+            if np.array_equal(best, inner_dist):
+                break
+            inner_dist[...] = best
+        return dist.reshape(-1)
+
+    def distance(self, cell):
+        """Distancia exata de cell ate o destino (inf se nao houver caminho)"""
+        self._ensure_current()
+        return float(self.flat[self.engine.index(*cell)])
+
+    def descend(self, src):
+        """Caminho de src ate o destino descendo o campo (lista de celulas) ou None"""
+        self._ensure_current()
+        engine = self.engine
+        engine._check_endpoints(src, self.dest)
+        free = engine.free
+        flat = self.flat
+        idx = engine.index(*src)
+        if flat[idx] == INF:
+            return None
+
+        path = [engine.cell(idx)]
+        while idx != self.goal:
+            best = INF
+            best_nb = -1
+            for offset, cost, side_a, side_b in engine.moves:
+                nb = idx + offset
+                if not free[nb]:
+                    continue
+                if side_a and not (free[idx + side_a] and free[idx + side_b]):
+                    continue
+                if cost + flat[nb] < best:
+                    best = cost + flat[nb]
+                    best_nb = nb
+            idx = best_nb
+            path.append(engine.cell(idx))
+        return path
+
+    def paths(self, sources):
+        """Um caminho (ou None) por origem, todos com o mesmo campo"""
+        return [self.descend(src) for src in sources]
+
+    def heuristic(self):
+        """h(idx) exata ate self.dest, para engine.search(..., heuristic=...) com esse destino"""
+        self._ensure_current()
+        values = self.flat.tolist()  #lista do Python: leitura mais rapida que indexar o array
+        return values.__getitem__
@@ -0,0 +1,191 @@
+import heapq
+from array import array
+
+INF = float("inf")
+
+#tolerancia na comparacao de chaves: somas de sqrt(2) em ordens diferentes
+#diferem nos ultimos bits, entao empates em k1 nao sao confiaveis
+EPS = 1e-9
+
+
+class DStarLite:
+    """
+    Planejador incremental D* Lite (Koenig & Likhachev, versao otimizada)
+    sobre um GridEngine, com o mesmo modelo de custo do A* do motor.
+
+    A busca roda do destino para a origem e guarda g/rhs entre as chamadas.
+    Quando celulas mudam (update_cells ou qualquer engine.set_cells), so os
+    vertices cujas arestas mudaram sao reavaliados e o proximo plan() repara
+    apenas a parte afetada. A origem pode andar com move_start sem refazer a
+    busca (o deslocamento km mantem as chaves antigas validas).
+    """
+    def __init__(self, engine, src, dest, heuristic="octile"):
+        engine._check_endpoints(src, dest)
+        self.engine = engine
+        self.heuristic_kind = heuristic
+        self.start = engine.index(*src)
+        self.goal = engine.index(*dest)
+        self.km = 0.0
+        self.h = engine.heuristic(self.start, heuristic)  #distancia estimada ate a origem
+
+        size = engine.padded.size
+        self.g = array("d", [INF]) * size
+        self.rhs = array("d", [INF]) * size
+        #fila com remocao preguicosa: queued guarda a chave valida de cada vertice
+        self.open_list = []
+        self.queued = {}
+
+        #estatisticas do ultimo plan()
+        self.expanded = 0
+
+        self.rhs[self.goal] = 0.0
+        self._push(self.goal)
+        engine.add_listener(self._on_change)
+
+    def close(self):
+        """Para de acompanhar as mudancas da grade"""
+        self.engine.remove_listener(self._on_change)
+
+    def _edges(self, u):
+        """(vizinho, custo) das arestas de u; celula bloqueada nao tem arestas"""
+        free = self.engine.free
+        if not free[u]:
+            return
+        for offset, cost, side_a, side_b in self.engine.moves:
+            v = u + offset
+            if not free[v]:
+                continue
+            if side_a and not (free[u + side_a] and free[u + side_b]):
+                continue
+            yield v, cost
+
+    def _key(self, u):
+        best = min(self.g[u], self.rhs[u])
+        return (best + self.h(u) + self.km, best)
+
+    def _push(self, u):
+        key = self._key(u)
+        self.queued[u] = key
+        heapq.heappush(self.open_list, (key[0], key[1], u))
+
+    def _top(self):
+        """Menor entrada valida da fila (descarta as antigas); None se vazia"""
+        open_list = self.open_list
+        while open_list:
+            k1, k2, u = open_list[0]
+            if self.queued.get(u) == (k1, k2):
+                return (k1, k2), u
+            heapq.heappop(open_list)
+        return None
+
+    def _update_vertex(self, u):
+        if self.g[u] != self.rhs[u]:
+            self._push(u)
+        else:
+            self.queued.pop(u, None)
+
+    def _recompute_rhs(self, u):
+        if u == self.goal:
+            return
+        g = self.g
+        best = INF
+        for v, cost in self._edges(u):
+            if cost + g[v] < best:
+                best = cost + g[v]
+        self.rhs[u] = best
+
+    def compute_shortest_path(self):
+        g = self.g
+        rhs = self.rhs
+        start = self.start
+        expanded = 0
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            key_old, u = top
+            #so para quando todas as chaves da fila forem claramente maiores que a da
+            #origem (empates em k1 sao todos processados) e a origem estiver consistente
+            if key_old[0] > self._key(start)[0] + EPS and rhs[start] == g[start]:
+                break
+            key_new = self._key(u)
+            if key_old < key_new:
+                self._push(u)  #chave ficou velha depois de um km maior
+                continue
+            heapq.heappop(self.open_list)
+            del self.queued[u]
+            expanded += 1
+            if g[u] > rhs[u]:
+                #sobreconsistente: fixa g e relaxa os predecessores
+                g[u] = rhs[u]
+                for v, cost in self._edges(u):
+                    if v != self.goal and cost + g[u] < rhs[v]:
+                        rhs[v] = cost + g[u]
+                        self._update_vertex(v)
+            else:
+                #subconsistente: invalida u e quem dependia dele
+                g_old = g[u]
+                g[u] = INF
+                for v, cost in list(self._edges(u)) + [(u, None)]:
+                    if v == u or rhs[v] == cost + g_old:
+                        self._recompute_rhs(v)
+                    self._update_vertex(v)
+        self.expanded = expanded
+
+    def plan(self):
+        """Repara a busca e retorna o caminho atual (lista de celulas) ou None"""
+        self.compute_shortest_path()
+        return self.path()
+
+    def path(self):
+        """Caminho da origem ao destino descendo g (sem buscar de novo)"""
+        engine = self.engine
+        g = self.g
+        u = self.start
+        if self.rhs[u] == INF:
+            return None
+        path = [engine.cell(u)]
+        visited = {u}
+        while u != self.goal:
+            best = INF
+            best_v = -1
+            for v, cost in self._edges(u):
+                if cost + g[v] < best:
+                    best = cost + g[v]
+                    best_v = v
+            if best_v < 0 or best_v in visited:
+                return None  #g ainda nao reparado (plan() nao chamado depois de mudar a grade)
+            u = best_v
+            visited.add(u)
+            path.append(engine.cell(u))
+        return path
+
+    def cost(self):
+        """Custo do caminho atual (inf se nao houver)"""
+        return self.rhs[self.start]
+
+    def move_start(self, cell):
+        """O agente andou: a nova origem passa a ser cell"""
+        start = self.engine.index(*cell)
+        #chaves ja na fila continuam limites inferiores se km somar o quanto a origem andou
+        self.km += self.h(start)
+        self.start = start
+        self.h = self.engine.heuristic(start, self.heuristic_kind)
+
+    def update_cells(self, changes):
+        """Aplica um lote de mudancas (linha, coluna, valor) na grade; o reparo vem no proximo plan()"""
+        self.engine.set_cells(changes)
+
+    def _on_change(self, changes):
+        engine = self.engine
+        #uma celula mexe nas arestas dela e nas diagonais que passam por ela:
+        #todas tem ponta na propria celula ou num dos 8 vizinhos
+        touched = set()
+        for row, col, _ in changes:
+            idx = engine.index(row, col)
+            touched.add(idx)
+            for offset, _, _, _ in engine.moves:
+                touched.add(idx + offset)
+        for u in touched:
+            self._recompute_rhs(u)
+            self._update_vertex(u)
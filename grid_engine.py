@@ -0,0 +1,599 @@
+import heapq
+import math
+from array import array
+from time import perf_counter
+
+import numpy as np
+
+from hpa_star import HierarchicalPathfinder
+from landmarks import Landmarks
+
+#deslocamentos (linha, coluna) das 8 direcoes: primeiro as 4 retas, depois as 4 diagonais
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+HEURISTICS = ("octile", "euclidean", "none", "landmarks")
+
+ALGORITHMS = ("astar", "jps", "hpa")
+
+
+class SearchResult:
+    """
+    Resultado de uma consulta: caminho como array int32 (k, 2) de
+    (linha, coluna) ou None, custo (inf sem caminho), expansoes, insercoes
+    na lista aberta e tempo em segundos. profile eh o SearchObserver da
+    consulta, quando houver.
+    """
+    def __init__(self, path, cost, expansions, pushes, time, profile=None):
+        self.path = None if path is None else np.array(path, dtype=np.int32).reshape(-1, 2)
+        self.cost = cost
+        self.expansions = expansions
+        self.pushes = pushes
+        self.time = time
+        self.profile = profile
+
+    @property
+    def found(self):
+        return self.path is not None
+
+    def to_dict(self):
+        data = {
+            "path": None if self.path is None else self.path.tolist(),
+            "cost": self.cost,
+            "expansions": self.expansions,
+            "pushes": self.pushes,
+            "time": self.time,
+        }
+        if self.profile is not None:
+            data["profile"] = self.profile.to_dict()
+        return data
+
+    def __str__(self):
+        length = 0 if self.path is None else len(self.path)
+        text = (f"Custo: {self.cost:.4f}, Celulas: {length}, Expansoes: {self.expansions}, "
+                f"Insercoes: {self.pushes}, Tempo: {self.time:.6f} s")
+        if self.profile is not None:
+            text += f"\n{self.profile}"
+        return text
+
+
+class GridEngine:
+    """
+    Motor de busca A* reutilizavel para grades de qualquer tamanho
+    (1 = livre, 0 = bloqueado, como em aEstrala.py).
+
+    A grade fica num array plano com uma borda de celulas bloqueadas, entao
+    um vizinho eh so idx + deslocamento, sem testar limites. g, pai e o
+    estado de cada celula ficam em arrays planos alocados uma vez; uma
+    consulta nova nao limpa nada, so incrementa o contador de geracao
+    (o carimbo de uma celula so vale se for da geracao atual).
+    """
+    def __init__(self, grid, diagonal_cost=math.sqrt(2), corner_cutting=False):
+        grid = np.asarray(grid)
+        self.rows, self.cols = grid.shape
+        padded = np.zeros((self.rows + 2, self.cols + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = grid != 0
+        self._setup(padded, diagonal_cost, corner_cutting)
+
+    @classmethod
+    def from_padded(cls, padded, diagonal_cost=math.sqrt(2), corner_cutting=False):
+        """
+        Motor direto sobre uma grade uint8 que ja tem a borda bloqueada
+        (ex.: um np.memmap de map_io), sem copiar as celulas.
+        """
+        if padded.dtype != np.uint8 or padded.ndim != 2:
+            raise ValueError("A grade com borda deve ser um array uint8 2D")
+        if padded[0].any() or padded[-1].any() or padded[:, 0].any() or padded[:, -1].any():
+            raise ValueError("A borda da grade deve estar bloqueada")
+        engine = cls.__new__(cls)
+        engine.rows = padded.shape[0] - 2
+        engine.cols = padded.shape[1] - 2
+        engine._setup(padded, diagonal_cost, corner_cutting)
+        return engine
+
+    def _setup(self, padded, diagonal_cost, corner_cutting):
+        self.padded = padded
+        self.width = padded.shape[1]
+        self.free = memoryview(padded.reshape(-1))  #leitura celula a celula sem copia
+        self.diagonal_cost = diagonal_cost
+        self.corner_cutting = corner_cutting
+
+        #(deslocamento, custo, e para diagonais os dois vizinhos retos que nao podem estar bloqueados)
+        self.moves = []
+        for dr, dc in DIRECTIONS:
+            offset = dr * self.width + dc
+            if dr and dc:
+                side_a, side_b = (0, 0) if corner_cutting else (dr * self.width, dc)
+                self.moves.append((offset, diagonal_cost, side_a, side_b))
+            else:
+                self.moves.append((offset, 1.0, 0, 0))
+
+        #g, pai e carimbo (2*geracao = aberta nesta consulta, 2*geracao+1 = fechada)
+        #so sao alocados na primeira consulta: abrir um mapa grande nao paga por eles
+        self.g = None
+        self.parent = None
+        self.stamp = None
+        self.generation = 0
+
+        #estatisticas da ultima consulta
+        self.expanded = 0
+        self.pushes = 0
+
+        #muda a cada alteracao da grade; quem guarda dados derivados dela se inscreve em listeners
+        self.version = 0
+        self.listeners = []
+        #grafos abstratos do HPA* ja montados, por tamanho de cluster
+        self.hierarchies = {}
+        #tabela ALT em uso (refeita se a grade mudar)
+        self.landmark_table = None
+
+    #conversao entre (linha, coluna) da grade original e indice plano na grade com borda
+    def index(self, row, col):
+        return (int(row) + 1) * self.width + (int(col) + 1)
+
+    def cell(self, idx):
+        row, col = divmod(idx, self.width)
+        return (row - 1, col - 1)
+
+    def is_valid(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def is_unblocked(self, row, col):
+        return self.free[self.index(row, col)] != 0
+
+    def set_cells(self, changes):
+        """
+        Altera celulas da grade: changes eh um iteravel de (linha, coluna, valor),
+        com valor 1 = livre e 0 = bloqueado. Incrementa version e avisa cada
+        ouvinte com a lista de mudancas aplicadas.
+        """
+        changes = [(int(row), int(col), 1 if value else 0) for row, col, value in changes]
+        for row, col, value in changes:
+            if not self.is_valid(row, col):
+                raise ValueError(f"Celula fora da grade: {(row, col)}")
+            self.free[self.index(row, col)] = value
+        self.version += 1
+        for listener in self.listeners:
+            listener(changes)
+
+    def add_listener(self, callback):
+        """callback(changes) sera chamado depois de cada set_cells"""
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def hierarchy(self, cluster_size=16):
+        """HPA* desta grade, montado na primeira chamada e mantido atualizado pelas mudancas"""
+        if cluster_size not in self.hierarchies:
+            self.hierarchies[cluster_size] = HierarchicalPathfinder(self, cluster_size)
+        return self.hierarchies[cluster_size]
+
+    def landmarks(self, k=8):
+        """Tabela de landmarks (ALT) desta grade, do cache em disco ou gerada na hora"""
+        table = self.landmark_table
+        if table is None or table.k != k or table.version != self.version:
+            self.landmark_table = Landmarks.get(self, k)
+        return self.landmark_table
+
+    def _next_generation(self):
+        if self.stamp is None:
+            size = self.padded.size
+            self.g = array("d", [0.0]) * size
+            self.parent = array("i", [0]) * size
+            self.stamp = array("I", [0]) * size
+        self.generation += 1
+        if 2 * self.generation + 1 >= 1 << 32:
+            #raro: o contador estourou, entao limpa os carimbos uma vez
+            self.stamp = array("I", [0]) * len(self.stamp)
+            self.generation = 1
+        return self.generation
+
+    def heuristic(self, dest_idx, kind="octile"):
+        """
+        Funcao h(idx) ate o destino. "octile" eh a distancia exata numa grade
+        sem obstaculos com o custo diagonal configurado (com custo 1 vira a
+        distancia de Chebyshev); "euclidean" so eh admissivel com custo diagonal >= sqrt(2).
+        "landmarks" usa a tabela ALT de landmarks() (admissivel com qualquer custo).
+        Uma funcao de idx tambem eh aceita e usada como esta.
+        """
+        if callable(kind):
+            #heuristica pronta, ex.: DistanceField.heuristic() para o mesmo destino
+            return kind
+        width = self.width
+        dest_row, dest_col = divmod(dest_idx, width)
+        if kind == "octile":
+            extra = self.diagonal_cost - 2
+            def h(idx):
+                row, col = divmod(idx, width)
+                dr = abs(row - dest_row)
+                dc = abs(col - dest_col)
+                return dr + dc + extra * (dr if dr < dc else dc)
+        elif kind == "euclidean":
+            def h(idx):
+                row, col = divmod(idx, width)
+                return ((row - dest_row) ** 2 + (col - dest_col) ** 2) ** 0.5
+        elif kind == "landmarks":
+            h = self.landmarks().heuristic(dest_idx)
+        elif kind == "none":
+            def h(idx):
+                return 0.0
+        else:
+            raise ValueError(f"Heuristica desconhecida: {kind}")
+        return h
+
+    def _check_endpoints(self, src, dest):
+        for row, col in (src, dest):
+            if not self.is_valid(row, col):
+                raise ValueError(f"Celula fora da grade: {(row, col)}")
+            if not self.is_unblocked(row, col):
+                raise ValueError(f"Celula bloqueada: {(row, col)}")
+
+    def trace_path(self, dest_idx):
+        """Lista de (linha, coluna) da origem ate dest_idx seguindo os pais"""
+        path = []
+        idx = dest_idx
+        parent = self.parent
+        while parent[idx] != idx:
+            path.append(self.cell(idx))
+            idx = parent[idx]
+        path.append(self.cell(idx))
+        path.reverse()
+        return path
+
+    def _generated(self, open_mark):
+        """Celulas com carimbo da geracao atual (abertas ou fechadas), para o observer"""
+        return int(np.count_nonzero(np.frombuffer(self.stamp, dtype=np.uint32) >= open_mark))
+
+    def search(self, src, dest, heuristic="octile", algorithm="astar", observer=None):
+        """
+        Busca de src ate dest (pares (linha, coluna)) com o algoritmo escolhido:
+        "astar" (A* comum), "jps" (Jump Point Search) ou "hpa" (HPA*, quase
+        otimo, com o grafo abstrato de hierarchy()).
+        Retorna a lista de celulas do caminho, ou None se nao houver caminho;
+        expanded e pushes ficam com as estatisticas da consulta.
+        observer: SearchObserver opcional (search_observer.py).
+        """
+        if algorithm == "jps":
+            return self.jump_point_search(src, dest, heuristic, observer)
+        if algorithm == "hpa":
+            hierarchy = self.hierarchy()
+            if observer is not None:
+                observer.start(self.width)
+            path = hierarchy.search(src, dest, heuristic)
+            self.expanded = hierarchy.expanded
+            self.pushes = hierarchy.pushes
+            if observer is not None:
+                observer.finish(self.expanded, self.pushes)
+            return path
+        if algorithm != "astar":
+            raise ValueError(f"Algoritmo desconhecido: {algorithm}")
+        self._check_endpoints(src, dest)
+        start = self.index(*src)
+        goal = self.index(*dest)
+        h = self.heuristic(goal, heuristic)
+
+        gen = self._next_generation()
+        open_mark = 2 * gen
+        closed_mark = open_mark + 1
+        free = self.free
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+        moves = self.moves
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        if observer is not None:
+            #versoes cronometradas so com observer: sem ele o laco eh o mesmo de sempre
+            h = observer.timed(h, "heuristic")
+            heappush = observer.timed(heappush, "queue")
+            heappop = observer.timed(heappop, "queue")
+            observer.start(self.width)
+
+        g[start] = 0.0
+        parent[start] = start
+        stamp[start] = open_mark
+        h_start = h(start)
+        open_list = [(h_start, h_start, start)]
+        expanded = 0
+        pushes = 1
+        found = False
+
+        while open_list:
+            _, _, idx = heappop(open_list)
+            if stamp[idx] == closed_mark:
+                continue  #entrada antiga na lista aberta
+            stamp[idx] = closed_mark
+            expanded += 1
+            if observer is not None:
+                observer.expanded(idx, g[idx], len(open_list))
+            if idx == goal:
+                found = True
+                break
+
+            g_idx = g[idx]
+            for offset, cost, side_a, side_b in moves:
+                nb = idx + offset
+                if not free[nb] or stamp[nb] == closed_mark:
+                    continue
+                if side_a and not (free[idx + side_a] and free[idx + side_b]):
+                    continue  #diagonal cortando quina bloqueada
+                g_new = g_idx + cost
+                if stamp[nb] == open_mark and g_new >= g[nb]:
+                    continue
+                stamp[nb] = open_mark
+                g[nb] = g_new
+                parent[nb] = idx
+                h_new = h(nb)
+                heappush(open_list, (g_new + h_new, h_new, nb))
+                pushes += 1
+
+        self.expanded = expanded
+        self.pushes = pushes
+        if observer is not None:
+            observer.finish(expanded, pushes, len(open_list), self._generated(open_mark))
+        return self.trace_path(goal) if found else None
+
+    def query(self, src, dest, heuristic="octile", algorithm="astar", observer=None):
+        """Como search, mas sempre retorna um SearchResult (sem nada no stdout)"""
+        start = perf_counter()
+        path = self.search(src, dest, heuristic, algorithm, observer)
+        elapsed = perf_counter() - start
+        cost = math.inf if path is None else self.path_cost(path)
+        return SearchResult(path, cost, self.expanded, self.pushes, elapsed, observer)
+
+    def distances_within(self, start, bounds, targets):
+        """
+        Dijkstra a partir do indice start sem sair do retangulo
+        bounds = (linha0, coluna0, linha1, coluna1) da grade original (fim exclusivo).
+        Para assim que todos os targets (indices) forem fechados e retorna
+        {alvo: custo} dos alcancados; os caminhos podem ser lidos com
+        trace_path ate a proxima consulta.
+        """
+        row_min, col_min, row_max, col_max = bounds
+        width = self.width
+        #em coordenadas da grade com borda; as linhas viram um intervalo de indices
+        idx_min = (row_min + 1) * width
+        idx_max = (row_max + 1) * width
+        col_min += 1
+        col_max += 1
+
+        gen = self._next_generation()
+        open_mark = 2 * gen
+        closed_mark = open_mark + 1
+        free = self.free
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+
+        g[start] = 0.0
+        parent[start] = start
+        stamp[start] = open_mark
+        open_list = [(0.0, start)]
+        remaining = set(targets)
+        found = {}
+
+        while open_list and remaining:
+            g_idx, idx = heapq.heappop(open_list)
+            if stamp[idx] == closed_mark:
+                continue
+            stamp[idx] = closed_mark
+            if idx in remaining:
+                remaining.discard(idx)
+                found[idx] = g_idx
+
+            for offset, cost, side_a, side_b in self.moves:
+                nb = idx + offset
+                if not free[nb] or stamp[nb] == closed_mark:
+                    continue
+                if side_a and not (free[idx + side_a] and free[idx + side_b]):
+                    continue
+                if not (idx_min <= nb < idx_max and col_min <= nb % width < col_max):
+                    continue
+                g_new = g_idx + cost
+                if stamp[nb] == open_mark and g_new >= g[nb]:
+                    continue
+                stamp[nb] = open_mark
+                g[nb] = g_new
+                parent[nb] = idx
+                heapq.heappush(open_list, (g_new, nb))
+
+        return found
+
+    #--- Jump Point Search ---------------------------------------------------
+
+    def _jump_straight(self, idx, offset, side, goal):
+        """
+        Anda em linha reta (offset) a partir de idx ate achar um ponto de salto:
+        o destino ou uma celula com vizinho forcado (livre ao lado, com a celula
+        de tras desse lado bloqueada). Retorna -1 se bater num bloqueio.
+        """
+        free = self.free
+        while True:
+            if not free[idx]:
+                return -1
+            if idx == goal:
+                return idx
+            if ((free[idx + side] and not free[idx + side - offset]) or
+                    (free[idx - side] and not free[idx - side - offset])):
+                return idx
+            idx += offset
+
+    def _jump(self, idx, dr, dc, goal):
+        """Salto a partir de idx na direcao (dr, dc); retorna o ponto de salto ou -1"""
+        width = self.width
+        if not (dr and dc):
+            side = 1 if dr else width
+            return self._jump_straight(idx, dr * width + dc, side, goal)
+
+        free = self.free
+        vertical = dr * width
+        offset = vertical + dc
+        while True:
+            if not free[idx]:
+                return -1
+            if idx == goal:
+                return idx
+            #na diagonal, vira ponto de salto se algum salto reto a partir daqui achar algo
+            if (self._jump_straight(idx + dc, dc, width, goal) >= 0 or
+                    self._jump_straight(idx + vertical, vertical, 1, goal) >= 0):
+                return idx
+            #sem cortar quinas: as duas celulas retas precisam estar livres
+            if not (free[idx + dc] and free[idx + vertical]):
+                return -1
+            idx += offset
+
+    def _jps_successors(self, idx, parent_idx):
+        """Direcoes (dr, dc) a explorar a partir de idx, podadas pela direcao de chegada"""
+        free = self.free
+        width = self.width
+        if parent_idx == idx:
+            #origem: todos os vizinhos (diagonais so sem cortar quina)
+            directions = []
+            for dr, dc in DIRECTIONS:
+                if not free[idx + dr * width + dc]:
+                    continue
+                if dr and dc and not (free[idx + dr * width] and free[idx + dc]):
+                    continue
+                directions.append((dr, dc))
+            return directions
+
+        row, col = divmod(idx, width)
+        parent_row, parent_col = divmod(parent_idx, width)
+        dr = (row > parent_row) - (row < parent_row)
+        dc = (col > parent_col) - (col < parent_col)
+        directions = []
+        if dr and dc:
+            vertical_free = free[idx + dr * width]
+            horizontal_free = free[idx + dc]
+            if vertical_free:
+                directions.append((dr, 0))
+            if horizontal_free:
+                directions.append((0, dc))
+            if vertical_free and horizontal_free:
+                directions.append((dr, dc))
+        elif dc:
+            ahead = free[idx + dc]
+            below = free[idx + width]
+            above = free[idx - width]
+            if ahead:
+                directions.append((0, dc))
+                if below:
+                    directions.append((1, dc))
+                if above:
+                    directions.append((-1, dc))
+            if below:
+                directions.append((1, 0))
+            if above:
+                directions.append((-1, 0))
+        else:
+            ahead = free[idx + dr * width]
+            right = free[idx + 1]
+            left = free[idx - 1]
+            if ahead:
+                directions.append((dr, 0))
+                if right:
+                    directions.append((dr, 1))
+                if left:
+                    directions.append((dr, -1))
+            if right:
+                directions.append((0, 1))
+            if left:
+                directions.append((0, -1))
+        return directions
+
+    def jump_point_search(self, src, dest, heuristic="octile", observer=None):
+        """
+        Jump Point Search: A* que so expande pontos de salto, pulando as
+        sequencias de celulas simetricas de areas abertas. Da caminhos de
+        mesmo custo que o A* comum (mesmo modelo de custo) com muito menos
+        expansoes. Exige corner_cutting=False.
+        """
+        if self.corner_cutting:
+            raise ValueError("Jump Point Search exige corner_cutting=False")
+        self._check_endpoints(src, dest)
+        start = self.index(*src)
+        goal = self.index(*dest)
+        h = self.heuristic(goal, heuristic)
+        width = self.width
+        extra = self.diagonal_cost - 2
+
+        gen = self._next_generation()
+        open_mark = 2 * gen
+        closed_mark = open_mark + 1
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        if observer is not None:
+            h = observer.timed(h, "heuristic")
+            heappush = observer.timed(heappush, "queue")
+            heappop = observer.timed(heappop, "queue")
+            observer.start(width)
+
+        g[start] = 0.0
+        parent[start] = start
+        stamp[start] = open_mark
+        h_start = h(start)
+        open_list = [(h_start, h_start, start)]
+        expanded = 0
+        pushes = 1
+        found = False
+
+        while open_list:
+            _, _, idx = heappop(open_list)
+            if stamp[idx] == closed_mark:
+                continue
+            stamp[idx] = closed_mark
+            expanded += 1
+            if observer is not None:
+                observer.expanded(idx, g[idx], len(open_list))
+            if idx == goal:
+                found = True
+                break
+
+            row, col = divmod(idx, width)
+            for dr, dc in self._jps_successors(idx, parent[idx]):
+                jump_point = self._jump(idx + dr * width + dc, dr, dc, goal)
+                if jump_point < 0 or stamp[jump_point] == closed_mark:
+                    continue
+                #pontos de salto estao em linha reta ou diagonal: custo octil exato
+                jump_row, jump_col = divmod(jump_point, width)
+                d_row = abs(jump_row - row)
+                d_col = abs(jump_col - col)
+                g_new = g[idx] + d_row + d_col + extra * (d_row if d_row < d_col else d_col)
+                if stamp[jump_point] == open_mark and g_new >= g[jump_point]:
+                    continue
+                stamp[jump_point] = open_mark
+                g[jump_point] = g_new
+                parent[jump_point] = idx
+                h_new = h(jump_point)
+                heappush(open_list, (g_new + h_new, h_new, jump_point))
+                pushes += 1
+
+        self.expanded = expanded
+        self.pushes = pushes
+        if observer is not None:
+            observer.finish(expanded, pushes, len(open_list), self._generated(open_mark))
+        if not found:
+            return None
+
+        #preenche as celulas entre pontos de salto consecutivos
+        jump_points = self.trace_path(goal)
+        path = [jump_points[0]]
+        for row, col in jump_points[1:]:
+            last_row, last_col = path[-1]
+            dr = (row > last_row) - (row < last_row)
+            dc = (col > last_col) - (col < last_col)
+            while (last_row, last_col) != (row, col):
+                last_row += dr
+                last_col += dc
+                path.append((last_row, last_col))
+        return path
+
+    def path_cost(self, path):
+        """Custo de um caminho dado como lista de celulas"""
+        cost = 0.0
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            cost += self.diagonal_cost if r1 != r2 and c1 != c2 else 1.0
+        return cost
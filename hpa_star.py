@@ -0,0 +1,249 @@
+import heapq
+
+#trechos livres de borda com pelo menos esse tamanho ganham duas entradas, uma em cada ponta
+LONG_ENTRANCE = 6
+
+
+class HierarchicalPathfinder:
+    """
+    HPA*: busca hierarquica sobre um GridEngine.
+
+    A grade eh dividida em clusters de cluster_size x cluster_size. Em cada
+    borda entre dois clusters vizinhos, os trechos livres dos dois lados
+    viram entradas (um no abstrato de cada lado, ligados por custo 1), e
+    dentro de cada cluster as distancias entre seus nos abstratos sao
+    calculadas uma vez por Dijkstra local. Uma consulta so liga origem e
+    destino aos nos do proprio cluster, faz A* no grafo abstrato e refina
+    apenas os trechos usados (refinamentos entre nos fixos ficam guardados).
+
+    Os caminhos sao quase otimos, nao otimos. Quando a grade muda
+    (engine.set_cells), so os clusters tocados e seus vizinhos sao refeitos.
+    """
+    def __init__(self, engine, cluster_size=16):
+        if cluster_size < 2:
+            raise ValueError("cluster_size deve ser pelo menos 2")
+        self.engine = engine
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-engine.rows // cluster_size)
+        self.cluster_cols = -(-engine.cols // cluster_size)
+
+        #(cluster_a, cluster_b) -> lista de pares (idx do lado a, idx do lado b)
+        self.entrances = {}
+        #arestas entre clusters: idx -> {idx do outro lado: custo}
+        self.inter = {}
+        #cluster -> {no: {outro no do cluster: distancia dentro do cluster}}
+        self.intra = {}
+        #(no, no) -> celulas do trecho, refinado sob demanda
+        self.segments = {}
+
+        #estatisticas da ultima consulta / ultima reconstrucao
+        self.expanded = 0
+        self.pushes = 0
+        self.refined = 0
+        self.rebuilt_clusters = 0
+
+        self._rebuild({(cr, cc) for cr in range(self.cluster_rows) for cc in range(self.cluster_cols)})
+        engine.add_listener(self._on_change)
+
+    #--- estrutura dos clusters ----------------------------------------------
+
+    def cluster_of(self, idx):
+        row, col = self.engine.cell(idx)
+        return (row // self.cluster_size, col // self.cluster_size)
+
+    def cluster_bounds(self, cluster):
+        """(linha0, coluna0, linha1, coluna1) do cluster, fim exclusivo"""
+        size = self.cluster_size
+        cr, cc = cluster
+        return (cr * size, cc * size,
+                min((cr + 1) * size, self.engine.rows), min((cc + 1) * size, self.engine.cols))
+
+    def _neighbor_clusters(self, cluster):
+        cr, cc = cluster
+        for dr, dc in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            if 0 <= cr + dr < self.cluster_rows and 0 <= cc + dc < self.cluster_cols:
+                yield (cr + dr, cc + dc)
+
+    def _build_border(self, border):
+        """Refaz as entradas da borda entre dois clusters vizinhos (border = (menor, maior))"""
+        inter = self.inter
+        for a, b in self.entrances.pop(border, ()):
+            for x, y in ((a, b), (b, a)):
+                del inter[x][y]
+                if not inter[x]:
+                    del inter[x]
+
+        engine = self.engine
+        free = engine.free
+        first, second = border
+        row_min, col_min, row_max, col_max = self.cluster_bounds(first)
+        if first[0] == second[0]:
+            #borda vertical: ultima coluna de first contra a primeira de second
+            cells = [(engine.index(row, col_max - 1), engine.index(row, col_max))
+                     for row in range(row_min, row_max)]
+        else:
+            #borda horizontal: ultima linha de first contra a primeira de second
+            cells = [(engine.index(row_max - 1, col), engine.index(row_max, col))
+                     for col in range(col_min, col_max)]
+
+        pairs = []
+        run = []
+        for a, b in cells + [(0, 0)]:  #a borda da grade ((0, 0)) fecha o ultimo trecho
+            if free[a] and free[b]:
+                run.append((a, b))
+                continue
+            if run:
+                if len(run) < LONG_ENTRANCE:
+                    pairs.append(run[len(run) // 2])
+                else:
+                    pairs.append(run[0])
+                    pairs.append(run[-1])
+                run = []
+
+        for a, b in pairs:
+            inter.setdefault(a, {})[b] = 1.0
+            inter.setdefault(b, {})[a] = 1.0
+        self.entrances[border] = pairs
+
+    def _build_cluster(self, cluster):
+        """Nos abstratos do cluster e as distancias entre eles (Dijkstra local)"""
+        nodes = set()
+        for other in self._neighbor_clusters(cluster):
+            border = (min(cluster, other), max(cluster, other))
+            side = 0 if border[0] == cluster else 1
+            for pair in self.entrances[border]:
+                nodes.add(pair[side])
+
+        edges = {node: {} for node in nodes}
+        bounds = self.cluster_bounds(cluster)
+        pending = sorted(nodes)
+        #distancias sao simetricas: cada par sai de um Dijkstra so
+        while pending:
+            node = pending.pop()
+            for other, cost in self.engine.distances_within(node, bounds, pending).items():
+                edges[node][other] = cost
+                edges[other][node] = cost
+        self.intra[cluster] = edges
+
+    def _rebuild(self, dirty):
+        """Recalcula as bordas que tocam os clusters em dirty e os clusters afetados por elas"""
+        affected = set(dirty)
+        borders = set()
+        for cluster in dirty:
+            for other in self._neighbor_clusters(cluster):
+                borders.add((min(cluster, other), max(cluster, other)))
+                affected.add(other)
+        for border in borders:
+            self._build_border(border)
+        for cluster in affected:
+            self._build_cluster(cluster)
+        self.segments = {key: cells for key, cells in self.segments.items()
+                         if self.cluster_of(key[0]) not in affected}
+        self.rebuilt_clusters = len(affected)
+
+    def _on_change(self, changes):
+        size = self.cluster_size
+        self._rebuild({(row // size, col // size) for row, col, _ in changes})
+
+    #--- consulta ------------------------------------------------------------
+
+    def _connect(self, idx, extra=()):
+        """Distancias de idx aos nos do proprio cluster (e a extra, se estiver nele)"""
+        cluster = self.cluster_of(idx)
+        targets = set(self.intra[cluster])
+        targets.update(extra)
+        targets.discard(idx)
+        return self.engine.distances_within(idx, self.cluster_bounds(cluster), targets)
+
+    def _segment(self, a, b):
+        """Celulas de a ate b dentro do cluster comum (sem repetir a)"""
+        key = (a, b)
+        if key in self.segments:
+            return self.segments[key]
+        cluster = self.cluster_of(a)
+        self.engine.distances_within(a, self.cluster_bounds(cluster), (b,))
+        cells = self.engine.trace_path(b)[1:]
+        self.refined += 1
+        nodes = self.intra[cluster]
+        if a in nodes and b in nodes:
+            self.segments[key] = cells
+        return cells
+
+    def abstract_path(self, start, goal, heuristic="octile"):
+        """A* no grafo abstrato com origem e destino ligados temporariamente; lista de indices ou None"""
+        engine = self.engine
+        same_cluster = self.cluster_of(start) == self.cluster_of(goal)
+        start_edges = self._connect(start, (goal,) if same_cluster else ())
+        goal_edges = self._connect(goal)
+        h = engine.heuristic(goal, heuristic)
+
+        g = {start: 0.0}
+        parent = {start: start}
+        closed = set()
+        open_list = [(h(start), start)]
+        expanded = 0
+        pushes = 1
+        found = False
+
+        while open_list:
+            _, node = heapq.heappop(open_list)
+            if node in closed:
+                continue
+            closed.add(node)
+            expanded += 1
+            if node == goal:
+                found = True
+                break
+
+            edges = list(self.intra[self.cluster_of(node)].get(node, {}).items())
+            edges.extend(self.inter.get(node, {}).items())
+            if node == start:
+                edges.extend(start_edges.items())
+            if node in goal_edges:
+                edges.append((goal, goal_edges[node]))
+            for other, cost in edges:
+                if other in closed:
+                    continue
+                g_new = g[node] + cost
+                if g_new < g.get(other, float("inf")):
+                    g[other] = g_new
+                    parent[other] = node
+                    heapq.heappush(open_list, (g_new + h(other), other))
+                    pushes += 1
+
+        self.expanded = expanded
+        self.pushes = pushes
+        if not found:
+            return None
+        nodes = [goal]
+        while nodes[-1] != start:
+            nodes.append(parent[nodes[-1]])
+        nodes.reverse()
+        return nodes
+
+    def search(self, src, dest, heuristic="octile"):
+        """
+        Caminho quase otimo de src ate dest (pares (linha, coluna)) como lista
+        de celulas, ou None se nao houver caminho.
+        """
+        engine = self.engine
+        engine._check_endpoints(src, dest)
+        start = engine.index(*src)
+        goal = engine.index(*dest)
+        self.refined = 0
+        if start == goal:
+            self.expanded = 0
+            self.pushes = 0
+            return [engine.cell(start)]
+
+        nodes = self.abstract_path(start, goal, heuristic)
+        if nodes is None:
+            return None
+
+        path = [engine.cell(start)]
+        for a, b in zip(nodes, nodes[1:]):
+            if self.cluster_of(a) != self.cluster_of(b):
+                path.append(engine.cell(b))  #aresta entre clusters: celulas vizinhas
+            else:
+                path.extend(self._segment(a, b))
+        return path
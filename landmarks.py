@@ -0,0 +1,109 @@
+import hashlib
+import os
+from operator import sub
+
+import numpy as np
+
+from distance_field import DistanceField
+
+#diretorio padrao das tabelas geradas (nao versionado)
+LANDMARK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tabelas")
+
+#as distancias ficam em float32 (metade do espaco de float64); o arredondamento de cada valor
+#eh no maximo valor * 2^-24, entao h desconta (d(L, t) + d(L, v)) * ROUNDING para continuar admissivel
+ROUNDING = 2.0 ** -23
+
+
+def grid_digest(engine):
+    """Resumo da grade e do modelo de custo, usado no nome do arquivo da tabela"""
+    digest = hashlib.sha1(engine.padded.tobytes())
+    digest.update(repr((engine.padded.shape, engine.diagonal_cost, engine.corner_cutting)).encode())
+    return digest.hexdigest()[:16]
+
+
+def default_path(engine, k):
+    """Ex.: tabelas/landmarks_512x512_k8_f32_<resumo>.npy"""
+    return os.path.join(LANDMARK_DIR, f"landmarks_{engine.rows}x{engine.cols}_k{k}_f32_{grid_digest(engine)}.npy")
+
+
+class Landmarks:
+    """
+    Heuristica ALT (A*, landmarks e desigualdade triangular).
+
+    Escolhe k celulas marco espalhadas (cada uma a mais distante dos marcos
+    ja escolhidos) e guarda a distancia exata de cada marco a todas as
+    celulas, numa tabela float32 (celulas da grade com borda, k). Para qualquer
+    destino t, h(v) = max |d(L, t) - d(L, v)| eh admissivel e consistente,
+    e em labirintos fica muito mais perto da distancia real que a octil.
+
+    A tabela eh gravada em disco (.npy) na primeira vez e depois mapeada em
+    memoria somente leitura. Celulas sem caminho ate um marco ficam com 0:
+    so acontece entre componentes desconexas, onde qualquer h eh admissivel.
+    """
+    def __init__(self, engine, table, cells=None):
+        if table.shape[0] != engine.padded.size:
+            raise ValueError("Tabela de landmarks nao corresponde a grade")
+        self.engine = engine
+        self.k = table.shape[1]
+        self.table = table.view(np.ndarray)
+        #leitura por linha sem chamar o NumPy: fatia de memoryview vira lista do Python
+        self.rows = memoryview(np.ascontiguousarray(self.table).reshape(-1))
+        self.cells = cells  #posicoes dos marcos (None quando a tabela veio do disco)
+        self.version = engine.version
+
+    @classmethod
+    def build(cls, engine, k=8):
+        """Escolhe os marcos por ponto mais distante e calcula as distancias de cada um"""
+        free = np.flatnonzero(engine.padded)
+        if not len(free):
+            raise ValueError("A grade nao tem celulas livres")
+        table = np.zeros((engine.padded.size, k), dtype=np.float32)
+        #nenhum marco ainda: o primeiro eh o ponto mais distante de uma celula livre qualquer
+        seed = DistanceField(engine, engine.cell(int(free[0]))).flat
+        nearest = np.where(np.isinf(seed), -np.inf, seed)
+        cells = []
+        for i in range(k):
+            idx = int(np.argmax(nearest))
+            cells.append(engine.cell(idx))
+            dist = DistanceField(engine, cells[-1]).flat
+            reachable = np.isfinite(dist)
+            table[:, i] = np.where(reachable, dist, 0.0)
+            nearest = np.minimum(nearest, np.where(reachable, dist, -np.inf))
+        return cls(engine, table, cells)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.save(path, self.table)
+
+    @classmethod
+    def load(cls, engine, path):
+        """Mapeia a tabela do disco somente leitura"""
+        return cls(engine, np.load(path, mmap_mode="r"))
+
+    @classmethod
+    def get(cls, engine, k=8, path=None):
+        """
+        Carrega a tabela da grade, gerando e salvando na primeira vez.
+        Grade ja alterada por set_cells (version > 0) sem path explicito:
+        a tabela fica so em memoria, senao cada versao deixaria um arquivo
+        novo em tabelas/ que nunca mais seria lido.
+        """
+        if path is None and engine.version:
+            return cls.build(engine, k)
+        path = path or default_path(engine, k)
+        if not os.path.exists(path):
+            cls.build(engine, k).save(path)
+        return cls.load(engine, path)
+
+    def heuristic(self, dest_idx):
+        """h(idx) ate dest_idx pela desigualdade triangular"""
+        rows = self.rows
+        k = self.k
+        dest_row = rows[dest_idx * k:(dest_idx + 1) * k].tolist()
+        dest_slack = max(dest_row) * ROUNDING
+        def h(idx):
+            start = idx * k
+            row = rows[start:start + k].tolist()
+            gap = max(map(abs, map(sub, row, dest_row)))
+            return max(gap - dest_slack - max(row) * ROUNDING, 0.0)
+        return h
@@ -0,0 +1,109 @@
+import os
+import struct
+import sys
+
+import numpy as np
+
+from grid_engine import GridEngine
+
+#caracteres do formato .map do MovingAI que sao transitaveis ('.', 'G' e 'S' pantano);
+#'@', 'O', 'T' (arvores) e 'W' (agua) ficam bloqueados
+PASSABLE = b".GS"
+
+#cabecalho do formato binario: magica, linhas, colunas, reservado
+MAGIC = b"GRD1"
+HEADER = struct.Struct("<4sIII")
+
+_passable_lookup = np.zeros(256, dtype=np.uint8)
+_passable_lookup[np.frombuffer(PASSABLE, dtype=np.uint8)] = 1
+
+
+def read_movingai_map(path):
+    """
+    Le um arquivo .map do MovingAI e retorna a grade ja com a borda
+    bloqueada (array uint8 (altura + 2, largura + 2), 1 = livre), pronta para
+    GridEngine.from_padded. Cada linha do mapa vira uma linha do array de uma vez.
+    """
+    with open(path, "rb") as file:
+        header = {}
+        for line in file:
+            line = line.strip()
+            if line == b"map":
+                break
+            key, _, value = line.partition(b" ")
+            header[key.decode()] = value.decode()
+        try:
+            height = int(header["height"])
+            width = int(header["width"])
+        except KeyError as error:
+            raise ValueError(f"Cabecalho .map sem {error.args[0]}: {path}") from None
+
+        padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        for row in range(height):
+            line = file.readline().rstrip(b"\r\n")
+            if len(line) != width:
+                raise ValueError(f"Linha {row} do mapa com {len(line)} colunas em vez de {width}: {path}")
+            padded[row + 1, 1:-1] = _passable_lookup[np.frombuffer(line, dtype=np.uint8)]
+    return padded
+
+
+def write_binary(padded, path):
+    """Grava a grade com borda no formato binario (cabecalho + um byte por celula)"""
+    padded = np.ascontiguousarray(padded, dtype=np.uint8)
+    rows, cols = padded.shape[0] - 2, padded.shape[1] - 2
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, rows, cols, 0))
+        padded.tofile(file)
+
+
+def read_binary(path):
+    """
+    Mapeia o arquivo binario em memoria, sem ler nem copiar as celulas.
+    O modo copy-on-write deixa o motor alterar celulas (set_cells) sem
+    mexer no arquivo.
+    """
+    with open(path, "rb") as file:
+        magic, rows, cols, _ = HEADER.unpack(file.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"Arquivo nao esta no formato binario de grade: {path}")
+    return np.memmap(path, dtype=np.uint8, mode="c", offset=HEADER.size, shape=(rows + 2, cols + 2))
+
+
+def open_map(path, **engine_options):
+    """GridEngine de um .map do MovingAI ou de um arquivo binario (demais extensoes)"""
+    if path.endswith(".map"):
+        padded = read_movingai_map(path)
+    else:
+        padded = read_binary(path)
+    return GridEngine.from_padded(padded, **engine_options)
+
+
+def iter_scenarios(path):
+    """
+    Percorre um arquivo .scen do MovingAI linha a linha, gerando
+    (bucket, mapa, origem, destino, custo otimo) com origem e destino em
+    (linha, coluna). O arquivo nunca eh carregado inteiro.
+    """
+    with open(path) as file:
+        for line in file:
+            fields = line.split()
+            if len(fields) < 9 or fields[0] == "version":
+                continue
+            bucket, map_name = int(fields[0]), fields[1]
+            start_x, start_y, goal_x, goal_y = (int(value) for value in fields[4:8])
+            yield bucket, map_name, (start_y, start_x), (goal_y, goal_x), float(fields[8])
+
+
+def main():
+    """Converte um mapa para o formato binario: python map_io.py <entrada.map> <saida.grid>"""
+    if len(sys.argv) != 3:
+        print("Uso: python map_io.py <entrada.map> <saida.grid>")
+        return
+    padded = read_movingai_map(sys.argv[1])
+    write_binary(padded, sys.argv[2])
+    print(f"Grade {padded.shape[0] - 2}x{padded.shape[1] - 2} salva em {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()
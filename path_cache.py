@@ -0,0 +1,104 @@
+from collections import OrderedDict
+
+#algoritmos que devolvem caminhos otimos: so neles um sufixo tambem eh otimo
+OPTIMAL_ALGORITHMS = ("astar", "jps")
+
+
+class PathCache:
+    """
+    Cache LRU de consultas de caminho sobre um GridEngine.
+
+    A chave eh (engine.version, origem, destino); qualquer set_cells no motor
+    esvazia o cache, entao uma resposta nunca vem de uma grade antiga.
+    Caminhos otimos tambem sao indexados por destino: todo sufixo de um
+    caminho otimo eh otimo ate o mesmo destino, entao uma consulta que parte
+    de uma celula ja vista num caminho guardado nao chama a busca.
+    Consultas sem caminho (None) tambem ficam guardadas.
+    """
+    def __init__(self, engine, capacity=1024, heuristic="octile", algorithm="astar"):
+        if capacity < 1:
+            raise ValueError("capacity deve ser pelo menos 1")
+        self.engine = engine
+        self.capacity = capacity
+        self.heuristic = heuristic
+        self.algorithm = algorithm
+        self.reuse_suffixes = algorithm in OPTIMAL_ALGORITHMS
+
+        self.entries = OrderedDict()  #chave -> tupla de celulas (ou None), do mais antigo ao mais recente
+        self.by_dest = {}             #destino -> {celula: (chave, posicao no caminho)}
+
+        self.hits = 0
+        self.suffix_hits = 0
+        self.misses = 0
+
+        engine.add_listener(self._on_change)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def close(self):
+        """Para de acompanhar a grade"""
+        self.engine.remove_listener(self._on_change)
+
+    def clear(self):
+        self.entries.clear()
+        self.by_dest.clear()
+
+    def _on_change(self, changes):
+        self.clear()
+
+    def _store(self, key, path):
+        entries = self.entries
+        entries[key] = path
+        if len(entries) > self.capacity:
+            old_key, old_path = entries.popitem(last=False)
+            self._unindex(old_key, old_path)
+        if path is not None and self.reuse_suffixes:
+            cells = self.by_dest.setdefault(key[2], {})
+            for pos, cell in enumerate(path):
+                cells[cell] = (key, pos)  #aponta para o caminho mais recente, que sai por ultimo do LRU
+
+    def _unindex(self, key, path):
+        if path is None or not self.reuse_suffixes:
+            return
+        cells = self.by_dest.get(key[2])
+        if cells is None:
+            return
+        for cell in path:
+            if cells.get(cell, (None,))[0] == key:
+                del cells[cell]
+        if not cells:
+            del self.by_dest[key[2]]
+
+    def search(self, src, dest):
+        """Mesmo contrato de engine.search: lista de celulas ou None"""
+        src = (int(src[0]), int(src[1]))
+        dest = (int(dest[0]), int(dest[1]))
+        key = (self.engine.version, src, dest)
+        entries = self.entries
+
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            path = entries[key]
+            return None if path is None else list(path)
+
+        found = self.by_dest.get(dest, {}).get(src)
+        if found is not None:
+            owner, pos = found
+            self.suffix_hits += 1
+            entries.move_to_end(owner)  #o caminho de onde veio o sufixo tambem foi usado
+            path = entries[owner][pos:]
+            self._store(key, path)
+            return list(path)
+
+        self.misses += 1
+        path = self.engine.search(src, dest, self.heuristic, self.algorithm)
+        self._store(key, None if path is None else tuple(path))
+        return path
+
+    def __str__(self):
+        total = self.hits + self.suffix_hits + self.misses
+        rate = (self.hits + self.suffix_hits) / total if total else 0.0
+        return (f"Entradas: {len(self)}/{self.capacity}, Acertos: {self.hits}, "
+                f"Sufixos: {self.suffix_hits}, Faltas: {self.misses}, Taxa: {rate:.1%}")
@@ -0,0 +1,175 @@
+import json
+import tracemalloc
+from time import perf_counter
+
+#fases cronometradas separadamente; o que sobra do tempo total eh a expansao (vizinhos, g, pais)
+PHASES = ("heuristic", "queue")
+
+
+class SearchObserver:
+    """
+    Instrumentacao opcional das buscas do GridEngine (search/query/a_star_search
+    com observer=...). Tambem eh a base do Observador do sliding puzzle
+    (trabalho-1/.../observador.py), que so troca as fases, os nomes da saida e
+    a descricao do estado de cada amostra.
+
+    Sem observer a busca roda como sempre: h, heappush e heappop so sao
+    trocados por versoes cronometradas quando ha um. Com ele sao medidos:
+    - expansoes, chamando on_expand(row, col, g, open_size) a cada
+      sample_every expansoes (as amostras tambem vao para o trace);
+    - insercoes na lista aberta, entradas antigas descartadas (duplicates),
+      celulas abertas que receberam g menor (improved, reinseridas) e o pico
+      da lista aberta, lido a cada expansao;
+    - tempo com perf_counter na heuristica e na lista aberta; o restante do
+      tempo total eh a expansao. A medicao em si pesa um pouco em cada chamada;
+    - pico de memoria alocada pelo Python com tracemalloc (memory=True).
+
+    O A* e o JPS do motor nunca reabrem celulas fechadas; o HPA* so informa
+    expansoes e insercoes do grafo abstrato. O resultado fica em
+    SearchResult.profile e pode ser salvo em JSON ou como trace do Chrome.
+    """
+    PHASES = PHASES
+    #nome de cada chave na saida (to_dict, JSON e trace); as ausentes ficam como estao
+    NAMES = {}
+
+    def __init__(self, sample_every=1, on_expand=None, memory=False):
+        if sample_every < 1:
+            raise ValueError("sample_every deve ser pelo menos 1")
+        self.sample_every = sample_every
+        self.on_expand = on_expand
+        self.memory = memory
+        self.times = dict.fromkeys(self.PHASES, 0.0)
+        self.events = []  #(segundos desde o inicio, campos do estado, g, tamanho da lista aberta)
+        self.expansions = 0
+        self.pushes = 0
+        self.duplicates = None
+        self.improved = None
+        self.peak_open = 0
+        self.peak_memory = None
+        self.total_time = 0.0
+        self.width = None
+        self.start_time = None
+        self.stop_tracing = False
+
+    def name(self, key):
+        return self.NAMES.get(key, key)
+
+    def state(self, idx):
+        """Campos do estado expandido nas amostras: (linha, coluna) da grade, sem a borda"""
+        row, col = divmod(idx, self.width)
+        return {"row": row - 1, "col": col - 1}
+
+    def start(self, width=None):
+        """Chamado pela busca logo antes do laco principal (width: largura da grade com borda)"""
+        self.width = width
+        if self.memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self.stop_tracing = True
+        self.start_time = perf_counter()
+
+    def timed(self, func, phase, count_pushes=False):
+        """
+        Versao de func que soma o tempo de cada chamada em times[phase]
+        (count_pushes: cada chamada tambem conta como uma insercao).
+        """
+        times = self.times
+        if count_pushes:
+            def wrapper(*args):
+                begin = perf_counter()
+                result = func(*args)
+                times[phase] += perf_counter() - begin
+                self.pushes += 1
+                return result
+        else:
+            def wrapper(*args):
+                begin = perf_counter()
+                result = func(*args)
+                times[phase] += perf_counter() - begin
+                return result
+        return wrapper
+
+    def expanded(self, idx, g, open_size):
+        """Chamado a cada expansao"""
+        self.expansions += 1
+        if open_size > self.peak_open:
+            self.peak_open = open_size
+        if self.expansions % self.sample_every == 0:
+            state = self.state(idx)
+            self.events.append((perf_counter() - self.start_time, state, g, open_size))
+            if self.on_expand is not None:
+                self.on_expand(*state.values(), g, open_size)
+
+    def finish(self, expansions=None, pushes=None, remaining=None, distinct=None):
+        """
+        Fecha as contas: expansoes e insercoes da busca (None = as contadas
+        aqui), entradas que sobraram na lista aberta e estados distintos
+        gerados (None quando nao se aplica).
+        """
+        self.total_time = perf_counter() - self.start_time
+        if expansions is not None:
+            self.expansions = expansions
+        if pushes is not None:
+            self.pushes = pushes
+        if remaining is not None:
+            #toda entrada inserida saiu expandida, saiu como entrada antiga ou ainda esta na lista
+            self.duplicates = self.pushes - self.expansions - remaining
+        if distinct is not None:
+            self.improved = self.pushes - distinct
+        if self.memory:
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self.stop_tracing:
+                tracemalloc.stop()
+                self.stop_tracing = False
+
+    def to_dict(self):
+        name = self.name
+        times = {name(phase): time for phase, time in self.times.items()}
+        times[name("expansion")] = max(0.0, self.total_time - sum(self.times.values()))
+        return {
+            name("expansions"): self.expansions,
+            name("pushes"): self.pushes,
+            name("duplicates"): self.duplicates,
+            name("improved"): self.improved,
+            name("peak_open"): self.peak_open,
+            name("peak_memory"): self.peak_memory,
+            name("total_time"): self.total_time,
+            name("times"): times,
+            name("samples"): len(self.events),
+        }
+
+    def __str__(self):
+        times = self.to_dict()[self.name("times")]
+        times = ", ".join(f"{phase} {time:.6f} s" for phase, time in times.items())
+        memory = "" if self.peak_memory is None else f"\nPico de memoria: {self.peak_memory / 1024:.1f} KiB"
+        return (f"Insercoes: {self.pushes}, duplicadas: {self.duplicates}, "
+                f"melhoradas: {self.improved}, pico da lista aberta: {self.peak_open}"
+                f"\nTempos: {times}{memory}")
+
+    def save_json(self, path):
+        """Perfil e amostras em JSON"""
+        name = self.name
+        data = self.to_dict()
+        data[name("events")] = [{name("time"): time, **state, "g": g, name("open"): size}
+                                for time, state, g, size in self.events]
+        with open(path, "w") as file:
+            json.dump(data, file, indent=2)
+
+    def save_chrome_trace(self, path):
+        """
+        Trace no formato de eventos do Chrome (chrome://tracing ou Perfetto):
+        a busca como um bloco com o perfil nos argumentos, cada amostra como
+        evento instantaneo e o tamanho da lista aberta como contador.
+        """
+        name = self.name
+        events = [{"name": name("search"), "ph": "X", "ts": 0, "dur": self.total_time * 1e6,
+                   "pid": 1, "tid": 1, "args": self.to_dict()}]
+        for time, state, g, size in self.events:
+            events.append({"name": name("expand"), "ph": "i", "s": "t", "ts": time * 1e6,
+                           "pid": 1, "tid": 1, "args": {**state, "g": g}})
+            events.append({"name": name("open_list"), "ph": "C", "ts": time * 1e6,
+                           "pid": 1, "args": {name("size"): size}})
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
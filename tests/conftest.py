@@ -0,0 +1,114 @@
+import glob
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+#pasta do SlidingPuzzle (supremacy.py e modulos vizinhos)
+PUZZLE_DIR = os.path.dirname(glob.glob(os.path.join(ROOT, "trabalho-1", "*", "supremacy.py"))[0])
+for path in (ROOT, PUZZLE_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from grid_engine import GridEngine  # noqa: E402
+from supremacy import SlidingPuzzle  # noqa: E402
+
+#8-puzzle de benchmarks/instancias/puzzle8_profundidade.txt: (profundidade otima, pecas linha a linha)
+BOARDS_3X3 = [
+    (8, (4, 1, 0, 5, 3, 2, 7, 8, 6)),
+    (12, (1, 3, 5, 4, 6, 8, 0, 7, 2)),
+    (16, (0, 1, 5, 6, 3, 8, 4, 7, 2)),
+    (20, (8, 2, 3, 5, 0, 6, 1, 7, 4)),
+    (24, (2, 8, 0, 4, 7, 5, 6, 3, 1)),
+]
+
+#15-puzzle embaralhado a partir do destino (profundidades 14, 19 e 20: rapidos para o A* comum)
+BOARDS_4X4 = [
+    (1, 2, 4, 8, 9, 5, 3, 0, 13, 6, 7, 12, 10, 14, 11, 15),
+    (10, 0, 6, 4, 3, 1, 2, 8, 5, 14, 7, 12, 9, 13, 11, 15),
+    (2, 6, 3, 4, 1, 12, 7, 8, 5, 13, 0, 15, 9, 10, 14, 11),
+]
+
+#grades aleatorias fixas: (semente, linhas, colunas, origem, destino)
+GRIDS = [
+    (0, 40, 40, (0, 0), (39, 39)),
+    (4, 40, 40, (0, 39), (39, 0)),
+    (2, 30, 50, (15, 0), (15, 49)),
+    (3, 50, 30, (0, 15), (49, 15)),
+]
+
+#labirinto do main de aEstrala.py (1 = livre, 0 = bloqueado)
+GRID = [
+    [1, 0, 1, 1, 1, 1, 0, 1, 1, 1],
+    [1, 1, 1, 0, 1, 1, 1, 0, 1, 1],
+    [1, 1, 1, 0, 1, 1, 0, 1, 0, 1],
+    [0, 0, 1, 0, 1, 0, 0, 0, 0, 1],
+    [1, 1, 1, 0, 1, 1, 1, 0, 1, 0],
+    [1, 0, 1, 1, 1, 1, 0, 1, 0, 0],
+    [1, 0, 0, 0, 0, 1, 0, 0, 0, 1],
+    [1, 0, 1, 1, 1, 1, 0, 1, 1, 1],
+    [1, 1, 1, 0, 0, 0, 1, 0, 0, 1],
+]
+
+
+def random_grid(seed, rows, cols, src, dest):
+    """Grade com 25% de obstaculos (1 = livre), com origem e destino livres"""
+    grid = (np.random.default_rng(seed).random((rows, cols)) >= 0.25).astype(np.uint8)
+    grid[src] = grid[dest] = 1
+    return grid
+
+
+@pytest.fixture(scope="session")
+def puzzle3():
+    return SlidingPuzzle(3)
+
+
+@pytest.fixture(scope="session")
+def puzzle4():
+    return SlidingPuzzle(4)
+
+
+@pytest.fixture(scope="session")
+def a_star_cost():
+    """Custo da solucao do A* comum com Manhattan (referencia dos outros algoritmos)"""
+    def cost(puzzle, board):
+        solution, metrics = puzzle.busca_a_estrela(board, puzzle.matriz_destino, 1)
+        assert solution is not None
+        return metrics.profundidade
+    return cost
+
+
+@pytest.fixture(params=GRIDS, ids=lambda grid: f"seed{grid[0]}")
+def grid_case(request):
+    """(engine, origem, destino, custo do A* comum) de cada grade fixa"""
+    seed, rows, cols, src, dest = request.param
+    engine = GridEngine(random_grid(seed, rows, cols, src, dest))
+    return engine, src, dest, engine.query(src, dest).cost
+
+
+@pytest.fixture(params=BOARDS_3X3, ids=lambda board: f"d{board[0]}")
+def board3(request):
+    """(profundidade otima, tabuleiro 3x3) de cada instancia fixa"""
+    depth, tiles = request.param
+    return depth, np.array(tiles).reshape(3, 3)
+
+
+@pytest.fixture(params=BOARDS_4X4, ids=lambda board: "".join(f"{tile:x}" for tile in board))
+def board4(request):
+    return np.array(request.param).reshape(4, 4)
+
+
+@pytest.fixture(scope="session")
+def check_solution():
+    """Confere que a solucao vai do tabuleiro ao destino movendo o vazio uma casa por passo"""
+    def check(puzzle, solution, board):
+        assert np.array_equal(solution[0], board)
+        assert np.array_equal(solution[-1], puzzle.matriz_destino)
+        for before, after in zip(solution, solution[1:]):
+            (r1, c1), (r2, c2) = np.argwhere(before == 0)[0], np.argwhere(after == 0)[0]
+            assert abs(r1 - r2) + abs(c1 - c2) == 1
+            assert np.count_nonzero(before != after) == 2
+        return len(solution) - 1
+    return check
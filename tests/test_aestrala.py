@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import aEstrala
+from conftest import GRID
+from grid_engine import SearchResult
+from search_observer import SearchObserver
+
+
+def test_a_star_search_nao_imprime(capsys):
+    result = aEstrala.a_star_search(GRID, [8, 0], [0, 0])
+    assert capsys.readouterr().out == ""
+    assert isinstance(result, SearchResult) and result.found
+    assert result.path.dtype == np.int32 and result.path.shape[1] == 2
+    assert result.path[0].tolist() == [8, 0] and result.path[-1].tolist() == [0, 0]
+    assert result.expansions > 0 and result.pushes >= result.expansions
+    assert result.time >= 0 and result.profile is None
+
+
+def test_a_star_search_sem_caminho(capsys):
+    grid = [row[:] for row in GRID]
+    grid[7][0] = grid[7][1] = 0  #fecha a saida de (8, 0)
+    grid[8][1] = 0
+    result = aEstrala.a_star_search(grid, [8, 0], [0, 0])
+    assert capsys.readouterr().out == ""
+    assert not result.found and result.cost == float("inf")
+    assert result.to_dict()["path"] is None
+
+
+def test_a_star_search_celula_invalida():
+    with pytest.raises(ValueError):
+        aEstrala.a_star_search(GRID, [9, 0], [0, 0])
+    with pytest.raises(ValueError):
+        aEstrala.a_star_search(GRID, [0, 1], [0, 0])
+
+
+def test_a_star_search_com_observer():
+    observer = SearchObserver()
+    result = aEstrala.a_star_search(GRID, [8, 0], [0, 0], observer=observer)
+    assert result.profile is observer
+    assert result.to_dict()["profile"] == observer.to_dict()
+
+
+def test_print_a_star_search_mensagens(capsys):
+    result = aEstrala.print_a_star_search(GRID, [8, 0], [0, 0])
+    out = capsys.readouterr().out
+    assert "A célula de destino foi encontrada" in out
+    assert "-> (8, 0)" in out and "-> (0, 0)" in out
+    assert isinstance(result, SearchResult)
+
+    assert aEstrala.print_a_star_search(GRID, [0, 1], [0, 0]) is None
+    assert "bloqueados" in capsys.readouterr().out
+    assert aEstrala.print_a_star_search(GRID, [0, 0], [0, 0]) is None
+    assert "Ja estamos no destino" in capsys.readouterr().out
@@ -0,0 +1,21 @@
+def test_anytime_termina_no_otimo(puzzle3, board3, a_star_cost, check_solution):
+    depth, board = board3
+    otimo = a_star_cost(puzzle3, board)
+    publicadas = []
+    for solucao, metricas in puzzle3.busca_anytime(board, puzzle3.matriz_destino, 1):
+        custo = check_solution(puzzle3, solucao, board)
+        # Cada solução publicada respeita o limitante e melhora o custo ou o limitante da anterior
+        assert custo <= metricas.limitante * otimo + 1e-9
+        if publicadas:
+            custo_anterior, limitante_anterior = publicadas[-1]
+            assert custo < custo_anterior or (custo == custo_anterior and metricas.limitante < limitante_anterior)
+        publicadas.append((custo, metricas.limitante))
+    assert publicadas[-1][0] == otimo == depth
+    assert metricas.limitante == 1.0
+
+
+def test_anytime_15_puzzle(puzzle4, board4, a_star_cost):
+    otimo = a_star_cost(puzzle4, board4)
+    for solucao, metricas in puzzle4.busca_anytime(board4, puzzle4.matriz_destino, 1):
+        assert metricas.profundidade <= metricas.limitante * otimo + 1e-9
+    assert metricas.profundidade == otimo
@@ -0,0 +1,82 @@
+import random
+from array import array
+
+import numpy as np
+
+from armazem_nos import RAIZ, ArmazemNos
+from estado_compacto import Codificador
+
+
+def arvore_bfs(codificador, codigo_raiz, limite):
+    """Árvore de busca em largura guardada em um ArmazemNos, até "limite" nós"""
+    armazem = ArmazemNos(codificador)
+    vazio = codificador.posicao_vazio(codigo_raiz)
+    fila = [armazem.adicionar(codigo_raiz, 0, vazio, RAIZ, 0)]
+    for i in fila:
+        if len(armazem) >= limite:
+            break
+        codigo, vazio, g = armazem.codigos[i], armazem.vazios[i], armazem.g[i]
+        for direcao, destino in codificador.movimentos_direcao[vazio]:
+            filho, _ = codificador.mover(codigo, vazio, destino)
+            if filho not in armazem.indice:
+                fila.append(armazem.adicionar(filho, g + 1, destino, direcao, 0))
+    return armazem
+
+
+def test_direcoes_reproduzem_cada_no():
+    codificador = Codificador(3)
+    raiz = codificador.empacotar([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+    armazem = arvore_bfs(codificador, raiz, 2000)
+    for i in random.Random(0).sample(range(len(armazem)), 200):
+        direcoes = armazem.direcoes_ate(i)
+        #BFS: o caminho remontado tem o tamanho de g e termina no proprio no
+        assert len(direcoes) == armazem.g[i]
+        caminho = codificador.reproduzir(raiz, direcoes)
+        assert codificador.empacotar(caminho[-1]) == armazem.codigos[i]
+
+
+def test_raiz_sem_direcoes():
+    codificador = Codificador(3)
+    armazem = ArmazemNos(codificador)
+    i = armazem.adicionar(codificador.empacotar([[1, 2, 3], [4, 5, 6], [7, 8, 0]]), 0, 8, RAIZ, 0)
+    assert armazem.direcoes_ate(i) == []
+
+
+def test_atualizar_troca_o_pai():
+    codificador = Codificador(3)
+    raiz = codificador.empacotar([[1, 2, 3], [4, 0, 5], [6, 7, 8]])
+    armazem = ArmazemNos(codificador)
+    armazem.adicionar(raiz, 0, 4, RAIZ, 0)
+    #vazio: direita, baixo, esquerda -> termina na posicao 7
+    codigo, vazio = raiz, 4
+    for g, direcao in enumerate([3, 1, 2], 1):
+        destino = vazio + codificador.passos[direcao]
+        codigo, _ = codificador.mover(codigo, vazio, destino)
+        vazio = destino
+        armazem.adicionar(codigo, g, vazio, direcao, 0)
+    final = armazem.indice[codigo]
+    assert armazem.direcoes_ate(final) == [3, 1, 2]
+
+    #outro pai do mesmo estado: o vizinho com o vazio no centro, guardado como raiz de outra busca
+    pai, _ = codificador.mover(codigo, 7, 4)
+    armazem.adicionar(pai, 0, 4, RAIZ, 0)
+    armazem.atualizar(final, 1, 1, 7)
+    assert armazem.g[final] == 1 and armazem.componentes[final] == 7
+    assert armazem.direcoes_ate(final) == [1]
+    assert codificador.reproduzir(pai, [1])[-1].tolist() == codificador.desempacotar(codigo).tolist()
+
+
+def test_colunas_compactas():
+    #15-puzzle: o codigo cabe em 64 bits; 5x5 (125 bits) cai para lista de ints
+    assert isinstance(ArmazemNos(Codificador(4)).codigos, array)
+    assert isinstance(ArmazemNos(Codificador(5)).codigos, list)
+    assert isinstance(ArmazemNos(Codificador(3), bits_componentes=128).componentes, list)
+
+
+def test_5x5_caminho_grande():
+    codificador = Codificador(5)
+    raiz = codificador.empacotar(np.append(np.arange(1, 25), 0).reshape(5, 5))
+    armazem = arvore_bfs(codificador, raiz, 500)
+    ultimo = len(armazem) - 1
+    caminho = codificador.reproduzir(raiz, armazem.direcoes_ate(ultimo))
+    assert codificador.empacotar(caminho[-1]) == armazem.codigos[ultimo]
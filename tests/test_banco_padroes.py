@@ -0,0 +1,30 @@
+import pytest
+
+
+@pytest.mark.parametrize("busca", ["busca_a_estrela", "busca_ida_estrela"])
+def test_banco_padroes_mesmo_custo_do_a_estrela(puzzle3, board3, a_star_cost, check_solution, busca):
+    depth, board = board3
+    solucao, metricas = getattr(puzzle3, busca)(board, puzzle3.matriz_destino, 6)
+    assert check_solution(puzzle3, solucao, board) == a_star_cost(puzzle3, board) == depth
+
+
+def test_banco_padroes_nao_passa_da_distancia_exata(puzzle3, board3):
+    # Admissível: o valor inicial da heurística nunca passa da profundidade ótima
+    depth, board = board3
+    assert puzzle3.calcular_valor_h(board, puzzle3.matriz_destino, 6) <= depth
+
+
+def test_bancos_gravados_por_inteiro(tmp_path, monkeypatch):
+    import numpy as np
+
+    import banco_padroes
+    from estado_compacto import Codificador
+
+    monkeypatch.setattr(banco_padroes, "DIRETORIO_TABELAS", str(tmp_path))
+    destino = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+    banco = banco_padroes.BancoPadroes.obter(destino, Codificador(3))
+    # Só os arquivos finais (nenhum temporário), cada um com um byte por arranjo das peças do padrão
+    arquivos = sorted(tmp_path.iterdir())
+    assert [arquivo.suffix for arquivo in arquivos] == [".bin", ".bin"]
+    for arquivo, pecas in zip(arquivos, banco.particao):
+        assert arquivo.stat().st_size == banco_padroes.arranjos(9, len(pecas))
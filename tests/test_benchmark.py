@@ -0,0 +1,104 @@
+import csv
+
+import numpy as np
+import pytest
+
+import benchmark
+
+
+def record(cost=10, expected=10, expansions=100, time=0.01, instance="i"):
+    return {"instance": instance, "expected": expected, "cost": cost, "expansions": expansions, "time": time}
+
+
+def results_of(suite="puzzle8", records=None, peak=1024):
+    records = records if records is not None else [record(time=t / 1000) for t in range(1, 11)]
+    return {"suites": {suite: {"summary": benchmark.summarize(records, peak), "records": records}}}
+
+
+def test_korf_so_tem_o_subconjunto():
+    instances = benchmark.read_korf()
+    assert benchmark.KORF_FILE.endswith("korf5.txt")
+    assert [number for number, _, _ in instances] == [1, 2, 3, 4, 5]
+    assert [optimal for _, optimal, _ in instances] == [57, 55, 59, 56, 56]
+    for _, _, board in instances:
+        assert sorted(board.ravel()) == list(range(16))
+
+
+def test_puzzle8_profundidades():
+    instances = benchmark.read_puzzle8()
+    assert len(instances) == len(benchmark.PUZZLE8_DEPTHS) * benchmark.PUZZLE8_PER_DEPTH
+    assert {depth for depth, _ in instances} == set(benchmark.PUZZLE8_DEPTHS)
+
+
+def test_summarize():
+    records = [record(time=t / 1000) for t in range(1, 11)]
+    records[3]["cost"] = 11
+    records[4]["cost"] = 10 + 1e-9  #diferenca de arredondamento nao conta como custo errado
+    summary = benchmark.summarize(records, 2048)
+    assert summary["instances"] == 10
+    assert summary["wrong_cost"] == 1
+    assert summary["expansions"] == 1000
+    assert summary["total_time"] == pytest.approx(0.055)
+    assert summary["nodes_per_s"] == pytest.approx(1000 / 0.055)
+    assert summary["latency_p50_ms"] == pytest.approx(5.5)
+    assert summary["latency_p90_ms"] == pytest.approx(np.percentile(np.arange(1, 11), 90))
+    assert summary["peak_rss_kb"] == 2048
+
+
+def test_summarize_sem_tempo():
+    summary = benchmark.summarize([record(time=0.0)], 0)
+    assert summary["nodes_per_s"] == 0.0
+    assert benchmark.summarize([], 0)["latency_p99_ms"] == 0.0
+
+
+def test_compare_igual_sem_regressoes():
+    results = results_of()
+    assert benchmark.compare(results, results) == []
+    #sem baseline so o custo errado eh conferido
+    assert benchmark.compare(results, {}) == []
+
+
+def test_compare_custo_errado_mesmo_sem_baseline():
+    results = results_of(records=[record(cost=12)])
+    (problem,) = benchmark.compare(results, {})
+    assert "custo diferente do otimo" in problem
+
+
+def test_compare_detecta_regressoes():
+    base = results_of()
+    slower = [record(time=2 * t / 1000, expansions=120) for t in range(1, 11)]
+    problems = benchmark.compare(results_of(records=slower), base)
+    assert any("expansoes 1200" in problem for problem in problems)
+    assert any("nos/s" in problem for problem in problems)
+    assert any("latency_p50_ms" in problem for problem in problems)
+    assert any("latency_p90_ms" in problem for problem in problems)
+    #dentro do limite aceito: nada
+    close = [record(time=1.05 * t / 1000, expansions=105) for t in range(1, 11)]
+    assert benchmark.compare(results_of(records=close), base) == []
+    assert benchmark.compare(results_of(records=close), base, threshold=0.01) != []
+
+
+def test_compare_numero_de_instancias_diferente():
+    base = results_of()
+    fewer = [record(time=t / 1000, expansions=1000) for t in range(1, 6)]
+    (problem,) = benchmark.compare(results_of(records=fewer), base)
+    assert "5 instancias contra 10" in problem
+
+
+def test_compare_ignora_suites_ausentes():
+    assert benchmark.compare(results_of("grid"), results_of("puzzle8")) == []
+
+
+def test_write_csv(tmp_path):
+    results = results_of(records=[record(instance="a"), record(cost=3, instance="b")])
+    path = tmp_path / "out.csv"
+    benchmark.write_csv(results, path)
+    with open(path) as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["suite", "instance", "expected", "cost", "expansions", "time"]
+    assert [row[:4] for row in rows[1:]] == [["puzzle8", "a", "10", "10"], ["puzzle8", "b", "10", "3"]]
+
+
+def test_suite_desconhecida():
+    with pytest.raises(ValueError):
+        benchmark._run_suite("nada", None, "astar")
@@ -0,0 +1,78 @@
+import math
+
+import numpy as np
+import pytest
+
+from conftest import GRIDS, random_grid
+from distance_field import DistanceField
+from grid_engine import GridEngine
+
+#custos do motor: octil padrao, diagonal 1 cortando quinas (aEstrala) e diagonal 1.5
+MODELS = [
+    dict(),
+    dict(diagonal_cost=1.0, corner_cutting=True),
+    dict(diagonal_cost=1.5),
+]
+
+
+@pytest.mark.parametrize("model", MODELS, ids=["octile", "chebyshev", "diag1.5"])
+@pytest.mark.parametrize("case", GRIDS, ids=lambda grid: f"seed{grid[0]}")
+def test_wavefront_igual_ao_dijkstra(case, model):
+    engine = GridEngine(random_grid(*case), **model)
+    dest = case[4]
+    dijkstra = DistanceField(engine, dest)
+    wavefront = DistanceField(engine, dest, method="wavefront")
+    assert np.array_equal(np.isinf(dijkstra.distances), np.isinf(wavefront.distances))
+    finite = np.isfinite(dijkstra.distances)
+    assert np.allclose(dijkstra.distances[finite], wavefront.distances[finite])
+
+
+def test_distancias_iguais_ao_a_estrela(grid_case):
+    engine, src, dest, cost = grid_case
+    field = DistanceField(engine, dest)
+    assert field.distance(dest) == 0.0
+    assert field.distance(src) == pytest.approx(cost)
+    #celulas bloqueadas ficam com inf
+    assert np.isinf(field.distances[engine.padded[1:-1, 1:-1] == 0]).all()
+
+
+def test_descida_tem_custo_otimo(grid_case):
+    engine, src, dest, cost = grid_case
+    field = DistanceField(engine, dest)
+    path = field.descend(src)
+    assert path[0] == src and path[-1] == dest
+    assert engine.path_cost(path) == pytest.approx(cost)
+
+
+def test_heuristica_exata_expande_so_o_caminho(grid_case):
+    engine, src, dest, cost = grid_case
+    field = DistanceField(engine, dest)
+    path = engine.search(src, dest, heuristic=field.heuristic())
+    assert engine.path_cost(path) == pytest.approx(cost)
+    assert engine.expanded <= engine.query(src, dest).expansions
+
+
+def test_sem_caminho():
+    grid = np.ones((6, 6), dtype=np.uint8)
+    grid[:, 3] = 0
+    engine = GridEngine(grid)
+    for method in ("dijkstra", "wavefront"):
+        field = DistanceField(engine, (0, 5), method=method)
+        assert math.isinf(field.distance((0, 0)))
+        assert field.descend((0, 0)) is None
+        assert field.paths([(0, 0), (5, 5)])[1][-1] == (0, 5)
+
+
+def test_recalcula_quando_a_grade_muda():
+    engine = GridEngine(np.ones((5, 5), dtype=np.uint8))
+    field = DistanceField(engine, (0, 4), method="wavefront")
+    assert field.distance((4, 4)) == 4
+    engine.set_cells([(r, 4, 0) for r in range(1, 4)])
+    assert field.version != engine.version
+    assert field.distance((4, 4)) == DistanceField(engine, (0, 4)).distance((4, 4))
+    assert field.version == engine.version
+
+
+def test_metodo_desconhecido():
+    with pytest.raises(ValueError):
+        DistanceField(GridEngine(np.ones((3, 3), dtype=np.uint8)), (0, 0), method="bfs")
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from dstar_lite import DStarLite
+
+
+def test_dstar_lite_same_cost_as_astar(grid_case):
+    engine, src, dest, cost = grid_case
+    planner = DStarLite(engine, src, dest)
+    path = planner.plan()
+    assert planner.cost() == pytest.approx(cost)
+    assert engine.path_cost(path) == pytest.approx(cost)
+
+
+@pytest.mark.parametrize("update_first", [True, False])
+def test_dstar_lite_replans_like_astar(grid_case, update_first):
+    #o agente anda alguns passos e a grade muda a cada passo, nas duas ordens de chamada
+    engine, src, dest, _ = grid_case
+    planner = DStarLite(engine, src, dest)
+    path = planner.plan()
+    rng = np.random.default_rng(4)
+    for _ in range(6):
+        if path is None or len(path) < 4:
+            break
+        start = tuple(path[3])
+        changes = [(int(r), int(c), int(v)) for r, c, v in
+                   zip(rng.integers(0, engine.rows, 15), rng.integers(0, engine.cols, 15), rng.integers(0, 2, 15))
+                   if (r, c) not in (start, dest)]
+        if update_first:
+            planner.update_cells(changes)
+            planner.move_start(start)
+        else:
+            planner.move_start(start)
+            planner.update_cells(changes)
+        path = planner.plan()
+        reference = engine.query(start, dest)
+        assert (path is not None) == reference.found
+        if reference.found:
+            assert planner.cost() == pytest.approx(reference.cost)
+            assert engine.path_cost(path) == pytest.approx(reference.cost)
+    planner.close()
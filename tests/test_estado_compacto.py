@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from estado_compacto import Codificador
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5])
+def test_empacotar_ida_e_volta(n):
+    codificador = Codificador(n)
+    matriz = np.random.default_rng(n).permutation(n * n).reshape(n, n)
+    codigo = codificador.empacotar(matriz)
+    assert np.array_equal(codificador.desempacotar(codigo), matriz)
+    assert codificador.posicao_vazio(codigo) == int(np.flatnonzero(matriz.ravel() == 0)[0])
+    for pos, numero in enumerate(matriz.ravel()):
+        assert codificador.peca(codigo, pos) == numero
+
+
+def test_cinco_bits_por_peca_a_partir_do_5x5():
+    assert Codificador(4).bits == 4
+    assert Codificador(5).bits == 5
+
+
+def test_mover_troca_vazio_e_peca():
+    codificador = Codificador(3)
+    matriz = np.array([[1, 2, 3], [4, 0, 5], [7, 8, 6]])
+    codigo, peca = codificador.mover(codificador.empacotar(matriz), 4, 5)
+    assert peca == 5
+    assert codificador.desempacotar(codigo).tolist() == [[1, 2, 3], [4, 5, 0], [7, 8, 6]]
+
+
+def test_movimentos_do_canto_e_do_centro():
+    codificador = Codificador(3)
+    assert sorted(codificador.movimentos[0]) == [1, 3]
+    assert sorted(codificador.movimentos[4]) == [1, 3, 5, 7]
+    # A direção ^ 1 desfaz o movimento
+    for direcao, destino in codificador.movimentos_direcao[4]:
+        assert destino + codificador.passos[direcao ^ 1] == 4
+
+
+def test_reproduzir_aplica_as_direcoes():
+    codificador = Codificador(3)
+    destino = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+    caminho = codificador.reproduzir(codificador.empacotar(destino), [0, 2, 1, 3])  # cima, esquerda, baixo, direita
+    assert len(caminho) == 5
+    assert caminho[1].tolist() == [[1, 2, 3], [4, 5, 0], [7, 8, 6]]
+    assert caminho[2].tolist() == [[1, 2, 3], [4, 0, 5], [7, 8, 6]]
+    assert caminho[-1].tolist() == [[1, 2, 3], [4, 8, 5], [7, 6, 0]]
+
+
+def test_estado_sem_vazio():
+    codificador = Codificador(2)
+    with pytest.raises(ValueError):
+        codificador.posicao_vazio(codificador.empacotar([[1, 2], [3, 3]]))
+
+
+def test_a_estrela_com_estados_compactos():
+    from supremacy import SlidingPuzzle
+    puzzle = SlidingPuzzle(3)
+    destino = puzzle.matriz_destino
+    solucao, metricas = puzzle.busca_a_estrela(destino, destino, 1)
+    assert metricas.profundidade == 0 and np.array_equal(solucao[0], destino)
+    # Uma troca de duas peças deixa o tabuleiro sem solução
+    sem_solucao = destino.copy()
+    sem_solucao[0, 0], sem_solucao[0, 1] = sem_solucao[0, 1], sem_solucao[0, 0]
+    assert puzzle.busca_a_estrela(sem_solucao, destino, 1)[0] is None
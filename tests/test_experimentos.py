@@ -0,0 +1,31 @@
+def sem_tempo(resultados):
+    """Resultados sem o tempo de parede, o único campo que muda entre execuções"""
+    return {heur: {chave: valor for chave, valor in resultado.items() if chave != "tempo"}
+            for heur, resultado in resultados.items()}
+
+
+def test_mesma_semente_mesmos_resultados(puzzle3):
+    primeira = puzzle3.executar_experimentos(6, limite_movimentos=20, semente=42)
+    segunda = puzzle3.executar_experimentos(6, limite_movimentos=20, semente=42)
+    assert sem_tempo(primeira) == sem_tempo(segunda)
+    assert all(resultado["solucoes"] == 6 for resultado in primeira.values())
+
+
+def test_paralelo_igual_ao_serial(puzzle3):
+    serial = puzzle3.executar_experimentos(6, limite_movimentos=20, semente=7)
+    paralelo = puzzle3.executar_experimentos(6, limite_movimentos=20, processos=2, semente=7, tamanho_lote=3)
+    assert sem_tempo(paralelo) == sem_tempo(serial)
+
+
+def test_sementes_diferentes_instancias_diferentes(puzzle3):
+    a = puzzle3.executar_experimentos(6, limite_movimentos=20, semente=1)
+    b = puzzle3.executar_experimentos(6, limite_movimentos=20, semente=2)
+    assert sem_tempo(a) != sem_tempo(b)
+
+
+def test_heuristicas_admissiveis_mesma_profundidade(puzzle3):
+    resultados = puzzle3.executar_experimentos(6, limite_movimentos=20, semente=3)
+    #Manhattan (1) e Hamming (2) sao admissiveis: mesma profundidade otima em cada instancia
+    assert resultados[1]["profundidade"] == resultados[2]["profundidade"]
+    #Hamming e mais fraca: expande pelo menos tantos nos no total
+    assert sum(resultados[2]["nodos"]) >= sum(resultados[1]["nodos"])
@@ -0,0 +1,28 @@
+import numpy as np
+
+from lote import inserir_ordenadas
+
+
+def test_feixe_sem_corte_acha_o_otimo(puzzle3, board3, a_star_cost, check_solution):
+    # Com largura maior que qualquer camada a busca em feixe vira uma busca em largura
+    depth, board = board3
+    solucao, metricas = puzzle3.busca_feixe(board, puzzle3.matriz_destino, 1, largura=200000)
+    assert check_solution(puzzle3, solucao, board) == a_star_cost(puzzle3, board) == depth
+
+
+def test_feixe_estreito_nao_fica_abaixo_do_a_estrela(puzzle3, board3, a_star_cost, check_solution):
+    depth, board = board3
+    solucao, metricas = puzzle3.busca_feixe(board, puzzle3.matriz_destino, 1, largura=50)
+    assert solucao is not None
+    assert check_solution(puzzle3, solucao, board) >= a_star_cost(puzzle3, board)
+
+
+def test_feixe_15_puzzle(puzzle4, board4, a_star_cost, check_solution):
+    solucao, metricas = puzzle4.busca_feixe(board4, puzzle4.matriz_destino, 1)
+    assert check_solution(puzzle4, solucao, board4) >= a_star_cost(puzzle4, board4)
+
+
+def test_inserir_ordenadas_aceita_chaves_fora_de_ordem():
+    ordenadas = np.array([1, 10, 20])
+    chaves = np.array([15, 12, 3, 11])  # 15, 12 e 11 caem na mesma posição
+    assert inserir_ordenadas(ordenadas, chaves).tolist() == [1, 3, 10, 11, 12, 15, 20]
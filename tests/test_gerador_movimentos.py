@@ -0,0 +1,105 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+import gerador_movimentos as gerador
+from supremacy import SlidingPuzzle
+
+
+def inversoes_ingenuas(sequencia):
+    return sum(1 for i in range(len(sequencia)) for j in range(i + 1, len(sequencia)) if sequencia[i] > sequencia[j])
+
+
+def paridade_ingenua(tabuleiro, n):
+    """A conta O(n^4) que o SlidingPuzzle fazia: inversões sem o vazio, mais a linha do vazio se n é par"""
+    pecas = [peca for peca in tabuleiro if peca != 0]
+    linha_vazio = list(tabuleiro).index(0) // n
+    return (inversoes_ingenuas(pecas) + (linha_vazio if n % 2 == 0 else 0)) % 2
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5])
+def test_paridade_igual_a_ingenua(n):
+    puzzle = SlidingPuzzle(n)
+    tabuleiros = np.random.default_rng(n).permuted(np.tile(np.arange(n * n), (200, 1)), axis=1)
+    assert gerador.contar_inversoes_lote(tabuleiros).tolist() == [inversoes_ingenuas(t) for t in tabuleiros]
+    assert [gerador.contar_inversoes(t) for t in tabuleiros] == [inversoes_ingenuas(t) for t in tabuleiros]
+    esperadas = [paridade_ingenua(t, n) for t in tabuleiros]
+    assert gerador.paridade_lote(tabuleiros, n).tolist() == esperadas
+    assert [gerador.paridade(t.reshape(n, n)) for t in tabuleiros] == esperadas
+    assert [puzzle.paridade(t.reshape(n, n)) for t in tabuleiros] == esperadas
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 6])
+def test_lote_so_com_solucao(n):
+    puzzle = SlidingPuzzle(n)
+    tabuleiros = gerador.gerar_lote(n, 500, np.random.default_rng(0))
+    assert tabuleiros.shape == (500, n, n)
+    assert all(puzzle.e_solucionavel(matriz) for matriz in tabuleiros)
+
+
+def test_sorteio_uniforme_2x2():
+    # O 2x2 tem 12 estados com solução: cada um deve sair perto de 1/12 das vezes
+    contagem = Counter(map(bytes, gerador.gerar_lote(2, 60000, np.random.default_rng(1))))
+    assert len(contagem) == 12
+    assert max(contagem.values()) - min(contagem.values()) < 600
+
+
+def test_profundidade_exata(puzzle3):
+    tabuleiros = gerador.gerar_lote(3, 20, np.random.default_rng(2), profundidade=18)
+    for matriz in tabuleiros:
+        _, metricas = puzzle3.busca_a_estrela(matriz, puzzle3.matriz_destino, 1)
+        assert metricas.profundidade == 18
+
+
+def test_profundidade_so_3x3():
+    with pytest.raises(ValueError):
+        gerador.gerar_lote(4, 1, profundidade=10)
+
+
+def test_arquivo_binario(tmp_path):
+    caminho = tmp_path / "tabuleiros.bin"
+    gerador.gravar_binario(caminho, 4, 1000, lote=300, semente=5)
+    lidos = gerador.ler_binario(caminho)
+    esperados = np.concatenate(list(gerador.gerar_lotes(4, 1000, lote=300, semente=5)))
+    assert np.array_equal(lidos, esperados)
+    assert len(list(gerador.gerar_instancias(4, 1000, lote=300, semente=5))) == 1000
+
+
+def test_profundidade_por_tabuleiro(puzzle3):
+    profundidades = np.array([3, 9, 3, 14, 9])
+    tabuleiros = gerador.gerar_lote(3, 5, np.random.default_rng(3), profundidade=profundidades)
+    tabela = puzzle3.tabela_distancias(puzzle3.matriz_destino)
+    codificador = puzzle3.codificador
+    assert [tabela.distancia(codificador.empacotar(m)) for m in tabuleiros] == profundidades.tolist()
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5])
+def test_passeio_lote(n, puzzle3):
+    passos = np.array([0, 1, 2, 7, 30, 30])
+    tabuleiros = gerador.passeio_lote(n, passos, np.random.default_rng(n))
+    destino = gerador.destino_padrao(n)
+    assert tabuleiros.shape == (6, n, n)
+    assert np.array_equal(tabuleiros[0], destino)
+    assert np.count_nonzero(tabuleiros[1] != destino) == 2
+    for matriz, k in zip(tabuleiros, passos):
+        assert gerador.e_solucionavel(matriz)
+        # O vazio anda uma casa por passo: a distância de Manhattan dele ao canto não passa de k
+        linha, coluna = np.argwhere(matriz == 0)[0]
+        assert (n - 1 - linha) + (n - 1 - coluna) <= k
+    if n == 3:
+        tabela = puzzle3.tabela_distancias(destino)
+        assert all(tabela.distancia(puzzle3.codificador.empacotar(m)) <= k for m, k in zip(tabuleiros, passos))
+
+
+def test_passeio_mesma_semente():
+    a = gerador.passeio_lote(4, [20] * 50, np.random.default_rng(9))
+    b = gerador.passeio_lote(4, [20] * 50, np.random.default_rng(9))
+    assert np.array_equal(a, b)
+    assert len({bytes(m) for m in a}) > 40
+
+
+def test_tabuleiro_invalido_sem_solucao():
+    assert not gerador.e_solucionavel([[1, 1, 2], [3, 4, 5], [6, 7, 0]])
+    assert not gerador.e_solucionavel([[1, 2, 3], [4, 5, 6], [7, 9, 0]])
+    assert gerador.e_permutacao(gerador.destino_padrao(4))
@@ -0,0 +1,73 @@
+import math
+
+import numpy as np
+import pytest
+
+import aEstrala
+from conftest import GRID
+from grid_engine import GridEngine
+
+def test_consultas_seguidas_reaproveitam_os_arrays():
+    engine = GridEngine(GRID)
+    first = engine.query((8, 0), (0, 0))
+    stamp = engine.stamp
+    second = engine.query((8, 0), (0, 0))
+    #mesmos arrays, geracao nova: nada da consulta anterior vaza para a seguinte
+    assert engine.stamp is stamp
+    assert engine.generation == 2
+    assert second.cost == first.cost and second.expansions == first.expansions
+    assert np.array_equal(second.path, first.path)
+
+
+def test_set_cells_muda_as_consultas_seguintes(grid_case):
+    engine, src, dest, cost = grid_case
+    path = engine.query(src, dest).path
+    row, col = path[len(path) // 2]
+    engine.set_cells([(row, col, 0)])
+    assert engine.version == 1
+    blocked = engine.query(src, dest)
+    assert not blocked.found or blocked.cost >= cost
+    assert not blocked.found or not any((r, c) == (row, col) for r, c in blocked.path.tolist())
+    engine.set_cells([(row, col, 1)])
+    assert engine.query(src, dest).cost == pytest.approx(cost)
+
+
+def test_set_cells_fora_da_grade():
+    engine = GridEngine(GRID)
+    with pytest.raises(ValueError):
+        engine.set_cells([(9, 0, 1)])
+    assert engine.version == 0
+
+
+def test_geracao_estourada_limpa_os_carimbos():
+    engine = GridEngine(GRID)
+    cost = engine.query((8, 0), (0, 0)).cost
+    engine.generation = (1 << 31) - 1
+    assert engine.query((8, 0), (0, 0)).cost == cost
+    assert engine.generation == 1
+
+
+def test_a_star_search_reaproveita_o_motor():
+    grid = [row[:] for row in GRID]
+    first = aEstrala.a_star_search(grid, [8, 0], [0, 0])
+    engine = aEstrala.engine_for(grid)
+    second = aEstrala.a_star_search(grid, [8, 0], [0, 0])
+    assert aEstrala.engine_for(grid) is engine
+    assert second.cost == first.cost
+    #mesmo modelo de custo de antes: diagonais custam 1 e cortam quinas
+    assert engine.diagonal_cost == 1.0 and engine.corner_cutting
+
+    #grade alterada no lugar: motor novo, com a celula bloqueada
+    grid[1][0] = 0
+    assert aEstrala.engine_for(grid) is not engine
+    assert not aEstrala.engine_for(grid).is_unblocked(1, 0)
+
+
+def test_a_star_search_com_motor_pronto():
+    engine = GridEngine(GRID)
+    result = aEstrala.a_star_search(None, (8, 0), (0, 0), engine=engine)
+    assert engine.generation == 1
+    assert result.cost == pytest.approx(engine.path_cost(result.path))
+    #motor com diagonais de custo sqrt(2): o custo nao pode ser menor que o do modelo padrao
+    assert result.cost >= aEstrala.a_star_search(GRID, (8, 0), (0, 0)).cost
+    assert math.isfinite(result.cost)
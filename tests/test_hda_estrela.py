@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+import pytest
+
+import hda_estrela
+
+
+@pytest.mark.parametrize("trabalhadores", [1, 3])
+def test_paralela_mesmo_custo_do_a_estrela(puzzle3, board3, a_star_cost, check_solution, trabalhadores):
+    depth, board = board3
+    solucao, metricas = puzzle3.busca_paralela(board, puzzle3.matriz_destino, 1, trabalhadores=trabalhadores, lote=16)
+    assert check_solution(puzzle3, solucao, board) == metricas.profundidade
+    assert metricas.profundidade == a_star_cost(puzzle3, board) == depth
+    assert len(metricas.trabalhadores) == trabalhadores
+
+
+def test_paralela_15_puzzle(puzzle4, board4, a_star_cost, check_solution):
+    solucao, metricas = puzzle4.busca_paralela(board4, puzzle4.matriz_destino, 1, trabalhadores=2, lote=16)
+    assert check_solution(puzzle4, solucao, board4) == a_star_cost(puzzle4, board4)
+
+
+@pytest.mark.parametrize("heuristica", [1, 5, 6])
+def test_paralela_com_spawn(puzzle3, heuristica, check_solution):
+    #com spawn nada eh herdado: cada processo reabre o motor (inclusive tabelas mapeadas do disco)
+    depth, tiles = 16, (0, 1, 5, 6, 3, 8, 4, 7, 2)
+    board = np.array(tiles).reshape(3, 3)
+    solucao, metricas = puzzle3.busca_paralela(board, puzzle3.matriz_destino, heuristica,
+                                               trabalhadores=2, lote=16, metodo_inicio="spawn")
+    assert check_solution(puzzle3, solucao, board) == depth
+
+
+def test_erro_no_trabalhador_chega_ao_coordenador(puzzle3, monkeypatch):
+    def falha(*args):
+        raise ZeroDivisionError("laço quebrado")
+    monkeypatch.setattr(hda_estrela, "_laco_trabalhador", falha)
+    board = np.array([[8, 2, 3], [5, 0, 6], [1, 7, 4]])
+    with pytest.raises(RuntimeError, match="ZeroDivisionError: laço quebrado"):
+        puzzle3.busca_paralela(board, puzzle3.matriz_destino, 1, trabalhadores=2, metodo_inicio="fork")
+
+
+def test_trabalhador_morto_nao_trava(puzzle3, monkeypatch):
+    def morre(ident, *args):
+        if ident == 1:
+            os._exit(3)
+        original(ident, *args)
+    original = hda_estrela._laco_trabalhador
+    monkeypatch.setattr(hda_estrela, "_laco_trabalhador", morre)
+    monkeypatch.setattr(hda_estrela, "ESPERA", 0.2)
+    board = np.array([[8, 2, 3], [5, 0, 6], [1, 7, 4]])
+    with pytest.raises(RuntimeError, match="código de saída 3"):
+        puzzle3.busca_paralela(board, puzzle3.matriz_destino, 1, trabalhadores=2, metodo_inicio="fork")
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from estado_compacto import Codificador
+from heuristicas import MotorHeuristico
+
+
+def manhattan_direta(matriz, destino):
+    total = 0
+    for peca in range(1, matriz.size):
+        (l1, c1), (l2, c2) = np.argwhere(matriz == peca)[0], np.argwhere(destino == peca)[0]
+        total += abs(l1 - l2) + abs(c1 - c2)
+    return total
+
+
+@pytest.mark.parametrize("n", [3, 4])
+def test_inicial_igual_ao_calculo_direto(n):
+    codificador = Codificador(n)
+    destino = np.append(np.arange(1, n * n), 0).reshape(n, n)
+    motor = MotorHeuristico(destino, codificador)
+    for matriz in np.random.default_rng(0).permuted(np.tile(np.arange(n * n), (20, 1)), axis=1):
+        matriz = matriz.reshape(n, n)
+        componentes = motor.inicial(codificador.empacotar(matriz))
+        diferentes = int(np.count_nonzero(matriz != destino))
+        assert motor.valor(componentes, 1) == manhattan_direta(matriz, destino)
+        assert motor.valor(componentes, 2) == max(diferentes - 1, 0)
+        assert motor.valor(componentes, 3) == 1.5 * manhattan_direta(matriz, destino)
+
+
+@pytest.mark.parametrize("n", [3, 4])
+def test_filho_incremental_igual_ao_recalculo(n):
+    # Num passeio aleatório, somar os deltas dá sempre o mesmo que recalcular do zero
+    codificador = Codificador(n)
+    destino = np.random.default_rng(n).permutation(n * n).reshape(n, n)  # destino qualquer
+    motor = MotorHeuristico(destino, codificador)
+    rng = np.random.default_rng(1)
+    codigo = codificador.empacotar(destino)
+    vazio = codificador.posicao_vazio(codigo)
+    componentes = motor.inicial(codigo)
+    for _ in range(300):
+        para = codificador.movimentos[vazio][rng.integers(len(codificador.movimentos[vazio]))]
+        codigo, peca = codificador.mover(codigo, vazio, para)
+        componentes = motor.filho(componentes, codigo, peca, para, vazio)
+        vazio = para
+        assert componentes == motor.inicial(codigo)
+
+
+def test_destino_tem_heuristica_zero():
+    codificador = Codificador(3)
+    destino = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+    motor = MotorHeuristico(destino, codificador)
+    componentes = motor.inicial(codificador.empacotar(destino))
+    assert [motor.valor(componentes, h) for h in (1, 2, 3, 4)] == [0, 0, 0, 0]
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+
+def check_path(engine, path, src, dest):
+    """Celulas livres, vizinhas a cada passo e sem cortar quina bloqueada"""
+    assert tuple(path[0]) == src and tuple(path[-1]) == dest
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        assert max(abs(r1 - r2), abs(c1 - c2)) == 1
+        assert engine.is_unblocked(r2, c2)
+        if r1 != r2 and c1 != c2 and not engine.corner_cutting:
+            assert engine.is_unblocked(r1, c2) and engine.is_unblocked(r2, c1)
+
+
+@pytest.mark.parametrize("cluster_size", [8, 16])
+def test_hpa_close_to_astar(grid_case, cluster_size):
+    engine, src, dest, cost = grid_case
+    path = engine.hierarchy(cluster_size).search(src, dest)
+    check_path(engine, path, src, dest)
+    #quase otimo: nunca abaixo do A*, e perto dele nestas grades
+    assert cost - 1e-9 <= engine.path_cost(path) <= 1.1 * cost
+
+
+def test_hpa_after_changes(grid_case):
+    engine, src, dest, _ = grid_case
+    engine.hierarchy(8)
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        changes = [(int(r), int(c), int(v)) for r, c, v in
+                   zip(rng.integers(0, engine.rows, 20), rng.integers(0, engine.cols, 20), rng.integers(0, 2, 20))
+                   if (r, c) not in (src, dest)]
+        engine.set_cells(changes)
+        reference = engine.query(src, dest)
+        result = engine.query(src, dest, algorithm="hpa")
+        assert result.found == reference.found
+        if result.found:
+            check_path(engine, result.path.tolist(), src, dest)
+            assert result.cost >= reference.cost - 1e-9
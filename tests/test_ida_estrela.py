@@ -0,0 +1,10 @@
+def test_ida_estrela_mesmo_custo_do_a_estrela(puzzle3, board3, a_star_cost, check_solution):
+    depth, board = board3
+    solucao, metricas = puzzle3.busca_ida_estrela(board, puzzle3.matriz_destino, 1)
+    assert check_solution(puzzle3, solucao, board) == metricas.profundidade
+    assert metricas.profundidade == a_star_cost(puzzle3, board) == depth
+
+
+def test_ida_estrela_15_puzzle(puzzle4, board4, a_star_cost, check_solution):
+    solucao, metricas = puzzle4.busca_ida_estrela(board4, puzzle4.matriz_destino, 1)
+    assert check_solution(puzzle4, solucao, board4) == a_star_cost(puzzle4, board4)
@@ -0,0 +1,27 @@
+import pytest
+
+from grid_engine import GridEngine
+
+
+def test_jps_same_cost_as_astar(grid_case):
+    engine, src, dest, cost = grid_case
+    result = engine.query(src, dest, algorithm="jps")
+    assert result.cost == pytest.approx(cost)
+    assert engine.path_cost(result.path.tolist()) == pytest.approx(cost)
+
+
+def test_jps_other_diagonal_cost(grid_case):
+    engine, src, dest, _ = grid_case
+    engine = GridEngine(engine.padded[1:-1, 1:-1], diagonal_cost=1.5)
+    cost = engine.query(src, dest).cost
+    assert engine.query(src, dest, algorithm="jps").cost == pytest.approx(cost)
+
+
+def test_jps_no_path(grid_case):
+    engine, src, dest, _ = grid_case
+    row, col = dest
+    #cerca o destino
+    engine.set_cells([(r, c, 0) for r in range(row - 1, row + 2) for c in range(col - 1, col + 2)
+                      if engine.is_valid(r, c) and (r, c) != dest])
+    result = engine.query(src, dest, algorithm="jps")
+    assert not result.found and result.cost == float("inf")
@@ -0,0 +1,67 @@
+import os
+
+import numpy as np
+import pytest
+
+import landmarks
+from landmarks import Landmarks
+
+
+@pytest.fixture
+def landmark_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(landmarks, "LANDMARK_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_alt_same_cost_as_astar(grid_case, landmark_dir):
+    engine, src, dest, cost = grid_case
+    result = engine.query(src, dest, heuristic="landmarks")
+    assert result.cost == pytest.approx(cost)
+    assert result.expansions <= engine.query(src, dest).expansions
+
+
+def test_alt_admissible(grid_case, landmark_dir):
+    engine, src, dest, _ = grid_case
+    goal = engine.index(*dest)
+    h = Landmarks.get(engine).heuristic(goal)
+    for row in range(0, engine.rows, 7):
+        for col in range(0, engine.cols, 7):
+            if engine.is_unblocked(row, col):
+                exact = engine.query((row, col), dest).cost
+                assert h(engine.index(row, col)) <= exact + 1e-9
+
+
+def test_alt_edited_grid_keeps_one_table(grid_case, landmark_dir):
+    engine, src, dest, _ = grid_case
+    engine.landmarks()
+    assert len(os.listdir(landmark_dir)) == 1
+    for step in range(3):
+        engine.set_cells([(1, step, 0)])
+        reference = engine.query(src, dest).cost
+        assert engine.query(src, dest, heuristic="landmarks").cost == pytest.approx(reference)
+    #versoes editadas da grade ficam so em memoria
+    assert len(os.listdir(landmark_dir)) == 1
+
+
+def test_alt_float32_table(grid_case, landmark_dir):
+    engine, src, dest, _ = grid_case
+    table = Landmarks.get(engine)
+    assert table.table.dtype == np.float32
+    (name,) = os.listdir(landmark_dir)
+    assert "_f32_" in name
+    assert np.load(landmark_dir / name, mmap_mode="r").dtype == np.float32
+    #h sem NumPy: float do Python, nunca negativo, 0 no proprio destino
+    goal = engine.index(*dest)
+    h = table.heuristic(goal)
+    assert h(goal) == 0.0
+    assert type(h(engine.index(*src))) is float
+
+
+def test_alt_float32_stays_below_float64(grid_case, landmark_dir):
+    engine, src, dest, _ = grid_case
+    table = Landmarks.get(engine)
+    wide = table.table.astype(np.float64)
+    goal = engine.index(*dest)
+    h = table.heuristic(goal)
+    for idx in np.flatnonzero(engine.padded)[::11]:
+        assert h(int(idx)) <= np.abs(wide[idx] - wide[goal]).max() + 1e-12
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from lista_aberta import ListaAbertaBaldes, ListaAbertaHeap, criar_lista_aberta
+
+LISTAS = [ListaAbertaBaldes, ListaAbertaHeap]
+
+
+@pytest.mark.parametrize("Lista", LISTAS)
+def test_menor_f_depois_maior_g_depois_ultimo(Lista):
+    lista = Lista()
+    for f, g, item in [(5, 1, "a"), (3, 0, "b"), (5, 3, "c"), (3, 2, "d"), (3, 2, "e"), (4, 4, "f")]:
+        lista.inserir(f, g, item)
+    assert len(lista) == 6
+    assert [lista.remover() for _ in range(6)] == ["e", "d", "b", "f", "c", "a"]
+    assert len(lista) == 0
+
+
+@pytest.mark.parametrize("Lista", LISTAS)
+def test_vazia(Lista):
+    lista = Lista()
+    with pytest.raises(IndexError):
+        lista.remover()
+    lista.inserir(2, 1, "x")
+    assert lista.remover() == "x"
+    with pytest.raises(IndexError):
+        lista.remover()
+
+
+def test_baldes_f_menor_que_o_atual():
+    #f_min ja avancou ate 7; um item inserido com f menor ainda sai primeiro
+    lista = ListaAbertaBaldes()
+    lista.inserir(7, 0, "longe")
+    lista.inserir(7, 1, "longe2")
+    assert lista.remover() == "longe2"
+    assert lista.f_min == 7
+    lista.inserir(2, 0, "perto")
+    assert lista.f_min == 2
+    assert [lista.remover(), lista.remover()] == ["perto", "longe"]
+
+
+def test_baldes_sem_pilhas_vazias_no_fim():
+    lista = ListaAbertaBaldes()
+    lista.inserir(1, 5, "a")
+    lista.inserir(1, 0, "b")
+    lista.remover()
+    assert len(lista.baldes[1]) == 1 and lista.baldes[1][-1] == ["b"]
+
+
+def test_heap_primeiro_nao_retira():
+    lista = ListaAbertaHeap()
+    lista.inserir(1.5, 1, "a")
+    lista.inserir(1.5, 2, "b")
+    assert lista.primeiro() == (1.5, 2, "b")
+    assert len(lista) == 2
+
+
+def test_baldes_e_heap_na_mesma_ordem():
+    #sequencia aleatoria de insercoes e remocoes, com f nunca abaixo do ultimo removido (como no A*)
+    rng = random.Random(0)
+    baldes, heap = ListaAbertaBaldes(), ListaAbertaHeap()
+    f_atual = 0
+    for passo in range(3000):
+        if len(heap) and rng.random() < 0.45:
+            item = heap.remover()
+            assert baldes.remover() == item
+            f_atual = item[0]
+        else:
+            f, g = f_atual + rng.randrange(4), rng.randrange(20)
+            baldes.inserir(f, g, (f, g, passo))
+            heap.inserir(f, g, (f, g, passo))
+    while len(heap):
+        assert baldes.remover() == heap.remover()
+    assert len(baldes) == 0
+
+
+def test_criar_lista_aberta():
+    assert isinstance(criar_lista_aberta(True), ListaAbertaBaldes)
+    assert isinstance(criar_lista_aberta(False), ListaAbertaHeap)
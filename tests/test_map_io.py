@@ -0,0 +1,106 @@
+import os
+
+import numpy as np
+import pytest
+
+import map_io
+from grid_engine import GridEngine
+
+MAPS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "mapas")
+
+SMALL_MAP = """type octile
+height 3
+width 5
+map
+.@T..
+.GSW.
+@...O
+"""
+
+
+@pytest.fixture
+def small_map(tmp_path):
+    path = tmp_path / "small.map"
+    path.write_text(SMALL_MAP)
+    return str(path)
+
+
+def test_le_map_com_borda(small_map):
+    padded = map_io.read_movingai_map(small_map)
+    assert padded.dtype == np.uint8 and padded.shape == (5, 7)
+    assert np.array_equal(padded[1:-1, 1:-1], [[1, 0, 0, 1, 1],
+                                               [1, 1, 1, 0, 1],
+                                               [0, 1, 1, 1, 0]])
+    assert not padded[0].any() and not padded[-1].any()
+    assert not padded[:, 0].any() and not padded[:, -1].any()
+
+
+def test_map_com_erros(tmp_path):
+    no_width = tmp_path / "no_width.map"
+    no_width.write_text("type octile\nheight 1\nmap\n...\n")
+    with pytest.raises(ValueError, match="width"):
+        map_io.read_movingai_map(str(no_width))
+    short = tmp_path / "short.map"
+    short.write_text("type octile\nheight 2\nwidth 3\nmap\n...\n..\n")
+    with pytest.raises(ValueError, match="Linha 1"):
+        map_io.read_movingai_map(str(short))
+
+
+def test_binario_ida_e_volta(small_map, tmp_path):
+    padded = map_io.read_movingai_map(small_map)
+    path = str(tmp_path / "sub" / "small.grid")
+    map_io.write_binary(padded, path)
+    assert os.path.getsize(path) == map_io.HEADER.size + padded.size
+    loaded = map_io.read_binary(path)
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, padded)
+    #copy-on-write: o motor altera a grade sem mexer no arquivo
+    engine = map_io.open_map(path)
+    engine.set_cells([(0, 0, 0)])
+    assert np.array_equal(map_io.read_binary(path), padded)
+
+
+def test_binario_com_magica_errada(tmp_path):
+    path = tmp_path / "bad.grid"
+    path.write_bytes(map_io.HEADER.pack(b"XXXX", 1, 1, 0) + bytes(9))
+    with pytest.raises(ValueError):
+        map_io.read_binary(str(path))
+
+
+def test_open_map_mesmo_motor(small_map, tmp_path):
+    from_map = map_io.open_map(small_map)
+    path = str(tmp_path / "small.grid")
+    map_io.write_binary(map_io.read_movingai_map(small_map), path)
+    from_binary = map_io.open_map(path)
+    assert (from_map.rows, from_map.cols) == (from_binary.rows, from_binary.cols) == (3, 5)
+    assert from_map.query((0, 0), (1, 4)).cost == from_binary.query((0, 0), (1, 4)).cost
+
+
+def test_iter_scenarios(tmp_path):
+    path = tmp_path / "small.map.scen"
+    path.write_text("version 1\n"
+                    "0\tsmall.map\t5\t3\t0\t0\t4\t1\t4.41421356\n"
+                    "\n"
+                    "3\tsmall.map\t5\t3\t1\t2\t3\t2\t2\n")
+    scenarios = list(map_io.iter_scenarios(str(path)))
+    #x eh a coluna e y a linha no .scen: aqui sai (linha, coluna)
+    assert scenarios == [(0, "small.map", (0, 0), (1, 4), 4.41421356),
+                         (3, "small.map", (2, 1), (2, 3), 2.0)]
+
+
+@pytest.mark.parametrize("name", ["rooms_128.map", "random25_128.map"])
+def test_cenarios_do_movingai(name):
+    #custos do .scen sao octis sem cortar quinas: o padrao do GridEngine
+    engine = map_io.open_map(os.path.join(MAPS_DIR, name))
+    scenarios = list(map_io.iter_scenarios(os.path.join(MAPS_DIR, name + ".scen")))
+    assert len(scenarios) == 40
+    for _, map_name, src, dest, optimal in scenarios[::5]:
+        assert map_name == name
+        assert engine.query(src, dest).cost == pytest.approx(optimal, abs=1e-6)
+
+
+def test_from_padded_exige_borda():
+    with pytest.raises(ValueError):
+        GridEngine.from_padded(np.ones((4, 4), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        GridEngine.from_padded(np.zeros((4, 4), dtype=np.int64))
@@ -0,0 +1,123 @@
+import json
+
+import numpy as np
+import pytest
+
+from grid_engine import GridEngine
+from observador import Observador
+from search_observer import SearchObserver
+
+
+def busca_simulada(observer, estados):
+    """Seis insercoes e tres expansoes (lista aberta com 2, 5 e 3), sobrando 1 entrada de 4 estados distintos"""
+    inserir = observer.timed(lambda *args: None, observer.PHASES[1], count_pushes=True)
+    observer.start(5)
+    for _ in range(6):
+        inserir(0, 0)
+    for estado, g, aberta in zip(estados, (0, 1, 2), (2, 5, 3)):
+        observer.expanded(estado, g, aberta)
+    observer.finish(remaining=1, distinct=4)
+
+
+@pytest.mark.parametrize("Observer", [SearchObserver, Observador])
+def test_contadores(Observer):
+    observer = Observer()
+    busca_simulada(observer, (6, 7, 8))
+    assert (observer.expansions, observer.pushes) == (3, 6)
+    assert observer.duplicates == 6 - 3 - 1
+    assert observer.improved == 6 - 4
+    assert observer.peak_open == 5
+    assert observer.total_time >= sum(observer.times.values())
+
+
+def test_amostragem_e_callback():
+    calls = []
+    observer = SearchObserver(sample_every=2, on_expand=lambda *args: calls.append(args))
+    busca_simulada(observer, (6, 7, 8))
+    #largura 5 com borda: o indice 7 eh a celula (0, 1) da grade original
+    assert calls == [(0, 1, 1, 5)]
+    assert len(observer.events) == 1
+    with pytest.raises(ValueError):
+        SearchObserver(sample_every=0)
+    with pytest.raises(ValueError):
+        Observador(amostragem=0)
+
+
+def test_json_e_trace_da_grade(tmp_path):
+    observer = SearchObserver()
+    busca_simulada(observer, (6, 7, 8))
+    observer.save_json(tmp_path / "perfil.json")
+    data = json.loads((tmp_path / "perfil.json").read_text())
+    assert data["duplicates"] == 2 and data["improved"] == 2 and data["peak_open"] == 5
+    assert set(data["times"]) == {"heuristic", "queue", "expansion"}
+    assert [(e["row"], e["col"], e["g"], e["open"]) for e in data["events"]] == [
+        (0, 0, 0, 2), (0, 1, 1, 5), (0, 2, 2, 3)]
+
+    observer.save_chrome_trace(tmp_path / "trace.json")
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    events = trace["traceEvents"]
+    assert events[0]["name"] == "search" and events[0]["ph"] == "X"
+    assert events[0]["args"] == json.loads(json.dumps(observer.to_dict()))
+    assert [e["ph"] for e in events[1:]] == ["i", "C"] * 3
+    assert events[3]["args"] == {"row": 0, "col": 1, "g": 1}
+    assert events[4]["args"] == {"size": 5}
+    assert [e["ts"] for e in events[1::2]] == sorted(e["ts"] for e in events[1::2])
+
+
+def test_json_e_trace_do_puzzle(tmp_path):
+    observador = Observador()
+    busca_simulada(observador, (0x123, 0x456, 0x789))
+    observador.salvar_json(tmp_path / "perfil.json")
+    data = json.loads((tmp_path / "perfil.json").read_text())
+    assert data["duplicados"] == 2 and data["melhorados"] == 2 and data["pico_aberta"] == 5
+    assert set(data["tempos"]) == {"heuristica", "fila", "tabela_hash", "expansao"}
+    assert [(e["codigo"], e["g"], e["aberta"]) for e in data["eventos"]] == [
+        (0x123, 0, 2), (0x456, 1, 5), (0x789, 2, 3)]
+
+    observador.salvar_trace_chrome(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert events[0]["name"] == "busca_a_estrela"
+    assert events[0]["args"]["insercoes"] == 6
+    assert events[1]["name"] == "expansao" and events[1]["args"] == {"codigo": 0x123, "g": 0}
+    assert events[2]["name"] == "lista_aberta" and events[2]["args"] == {"tamanho": 2}
+
+
+def test_grade_real(grid_case):
+    engine, src, dest, cost = grid_case
+    observer = SearchObserver()
+    result = engine.query(src, dest, observer=observer)
+    assert result.cost == cost
+    assert observer.expansions == result.expansions and observer.pushes == result.pushes
+    #cada insercao foi expandida, descartada como antiga ou ficou na lista
+    assert observer.duplicates >= 0 and observer.improved >= 0
+    assert observer.pushes >= observer.expansions + observer.duplicates
+    assert observer.peak_open == max(event[3] for event in observer.events)
+
+
+def test_puzzle_real(puzzle3, board3):
+    depth, board = board3
+    observador = Observador(memoria=True)
+    _, metricas = puzzle3.busca_a_estrela(board, puzzle3.matriz_destino, 1, observador=observador)
+    assert metricas.perfil is observador and metricas.profundidade == depth
+    assert observador.expansions == metricas.nodos_expandidos
+    assert observador.duplicates >= 0 and observador.improved >= 0
+    assert observador.peak_memory > 0
+    assert "pico da lista aberta" in str(metricas)
+    #amostras com o codigo empacotado: a primeira eh o tabuleiro inicial
+    assert observador.events[0][1] == {"codigo": puzzle3.codificador.empacotar(board)}
+
+
+def test_hamming_gera_duplicados(puzzle3):
+    #Hamming eh fraca o bastante para o mesmo estado entrar mais de uma vez na lista
+    board = np.array([[8, 2, 3], [5, 0, 6], [1, 7, 4]])  #profundidade 20
+    observador = Observador()
+    puzzle3.busca_a_estrela(board, puzzle3.matriz_destino, 2, observador=observador)
+    assert observador.improved > 0
+    assert observador.duplicates > 0
+
+
+def test_grade_sem_borda_nos_eventos():
+    engine = GridEngine(np.ones((1, 3), dtype=np.uint8))
+    observer = SearchObserver()
+    engine.query((0, 0), (0, 2), observer=observer)
+    assert [event[1] for event in observer.events] == [{"row": 0, "col": c} for c in range(3)]
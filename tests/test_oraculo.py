@@ -0,0 +1,65 @@
+import itertools
+import os
+
+import numpy as np
+import pytest
+
+from estado_compacto import Codificador
+from oraculo import INALCANCAVEL, TabelaDistancias, gravar_atomico, rank_permutacao
+
+DESTINO = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+
+
+@pytest.fixture(scope="module")
+def tabela(tmp_path_factory):
+    caminho = tmp_path_factory.mktemp("tabelas") / "distancias.bin"
+    return TabelaDistancias.obter(DESTINO, Codificador(3), str(caminho))
+
+
+def test_rank_eh_bijecao_no_2x2():
+    codificador = Codificador(2)
+    ranks = [rank_permutacao(codificador.empacotar(p), codificador) for p in itertools.permutations(range(4))]
+    # permutations sai em ordem lexicográfica: o rank de Lehmer é a própria posição
+    assert ranks == list(range(24))
+
+
+def test_distribuicao_das_distancias(tabela):
+    distancias = np.asarray(tabela.distancias)
+    assert np.count_nonzero(distancias == INALCANCAVEL) == 9 * 8 * 7 * 6 * 5 * 4 * 3 * 2 // 2
+    alcancaveis = distancias[distancias != INALCANCAVEL]
+    # O 8-puzzle tem diâmetro 31, com só dois estados a essa distância
+    assert alcancaveis.max() == 31
+    assert np.count_nonzero(alcancaveis == 31) == 2
+    assert np.count_nonzero(alcancaveis == 0) == 1
+
+
+def test_vizinhos_diferem_de_um(tabela):
+    codificador = tabela.codificador
+    for matriz in np.random.default_rng(0).permuted(np.tile(np.arange(9), (50, 1)), axis=1):
+        codigo = codificador.empacotar(matriz)
+        distancia = tabela.distancia(codigo)
+        if distancia is None:
+            continue
+        for vizinho, _, _ in codificador.vizinhos(codigo, codificador.posicao_vazio(codigo)):
+            assert abs(tabela.distancia(vizinho) - distancia) == 1
+
+
+def test_descer_resolve_sem_busca(tabela):
+    codificador = tabela.codificador
+    codigo = codificador.empacotar([[8, 6, 7], [2, 5, 4], [3, 0, 1]])  # um dos estados a 31 movimentos
+    caminho = tabela.descer(codigo)
+    assert len(caminho) == 32 and caminho[-1] == codificador.empacotar(DESTINO)
+    sem_solucao = codificador.empacotar([[2, 1, 3], [4, 5, 6], [7, 8, 0]])
+    assert tabela.distancia(sem_solucao) is None and tabela.descer(sem_solucao) is None
+
+
+def test_recusa_tabuleiro_maior_antes_de_alocar():
+    with pytest.raises(ValueError):
+        TabelaDistancias.construir(np.arange(16).reshape(4, 4), Codificador(4))
+
+
+def test_gravar_atomico_nao_deixa_temporario(tmp_path):
+    caminho = tmp_path / "sub" / "tabela.bin"
+    gravar_atomico(str(caminho), np.arange(10, dtype=np.uint8))
+    assert np.fromfile(caminho, dtype=np.uint8).tolist() == list(range(10))
+    assert os.listdir(caminho.parent) == ["tabela.bin"]
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from grid_engine import GridEngine
+from path_cache import PathCache
+
+
+def open_grid(rows=10, cols=10):
+    return GridEngine(np.ones((rows, cols), dtype=np.uint8))
+
+
+def test_acerto_devolve_o_mesmo_caminho():
+    engine = open_grid()
+    cache = PathCache(engine, capacity=4)
+    first = cache.search((0, 0), (9, 9))
+    second = cache.search((0, 0), (9, 9))
+    assert second == first
+    assert (cache.hits, cache.suffix_hits, cache.misses) == (1, 0, 1)
+    #uma copia por chamada: mexer no resultado nao estraga o cache
+    second.clear()
+    assert cache.search((0, 0), (9, 9)) == first
+
+
+def test_sufixo_de_caminho_otimo():
+    engine = open_grid()
+    cache = PathCache(engine)
+    path = cache.search((0, 0), (9, 9))
+    generation = engine.generation
+    middle = path[4]
+    suffix = cache.search(middle, (9, 9))
+    assert suffix == path[4:]
+    assert cache.suffix_hits == 1 and cache.misses == 1
+    assert engine.generation == generation  #nenhuma busca nova
+    #o sufixo virou uma entrada propria
+    assert cache.search(middle, (9, 9)) == suffix and cache.hits == 1
+
+
+def test_sem_sufixos_fora_dos_algoritmos_otimos():
+    engine = open_grid(40, 40)
+    cache = PathCache(engine, algorithm="hpa")
+    path = cache.search((0, 0), (39, 39))
+    cache.search(path[3], (39, 39))
+    assert cache.suffix_hits == 0 and cache.misses == 2
+
+
+def test_lru_descarta_o_mais_antigo():
+    engine = open_grid()
+    cache = PathCache(engine, capacity=2)
+    cache.search((0, 0), (0, 5))
+    cache.search((1, 0), (1, 5))
+    cache.search((0, 0), (0, 5))  #acerto: (1, 0) passa a ser o mais antigo
+    cache.search((2, 0), (2, 5))
+    assert len(cache) == 2
+    keys = [key[1:] for key in cache.entries]
+    assert keys == [((0, 0), (0, 5)), ((2, 0), (2, 5))]
+    misses = cache.misses
+    cache.search((1, 0), (1, 5))
+    assert cache.misses == misses + 1
+
+
+def test_lru_tira_as_celulas_do_indice_por_destino():
+    engine = open_grid()
+    cache = PathCache(engine, capacity=1)
+    path = cache.search((0, 0), (0, 9))
+    cache.search((5, 0), (5, 9))
+    assert (0, 9) not in cache.by_dest
+    #a celula do caminho descartado nao vira acerto de sufixo
+    cache.search(path[3], (0, 9))
+    assert cache.suffix_hits == 0
+
+
+def test_set_cells_invalida():
+    engine = open_grid()
+    cache = PathCache(engine)
+    path = cache.search((0, 0), (0, 9))
+    assert path == [(0, col) for col in range(10)]
+    engine.set_cells([(0, 5, 0)])
+    assert len(cache) == 0 and not cache.by_dest
+    detour = cache.search((0, 0), (0, 9))
+    assert (0, 5) not in detour
+    assert cache.misses == 2 and cache.hits == 0
+    #a versao entra na chave: a mesma consulta depois da mudanca eh acerto da versao nova
+    cache.search((0, 0), (0, 9))
+    assert cache.hits == 1
+    assert all(key[0] == engine.version for key in cache.entries)
+
+
+def test_consultas_sem_caminho_ficam_guardadas():
+    grid = np.ones((5, 5), dtype=np.uint8)
+    grid[:, 2] = 0
+    engine = GridEngine(grid)
+    cache = PathCache(engine)
+    assert cache.search((0, 0), (0, 4)) is None
+    assert cache.search((0, 0), (0, 4)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_close_para_de_acompanhar():
+    engine = open_grid()
+    cache = PathCache(engine)
+    cache.search((0, 0), (9, 9))
+    cache.close()
+    engine.set_cells([(5, 5, 0)])
+    assert len(cache) == 1
+    assert engine.listeners == []
+
+
+def test_capacidade_invalida():
+    with pytest.raises(ValueError):
+        PathCache(open_grid(), capacity=0)
+
+
+def test_str_taxa():
+    cache = PathCache(open_grid())
+    cache.search((0, 0), (9, 9))
+    cache.search((0, 0), (9, 9))
+    assert "Taxa: 50.0%" in str(cache)
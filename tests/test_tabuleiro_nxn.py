@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+import supremacy
+from supremacy import SlidingPuzzle
+
+
+def inversoes(matriz):
+    pecas = [p for p in np.asarray(matriz).ravel() if p != 0]
+    return sum(1 for i in range(len(pecas)) for j in range(i + 1, len(pecas)) if pecas[i] > pecas[j])
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5])
+def test_destino_padrao(n):
+    destino = SlidingPuzzle(n).matriz_destino
+    assert destino.shape == (n, n)
+    assert destino.ravel().tolist() == list(range(1, n * n)) + [0]
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5])
+def test_movimentos_preservam_a_paridade(n):
+    # Tudo que sai do destino por movimentos válidos tem solução; trocar duas peças tira
+    puzzle = SlidingPuzzle(n)
+    rng = np.random.default_rng(n)
+    for _ in range(10):
+        matriz = puzzle.embaralhar(rng, 40)
+        assert puzzle.e_solucionavel(matriz)
+        trocada = matriz.copy()
+        (l1, c1), (l2, c2) = np.argwhere(trocada != 0)[:2]
+        trocada[l1, c1], trocada[l2, c2] = trocada[l2, c2], trocada[l1, c1]
+        assert not puzzle.e_solucionavel(trocada)
+
+
+def test_largura_par_conta_a_linha_do_vazio():
+    puzzle = SlidingPuzzle(4)
+    matriz = puzzle.matriz_destino.copy()
+    # Subir o vazio uma linha não muda a paridade total, só a repartição entre inversões e linha
+    matriz[3, 3], matriz[2, 3] = matriz[2, 3], matriz[3, 3]
+    assert inversoes(matriz) % 2 == 1
+    assert puzzle.e_solucionavel(matriz)
+
+
+def test_tamanho_errado_gera_erro():
+    puzzle = SlidingPuzzle(4)
+    with pytest.raises(ValueError):
+        puzzle.busca_ida_estrela(np.zeros((3, 3), dtype=int), puzzle.matriz_destino, 1)
+    with pytest.raises(ValueError):
+        SlidingPuzzle(1)
+
+
+def test_menu_aceita_tamanho_invalido_e_pergunta_de_novo(monkeypatch, capsys):
+    respostas = iter(["abc", "1", "3", "0"])
+    monkeypatch.setattr("builtins.input", lambda *_: next(respostas))
+    supremacy.main()
+    saida = capsys.readouterr().out
+    assert saida.count("entrada inválida") == 2
+    assert "Até logo" in saida
+
+
+def test_embaralhar_lote_3x3_distancia_exata(puzzle3):
+    tabela = puzzle3.tabela_distancias(puzzle3.matriz_destino)
+    tabuleiros = puzzle3.embaralhar_lote(np.random.default_rng(4), 50, limite_movimentos=14)
+    distancias = [tabela.distancia(puzzle3.codificador.empacotar(m)) for m in tabuleiros]
+    assert min(distancias) >= 10 and max(distancias) <= 14
+    # Limite acima da maior distância do 3x3 (31): fica na maior
+    fundos = puzzle3.embaralhar_lote(np.random.default_rng(5), 20, limite_movimentos=60)
+    assert max(tabela.distancia(puzzle3.codificador.empacotar(m)) for m in fundos) == 31
+
+
+def test_embaralhar_lote_mesma_semente(puzzle4):
+    a = puzzle4.embaralhar_lote(np.random.default_rng(6), 30)
+    b = puzzle4.embaralhar_lote(np.random.default_rng(6), 30)
+    assert np.array_equal(a, b)
+    assert a.shape == (30, 4, 4) and all(puzzle4.e_solucionavel(m) for m in a)
@@ -0,0 +1,66 @@
+from array import array
+
+# Valor de "movimento" do nó raiz (as direções reais vão de 0 a 3)
+RAIZ = 4
+
+
+def _coluna(bits):
+    """array('Q') quando o valor cabe em 64 bits; lista de ints do Python caso contrário"""
+    return array("Q") if bits <= 64 else []
+
+
+class ArmazemNos:
+    """
+    Armazena os nós da busca em arrays paralelos, um índice por nó, no
+    lugar de um objeto (com __dict__, matriz e pai) por nó.
+
+    Por nó ficam só: o código empacotado, g, a posição do vazio, os
+    componentes da heurística, se já foi expandido e a direção do vazio
+    vinda do pai (2 bits). O pai não é guardado: desfazendo o movimento
+    chega-se ao código do pai, e o dicionário indice leva ao nó dele.
+    O caminho só é remontado quando pedido.
+    """
+    def __init__(self, codificador, bits_componentes=64):
+        self.codificador = codificador
+        self.indice = {}  # código -> índice do nó
+        self.codigos = _coluna(codificador.bits * codificador.tamanho)
+        self.g = array("H")
+        self.vazios = bytearray()
+        self.movimentos = bytearray()
+        self.fechados = bytearray()
+        self.componentes = _coluna(bits_componentes)
+
+    def adicionar(self, codigo, g, vazio, movimento, componentes):
+        """Cria um nó novo e retorna o índice dele"""
+        i = len(self.g)
+        self.indice[codigo] = i
+        self.codigos.append(codigo)
+        self.g.append(g)
+        self.vazios.append(vazio)
+        self.movimentos.append(movimento)
+        self.fechados.append(0)
+        self.componentes.append(componentes)
+        return i
+
+    def atualizar(self, i, g, movimento, componentes):
+        """Um caminho melhor até o nó i foi encontrado"""
+        self.g[i] = g
+        self.movimentos[i] = movimento
+        self.componentes[i] = componentes
+
+    def __len__(self):
+        return len(self.g)
+
+    def direcoes_ate(self, i):
+        """Direções do vazio, da raiz até o nó i, obtidas desfazendo os movimentos"""
+        codificador = self.codificador
+        direcoes = []
+        while self.movimentos[i] != RAIZ:
+            direcao = self.movimentos[i]
+            vazio = self.vazios[i]
+            vazio_pai = vazio - codificador.passos[direcao]
+            codigo_pai, _ = codificador.mover(self.codigos[i], vazio, vazio_pai)
+            direcoes.append(direcao)
+            i = self.indice[codigo_pai]
+        direcoes.reverse()
+        return direcoes
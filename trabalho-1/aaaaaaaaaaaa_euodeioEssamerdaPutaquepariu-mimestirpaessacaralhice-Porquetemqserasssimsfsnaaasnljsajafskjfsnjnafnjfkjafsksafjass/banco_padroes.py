@@ -0,0 +1,210 @@
+import mmap
+import os
+import sys
+
+import numpy as np
+
+from estado_compacto import Codificador
+from oraculo import DIRETORIO_TABELAS, gravar_atomico
+
+# Partições disjuntas padrão (peças de cada padrão) por largura do tabuleiro
+PARTICOES_PADRAO = {
+    3: ((1, 2, 3, 4), (5, 6, 7, 8)),
+    4: ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4)),  # 6-6-3
+    5: ((1, 2, 6, 7), (3, 4, 8, 9), (5, 10, 15, 20),
+        (11, 12, 16, 17), (13, 14, 18, 19), (21, 22, 23, 24)),
+}
+
+DESCONHECIDO = 255
+
+
+def arranjos(n, k):
+    """Número de k-permutações de n elementos: n! / (n - k)!"""
+    total = 1
+    for i in range(k):
+        total *= n - i
+    return total
+
+
+def rank_posicoes(posicoes, tamanho):
+    """
+    Rank vetorizado das posições das peças de um padrão (uma linha por estado),
+    em [0, arranjos(tamanho, k)). Mesmo esquema de Lehmer de rank_permutacao.
+    """
+    rank = np.zeros(len(posicoes), dtype=np.int64)
+    for i in range(posicoes.shape[1]):
+        digito = posicoes[:, i].astype(np.int64)
+        for j in range(i):
+            digito -= posicoes[:, j] < posicoes[:, i]
+        rank = rank * (tamanho - i) + digito
+    return rank
+
+
+def construir_padrao(pecas, matriz_destino, codificador):
+    """
+    Gera o banco de um padrão por BFS reversa no espaço abstrato
+    (posições das peças do padrão + posição do vazio).
+
+    Só os movimentos de peças do padrão custam 1; mover outra peça custa 0.
+    Assim os valores de padrões disjuntos podem ser somados sem perder a
+    admissibilidade. O valor final de cada arranjo é o mínimo sobre as
+    posições do vazio. A BFS avança um nível de cada vez sobre arrays NumPy.
+    """
+    n = codificador.n
+    tamanho = codificador.tamanho
+    k = len(pecas)
+    destino = np.asarray(matriz_destino).ravel()
+    posicao_destino = {int(numero): pos for pos, numero in enumerate(destino)}
+
+    # distancias[rank * tamanho + vazio]
+    distancias = np.full(arranjos(tamanho, k) * tamanho, DESCONHECIDO, dtype=np.uint8)
+
+    # Cada estado é uma linha: k posições das peças e, na última coluna, o vazio
+    fronteira = np.array([[posicao_destino[peca] for peca in pecas] + [posicao_destino[0]]], dtype=np.int8)
+    distancias[rank_posicoes(fronteira[:, :k], tamanho) * tamanho + fronteira[:, k]] = 0
+
+    deslocamentos = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+    def expandir(estados, custo_zero):
+        """Filhos dos estados pelos movimentos de custo 0 (custo_zero) ou de custo 1"""
+        filhos = []
+        vazio = estados[:, k].astype(np.int64)
+        linha, coluna = vazio // n, vazio % n
+        for move_linha, move_coluna in deslocamentos:
+            valido = ((linha + move_linha >= 0) & (linha + move_linha < n) &
+                      (coluna + move_coluna >= 0) & (coluna + move_coluna < n))
+            novo_vazio = vazio + move_linha * n + move_coluna
+            # Qual peça do padrão (se houver) está onde o vazio vai entrar
+            ocupa = estados[:, :k] == novo_vazio[:, None]
+            tem_peca = ocupa.any(axis=1)
+            selecionados = valido & (tem_peca != custo_zero)
+            filho = estados[selecionados].copy()
+            if not custo_zero:
+                # A peça desliza para a antiga posição do vazio
+                filho[:, :k][ocupa[selecionados]] = vazio[selecionados]
+            filho[:, k] = novo_vazio[selecionados]
+            filhos.append(filho)
+        return np.concatenate(filhos)
+
+    def novos(estados, nivel):
+        """Marca e devolve (sem repetição) os estados ainda não visitados"""
+        indices = rank_posicoes(estados[:, :k], tamanho) * tamanho + estados[:, k]
+        indices, primeiro = np.unique(indices, return_index=True)
+        livres = distancias[indices] == DESCONHECIDO
+        distancias[indices[livres]] = nivel
+        return estados[primeiro[livres]]
+
+    nivel = 0
+    while len(fronteira):
+        # Fecho pelos movimentos de custo 0 (o vazio andando entre peças de fora do padrão)
+        camada = [fronteira]
+        atual = fronteira
+        while len(atual):
+            atual = novos(expandir(atual, True), nivel)
+            camada.append(atual)
+        camada = np.concatenate(camada)
+        # Movimentos de peças do padrão levam ao próximo nível
+        nivel += 1
+        fronteira = novos(expandir(camada, False), nivel)
+
+    return distancias.reshape(-1, tamanho).min(axis=1)
+
+
+def caminho_padrao(pecas, codigo_destino, n):
+    """Nome do arquivo do banco de um padrão, ex.: tabelas/pdb_4x4_1-5-6-9-10-13_<destino>.bin"""
+    nome_pecas = "-".join(str(peca) for peca in pecas)
+    return os.path.join(DIRETORIO_TABELAS, f"pdb_{n}x{n}_{nome_pecas}_{codigo_destino:x}.bin")
+
+
+class BancoPadroes:
+    """
+    Heurística de bancos de padrões aditivos disjuntos (PDB).
+
+    Cada padrão tem sua tabela em disco (um byte por arranjo das peças,
+    indexado pelo rank das posições), aberta com mmap somente leitura para
+    que vários processos de busca compartilhem a mesma cópia física.
+
+    Segue a interface do MotorHeuristico. Os "componentes" guardam as
+    posições de todas as peças empacotadas (inverso do código do tabuleiro)
+    junto com o valor total: quando uma peça se move, só o padrão dela é
+    reconsultado.
+    """
+    BITS_VALOR = 10
+
+    def __init__(self, tabelas, particao, codificador):
+        self.tabelas = tabelas
+        self.particao = tuple(tuple(pecas) for pecas in particao)
+        self.codificador = codificador
+        self.bits_componentes = codificador.bits * codificador.tamanho + self.BITS_VALOR
+        self.padrao_da_peca = [-1] * codificador.tamanho
+        for indice, pecas in enumerate(self.particao):
+            for peca in pecas:
+                self.padrao_da_peca[peca] = indice
+
+    @classmethod
+    def obter(cls, matriz_destino, codificador, particao=None):
+        """Abre os bancos do destino, gerando e salvando os que ainda não existem"""
+        particao = particao or PARTICOES_PADRAO[codificador.n]
+        codigo_destino = codificador.empacotar(matriz_destino)
+        tabelas = []
+        for pecas in particao:
+            caminho = caminho_padrao(pecas, codigo_destino, codificador.n)
+            if not os.path.exists(caminho):
+                # Outro processo pode abrir o mesmo banco enquanto este grava
+                gravar_atomico(caminho, construir_padrao(pecas, matriz_destino, codificador))
+            with open(caminho, "rb") as arquivo:
+                tabelas.append(mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ))
+        return cls(tabelas, particao, codificador)
+
+    def rank(self, inverso, indice):
+        """Rank das posições das peças do padrão, lidas do inverso empacotado"""
+        tamanho = self.codificador.tamanho
+        bits = self.codificador.bits
+        mascara = self.codificador.mascara
+        usados = 0
+        rank = 0
+        for i, peca in enumerate(self.particao[indice]):
+            pos = (inverso >> (bits * peca)) & mascara
+            rank = rank * (tamanho - i) + pos - (usados & ((1 << pos) - 1)).bit_count()
+            usados |= 1 << pos
+        return rank
+
+    def inicial(self, codigo):
+        codificador = self.codificador
+        inverso = 0
+        for pos in range(codificador.tamanho):
+            peca = codificador.peca(codigo, pos)
+            if peca != 0:  # o vazio não entra em nenhum padrão
+                inverso |= pos << (codificador.bits * peca)
+        valor = sum(tabela[self.rank(inverso, indice)] for indice, tabela in enumerate(self.tabelas))
+        return (inverso << self.BITS_VALOR) | valor
+
+    def filho(self, componentes, codigo, peca, de, para):
+        indice = self.padrao_da_peca[peca]
+        if indice < 0:
+            return componentes  # peça fora da partição não muda a heurística
+        tabela = self.tabelas[indice]
+        inverso = componentes >> self.BITS_VALOR
+        valor = componentes & ((1 << self.BITS_VALOR) - 1)
+        valor -= tabela[self.rank(inverso, indice)]
+        bits_peca = self.codificador.bits * peca
+        inverso += (para - de) << bits_peca
+        valor += tabela[self.rank(inverso, indice)]
+        return (inverso << self.BITS_VALOR) | valor
+
+    def valor(self, componentes, heuristica):
+        return componentes & ((1 << self.BITS_VALOR) - 1)
+
+
+def main():
+    """Gera os bancos da partição padrão: python banco_padroes.py <largura>"""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    codificador = Codificador(n)
+    matriz_destino = np.append(np.arange(1, n * n), 0).reshape(n, n)
+    print(f"Gerando bancos da partição {PARTICOES_PADRAO[n]}...")
+    BancoPadroes.obter(matriz_destino, codificador)
+    print(f"Bancos salvos em {DIRETORIO_TABELAS}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import numpy as np
+
+
+def destino_padrao(n):
+    """Estado objetivo padrão: 1..n²-1 em ordem e o espaço vazio no fim"""
+    return np.append(np.arange(1, n * n), 0).reshape(n, n)
+
+
+class Codificador:
+    """
+    Representação compacta dos estados do Sliding Puzzle.
+
+    O tabuleiro inteiro vira um único int: a peça da posição i (lida linha a
+    linha) ocupa os bits [4i, 4i + 4) (5 bits por peça a partir do 5x5,
+    que tem peças até 24). Assim o estado é barato de hashear e
+    comparar, e um movimento é só uma soma/subtração de dois deslocamentos,
+    sem passar por np.array nem tupla de tuplas.
+    """
+    def __init__(self, n=3):
+        self.n = n
+        self.tamanho = n * n
+        self.bits = max(4, (self.tamanho - 1).bit_length())
+        self.mascara = (1 << self.bits) - 1
+        self.deslocamentos = [self.bits * pos for pos in range(self.tamanho)]
+
+        # Deslocamento do vazio em cada direção: cima, baixo, esquerda, direita.
+        # A direção (0 a 3) cabe em 2 bits, e a direção ^ 1 é a inversa.
+        self.passos = (-n, n, -1, 1)
+
+        # movimentos[vazio] = posições para onde o espaço vazio pode ir
+        # movimentos_direcao[vazio] = os mesmos movimentos como (direção, posição)
+        self.movimentos = []
+        self.movimentos_direcao = []
+        for pos in range(self.tamanho):
+            linha, coluna = divmod(pos, n)
+            destinos = []
+            for direcao, (move_linha, move_coluna) in enumerate([(-1, 0), (1, 0), (0, -1), (0, 1)]):
+                nova_linha, nova_coluna = linha + move_linha, coluna + move_coluna
+                if 0 <= nova_linha < n and 0 <= nova_coluna < n:
+                    destinos.append((direcao, nova_linha * n + nova_coluna))
+            self.movimentos.append(tuple(destino for _, destino in destinos))
+            self.movimentos_direcao.append(tuple(destinos))
+
+    def empacotar(self, matriz):
+        """Converte uma matriz NumPy (ou lista de listas) para o inteiro compacto"""
+        codigo = 0
+        for pos, numero in enumerate(np.asarray(matriz).ravel()):
+            codigo |= int(numero) << self.deslocamentos[pos]
+        return codigo
+
+    def desempacotar(self, codigo):
+        """Converte o inteiro compacto de volta para uma matriz NumPy NxN"""
+        pecas = [(codigo >> desl) & self.mascara for desl in self.deslocamentos]
+        return np.array(pecas).reshape(self.n, self.n)
+
+    def peca(self, codigo, pos):
+        """Retorna a peça que está na posição pos"""
+        return (codigo >> self.deslocamentos[pos]) & self.mascara
+
+    def posicao_vazio(self, codigo):
+        """Procura a posição do espaço vazio (só é preciso no estado inicial)"""
+        for pos, desl in enumerate(self.deslocamentos):
+            if (codigo >> desl) & self.mascara == 0:
+                return pos
+        raise ValueError("Estado sem espaço vazio")
+
+    def mover(self, codigo, vazio, destino):
+        """
+        Desliza a peça de destino para o espaço vazio.
+        Retorna (novo código, peça movida); o novo vazio passa a ser destino.
+        """
+        peca = (codigo >> self.deslocamentos[destino]) & self.mascara
+        return (codigo
+                + (peca << self.deslocamentos[vazio])
+                - (peca << self.deslocamentos[destino])), peca
+
+    def reproduzir(self, codigo, direcoes):
+        """Aplica a sequência de direções do vazio e retorna todas as matrizes do caminho"""
+        vazio = self.posicao_vazio(codigo)
+        caminho = [self.desempacotar(codigo)]
+        for direcao in direcoes:
+            destino = vazio + self.passos[direcao]
+            codigo, _ = self.mover(codigo, vazio, destino)
+            vazio = destino
+            caminho.append(self.desempacotar(codigo))
+        return caminho
+
+    def vizinhos(self, codigo, vazio):
+        """Gera (código vizinho, nova posição do vazio, peça movida) para cada movimento"""
+        for destino in self.movimentos[vazio]:
+            novo_codigo, peca = self.mover(codigo, vazio, destino)
+            yield novo_codigo, destino, peca
@@ -0,0 +1,302 @@
+import numpy as np
+
+from estado_compacto import Codificador, destino_padrao
+from oraculo import INALCANCAVEL, TabelaDistancias
+
+# Cabeçalho do arquivo binário: assinatura + lado do tabuleiro (uint16 little-endian);
+# depois vêm os tabuleiros, n*n bytes cada, linha a linha
+ASSINATURA = b"PUZB"
+TAMANHO_CABECALHO = len(ASSINATURA) + 2
+
+
+def contar_inversoes_lote(permutacoes):
+    """
+    Número de inversões de cada linha de "permutacoes" (lote x tamanho, valores
+    0..tamanho-1), com uma árvore de Fenwick por linha: a linha é percorrida da
+    direita para a esquerda somando quantos valores menores já passaram.
+    O(tamanho log tamanho) por tabuleiro, vetorizado sobre o lote.
+    """
+    permutacoes = np.atleast_2d(np.asarray(permutacoes, dtype=np.int32))
+    lote, tamanho = permutacoes.shape
+    # Árvores lado a lado em um vetor só; a largura 2*tamanho acomoda os índices
+    # que passam do fim na atualização, então todas as linhas dão o mesmo número
+    # de passos (bit_length) sem filtrar quem já terminou
+    largura = 2 * tamanho
+    arvore = np.zeros(lote * largura, dtype=np.int32)
+    base = np.arange(lote, dtype=np.int32) * largura
+    passos = tamanho.bit_length()
+    inversoes = np.zeros(lote, dtype=np.int64)
+    for pos in range(tamanho - 1, -1, -1):
+        valores = permutacoes[:, pos]
+        # Consulta: quantos valores menores já foram vistos (prefixo 1..valores; a posição 0 fica zerada)
+        i = valores.copy()
+        for _ in range(passos):
+            inversoes += arvore[base + i]
+            i &= i - 1
+        # Atualização: marca o valor (índice valores + 1); linhas distintas nunca colidem
+        i = valores + 1
+        for _ in range(passos):
+            arvore[base + i] += 1
+            i += i & -i
+            i[i >= largura] = 0  # passou do fim: as próximas somas caem na posição 0 da própria linha
+        arvore[base] = 0
+    return inversoes
+
+
+def contar_inversoes(sequencia):
+    """
+    Inversões de uma permutação de 0..len-1 em O(n log n). Para um tabuleiro
+    só, a mesma árvore de Fenwick em Python puro sai mais barata que as
+    chamadas NumPy da versão em lote.
+    """
+    valores = np.asarray(sequencia).ravel().tolist()
+    tamanho = len(valores)
+    arvore = [0] * (tamanho + 1)
+    inversoes = 0
+    for valor in reversed(valores):
+        i = valor
+        while i > 0:
+            inversoes += arvore[i]
+            i &= i - 1
+        i = valor + 1
+        while i <= tamanho:
+            arvore[i] += 1
+            i += i & -i
+    return inversoes
+
+
+def paridade_lote(tabuleiros, n):
+    """
+    Mesma paridade de SlidingPuzzle.paridade para um lote (lote x n²):
+    inversões sem contar o vazio, mais a linha do vazio quando n é par.
+    O vazio (0) na posição p forma inversão com as p peças antes dele,
+    então basta descontar p da contagem da permutação inteira.
+    """
+    tabuleiros = np.atleast_2d(np.asarray(tabuleiros)).reshape(-1, n * n)
+    posicao_vazio = np.argmin(tabuleiros, axis=1)
+    inversoes = contar_inversoes_lote(tabuleiros) - posicao_vazio
+    if n % 2 == 0:
+        inversoes += posicao_vazio // n
+    return inversoes % 2
+
+
+def paridade(matriz):
+    """Paridade de um tabuleiro n x n, a mesma de paridade_lote"""
+    matriz = np.asarray(matriz)
+    n = matriz.shape[0]
+    pecas = matriz.ravel()
+    posicao_vazio = int(np.argmin(pecas))
+    inversoes = contar_inversoes(pecas) - posicao_vazio
+    if n % 2 == 0:
+        inversoes += posicao_vazio // n
+    return inversoes % 2
+
+
+def e_permutacao(matriz):
+    """Se o tabuleiro tem cada peça de 0 a n²-1 exatamente uma vez"""
+    pecas = np.asarray(matriz).ravel()
+    return bool(np.array_equal(np.sort(pecas), np.arange(len(pecas))))
+
+
+def e_solucionavel(matriz, matriz_destino=None):
+    """
+    Verifica se a configuração chega em matriz_destino (O(n log n) no número
+    de peças). Um tabuleiro com peças repetidas ou fora de 0..n²-1 não tem solução.
+    """
+    matriz = np.asarray(matriz)
+    n = matriz.shape[0]
+    if matriz_destino is None:
+        matriz_destino = destino_padrao(n)
+    if not e_permutacao(matriz):
+        return False
+    return paridade(matriz) == paridade(matriz_destino)
+
+
+def _trocar_paridade(tabuleiros):
+    """
+    Troca as duas primeiras peças que não são o vazio nas linhas dadas. O vazio
+    não sai do lugar, então a troca leva a metade sem solução na outra metade
+    de forma bijetora e o sorteio continua uniforme.
+    """
+    linhas = np.arange(len(tabuleiros))
+    vazio_primeiro = tabuleiros[:, 0] == 0
+    vazio_segundo = tabuleiros[:, 1] == 0
+    a = np.where(vazio_primeiro, 1, 0)
+    b = np.where(vazio_primeiro | vazio_segundo, 2, 1)
+    pecas_a = tabuleiros[linhas, a].copy()
+    tabuleiros[linhas, a] = tabuleiros[linhas, b]
+    tabuleiros[linhas, b] = pecas_a
+
+
+def _desranquear(ranks, tamanho):
+    """Inverso de oraculo.rank_permutacao para um lote de ranks (código de Lehmer)"""
+    ranks = np.asarray(ranks, dtype=np.int64).copy()
+    digitos = np.empty((len(ranks), tamanho), dtype=np.int64)
+    for pos in range(tamanho - 1, -1, -1):
+        base = tamanho - pos
+        digitos[:, pos] = ranks % base
+        ranks //= base
+    linhas = np.arange(len(ranks))
+    livres = np.ones((len(ranks), tamanho), dtype=bool)
+    permutacoes = np.empty((len(ranks), tamanho), dtype=np.uint8)
+    for pos in range(tamanho):
+        # O dígito é quantas peças menores ainda livres existem: pega a (dígito+1)-ésima livre
+        peca = np.argmax(np.cumsum(livres, axis=1) > digitos[:, pos:pos + 1], axis=1)
+        permutacoes[:, pos] = peca
+        livres[linhas, peca] = False
+    return permutacoes
+
+
+class SorteioProfundidade:
+    """Ranks de todos os estados 3x3 a uma distância exata do destino (via TabelaDistancias)"""
+    def __init__(self, matriz_destino, tabela=None):
+        self.tabela = tabela or TabelaDistancias.obter(matriz_destino, Codificador(3))
+        self.ranks = {}
+        distancias = np.asarray(self.tabela.distancias)
+        # Maior distância até o destino (31 no destino padrão)
+        self.maxima = int(distancias[distancias != INALCANCAVEL].max())
+
+    def sortear(self, profundidade, quantidade, rng):
+        if profundidade not in self.ranks:
+            self.ranks[profundidade] = np.flatnonzero(np.asarray(self.tabela.distancias) == profundidade)
+        ranks = self.ranks[profundidade]
+        if len(ranks) == 0:
+            raise ValueError(f"Nenhum estado a {profundidade} movimentos do destino")
+        return _desranquear(rng.choice(ranks, quantidade), 9)
+
+
+def gerar_lote(n, quantidade, rng=None, matriz_destino=None, profundidade=None, sorteio=None):
+    """
+    Gera "quantidade" tabuleiros n x n com solução (array quantidade x n x n, uint8),
+    uniformes entre todos os que chegam em matriz_destino.
+
+    Sem laço em Python por tabuleiro: as permutações saem de rng.permuted em
+    cada linha, a paridade de todas é calculada de uma vez e as linhas sem
+    solução têm duas peças trocadas. Com "profundidade" (só 3x3) o sorteio é
+    uniforme entre os estados a exatamente essa distância do destino, pela
+    tabela de distâncias do oráculo (gerada e salva em disco na primeira vez);
+    pode ser um número só ou um array com a profundidade de cada tabuleiro.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if matriz_destino is None:
+        matriz_destino = destino_padrao(n)
+    if n * n > 256:
+        raise ValueError("Tabuleiros de até 16x16 (uma peça por byte)")
+
+    if profundidade is not None:
+        if n != 3:
+            raise ValueError("A profundidade exata só está disponível para o tabuleiro 3x3")
+        if sorteio is None:
+            sorteio = SorteioProfundidade(matriz_destino)
+        if np.ndim(profundidade) == 0:
+            return sorteio.sortear(int(profundidade), quantidade, rng).reshape(quantidade, n, n)
+        profundidades = np.asarray(profundidade)
+        tabuleiros = np.empty((quantidade, n * n), dtype=np.uint8)
+        for valor in np.unique(profundidades):
+            linhas = np.flatnonzero(profundidades == valor)
+            tabuleiros[linhas] = sorteio.sortear(int(valor), len(linhas), rng)
+        return tabuleiros.reshape(quantidade, n, n)
+
+    tabuleiros = rng.permuted(np.tile(np.arange(n * n, dtype=np.uint8), (quantidade, 1)), axis=1)
+    sem_solucao = paridade_lote(tabuleiros, n) != paridade_lote(matriz_destino, n)[0]
+    if sem_solucao.any():
+        trocados = tabuleiros[sem_solucao]
+        _trocar_paridade(trocados)
+        tabuleiros[sem_solucao] = trocados
+    return tabuleiros.reshape(quantidade, n, n)
+
+
+def passeio_lote(n, passos, rng=None, matriz_destino=None):
+    """
+    Um tabuleiro por elemento de "passos": o vazio anda passos[i] casas
+    aleatórias a partir de matriz_destino (então sempre há solução). Todos os
+    passeios andam juntos, um passo NumPy por rodada para o lote inteiro.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if matriz_destino is None:
+        matriz_destino = destino_padrao(n)
+    passos = np.asarray(passos)
+    quantidade = len(passos)
+    # vizinhos[pos] = posições para onde o vazio pode ir (preenchido com -1) e quantas são
+    codificador = Codificador(n)
+    vizinhos = np.full((n * n, 4), -1, dtype=np.int64)
+    for pos, destinos in enumerate(codificador.movimentos):
+        vizinhos[pos, :len(destinos)] = destinos
+    quantos = (vizinhos >= 0).sum(axis=1)
+
+    tabuleiros = np.tile(np.asarray(matriz_destino, dtype=np.uint8).ravel(), (quantidade, 1))
+    vazios = np.full(quantidade, int(np.argmin(tabuleiros[0])) if quantidade else 0)
+    linhas = np.arange(quantidade)
+    for passo in range(int(passos.max(initial=0))):
+        andando = linhas[passos > passo]
+        vazio = vazios[andando]
+        escolha = (rng.random(len(andando)) * quantos[vazio]).astype(np.int64)
+        destino = vizinhos[vazio, escolha]
+        tabuleiros[andando, vazio] = tabuleiros[andando, destino]
+        tabuleiros[andando, destino] = 0
+        vazios[andando] = destino
+    return tabuleiros.reshape(quantidade, n, n)
+
+
+def gerar_lotes(n, total=None, lote=65536, semente=None, matriz_destino=None, profundidade=None):
+    """Gerador de lotes (ver gerar_lote); sem "total" não termina"""
+    rng = np.random.default_rng(semente)
+    sorteio = None
+    if profundidade is not None and n == 3:
+        sorteio = SorteioProfundidade(matriz_destino if matriz_destino is not None else destino_padrao(3))
+    gerados = 0
+    while total is None or gerados < total:
+        quantidade = lote if total is None else min(lote, total - gerados)
+        yield gerar_lote(n, quantidade, rng, matriz_destino, profundidade, sorteio)
+        gerados += quantidade
+
+
+def gerar_instancias(n, total=None, lote=65536, semente=None, matriz_destino=None, profundidade=None):
+    """Gerador de tabuleiros um a um (gerados internamente em lotes)"""
+    for tabuleiros in gerar_lotes(n, total, lote, semente, matriz_destino, profundidade):
+        yield from tabuleiros
+
+
+def gravar_binario(caminho, n, total, lote=65536, semente=None, matriz_destino=None, profundidade=None):
+    """Grava "total" tabuleiros no formato binário (ver ASSINATURA), lote a lote"""
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(ASSINATURA + n.to_bytes(2, "little"))
+        for tabuleiros in gerar_lotes(n, total, lote, semente, matriz_destino, profundidade):
+            arquivo.write(np.ascontiguousarray(tabuleiros, dtype=np.uint8).tobytes())
+
+
+def ler_binario(caminho):
+    """Tabuleiros de um arquivo gerado por gravar_binario (memmap somente leitura, total x n x n)"""
+    with open(caminho, "rb") as arquivo:
+        cabecalho = arquivo.read(TAMANHO_CABECALHO)
+    if cabecalho[:len(ASSINATURA)] != ASSINATURA:
+        raise ValueError(f"{caminho} não é um arquivo de tabuleiros")
+    n = int.from_bytes(cabecalho[len(ASSINATURA):], "little")
+    tabuleiros = np.memmap(caminho, dtype=np.uint8, mode="r", offset=TAMANHO_CABECALHO)
+    if len(tabuleiros) % (n * n):
+        raise ValueError(f"{caminho} está truncado")
+    return tabuleiros.reshape(-1, n, n)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Gera tabuleiros com solução do sliding puzzle")
+    parser.add_argument("n", type=int, help="lado do tabuleiro")
+    parser.add_argument("total", type=int, help="quantidade de tabuleiros")
+    parser.add_argument("--saida", help="arquivo binário (sem ele os tabuleiros são impressos)")
+    parser.add_argument("--semente", type=int)
+    parser.add_argument("--profundidade", type=int, help="distância exata até o destino (só 3x3)")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    if args.saida:
+        gravar_binario(args.saida, args.n, args.total, semente=args.semente, profundidade=args.profundidade)
+        tempo = time.perf_counter() - inicio
+        print(f"{args.total} tabuleiros em {tempo:.2f} s ({args.total / tempo:,.0f}/s) -> {args.saida}")
+    else:
+        for matriz in gerar_instancias(args.n, args.total, semente=args.semente, profundidade=args.profundidade):
+            print(matriz, end="\n\n")
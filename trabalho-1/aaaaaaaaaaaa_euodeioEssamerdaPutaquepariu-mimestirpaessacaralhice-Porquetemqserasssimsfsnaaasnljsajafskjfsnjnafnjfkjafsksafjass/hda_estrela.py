@@ -0,0 +1,319 @@
+import multiprocessing
+import queue
+import traceback
+
+from armazem_nos import ArmazemNos, RAIZ
+from banco_padroes import BancoPadroes
+from estado_compacto import Codificador
+from heuristicas import HEURISTICAS_FRACIONARIAS, MotorHeuristico
+from lista_aberta import criar_lista_aberta
+from oraculo import TabelaDistancias
+
+# Multiplicador do hash de Fibonacci (2^64 / razão áurea): espalha os códigos entre os processos
+MULTIPLICADOR = 0x9E3779B97F4A7C15
+MASCARA_64 = (1 << 64) - 1
+
+# Segundos que o coordenador espera por uma mensagem antes de conferir se os processos seguem vivos
+ESPERA = 1.0
+
+
+def dono(codigo, trabalhadores):
+    """Processo responsável por um estado (a conta é a mesma em todos os processos)"""
+    return (((codigo * MULTIPLICADOR) & MASCARA_64) >> 32) % trabalhadores
+
+
+class EstatisticasTrabalhador:
+    """Contadores de um processo da busca paralela"""
+    def __init__(self, ident):
+        self.ident = ident
+        self.nodos_expandidos = 0
+        self.reabertos = 0     # nós já expandidos que chegaram depois com g menor
+        self.duplicados = 0    # nós descartados por já existirem com g menor ou igual
+        self.enviados = 0      # lotes de nós mandados a outros processos
+        self.recebidos = 0     # lotes de nós recebidos
+
+    def to_dict(self):
+        return dict(vars(self))
+
+
+def abrir_motor(matriz_destino, codificador, heuristica):
+    """
+    Motor da heurística (mesma escolha de SlidingPuzzle.motor_heuristico). As
+    tabelas 5 e 6 são abertas do disco: cada processo mapeia os mesmos arquivos
+    em vez de receber uma cópia (um mmap não pode ser serializado com spawn).
+    """
+    if heuristica == 5:
+        return TabelaDistancias.obter(matriz_destino, codificador)
+    if heuristica == 6:
+        return BancoPadroes.obter(matriz_destino, codificador)
+    return MotorHeuristico(matriz_destino, codificador)
+
+
+def _trabalhador(ident, n, matriz_destino, heuristica, caixas, controle, lote):
+    """Processo do HDA*: qualquer exceção vai para o coordenador em vez de sumir com o processo"""
+    try:
+        codificador = Codificador(n)
+        motor = abrir_motor(matriz_destino, codificador, heuristica)
+        _laco_trabalhador(ident, codificador, motor, heuristica, codificador.empacotar(matriz_destino),
+                          caixas, controle, lote)
+    except BaseException:
+        controle.put(("erro", ident, traceback.format_exc()))
+
+
+def _laco_trabalhador(ident, codificador, motor, heuristica, codigo_destino, caixas, controle, lote):
+    """
+    Laço de um processo do HDA*. Cada processo guarda só os estados que são
+    dele (pelo hash) em um ArmazemNos e uma lista aberta próprios; os filhos
+    de outros donos vão para saidas[dono] e seguem em lotes pelas caixas.
+
+    Mensagens recebidas na caixa:
+    ("nos", lista de (codigo, g, vazio, direcao, componentes)), ("limite", custo),
+    ("sonda", rodada), ("direcao", codigo) e ("fim",).
+    """
+    trabalhadores = len(caixas)
+    caixa = caixas[ident]
+    mover = codificador.mover
+    valor = motor.valor
+    filho = motor.filho
+    movimentos_direcao = codificador.movimentos_direcao
+
+    estatisticas = EstatisticasTrabalhador(ident)
+    custos_inteiros = heuristica not in HEURISTICAS_FRACIONARIAS
+    lista_aberta = criar_lista_aberta(custos_inteiros)
+    armazem = ArmazemNos(codificador, motor.bits_componentes)
+    indice = armazem.indice
+    g = armazem.g
+    fechados = armazem.fechados
+    saidas = [[] for _ in range(trabalhadores)]
+    limite = float('inf')  # custo da melhor solução conhecida: nada com f >= limite é expandido
+    avisou = True          # já avisou o coordenador que ficou ocioso
+
+    def inserir(codigo, novo_g, vazio, direcao, componentes):
+        """Recebe um nó deste processo (gerado aqui ou vindo de outro)"""
+        f = novo_g + valor(componentes, heuristica)
+        if f >= limite:
+            return
+        i = indice.get(codigo)
+        if i is None:
+            i = armazem.adicionar(codigo, novo_g, vazio, direcao, componentes)
+        elif novo_g >= g[i]:
+            estatisticas.duplicados += 1
+            return
+        else:
+            # Os nós chegam fora de ordem entre processos: um nó fechado pode ser reaberto
+            if fechados[i]:
+                fechados[i] = 0
+                estatisticas.reabertos += 1
+            armazem.atualizar(i, novo_g, direcao, componentes)
+        lista_aberta.inserir(f, novo_g, i)
+
+    while True:
+        # Caixa de entrada: espera bloqueado só quando não há o que expandir
+        ocioso = not lista_aberta
+        if ocioso and not avisou:
+            controle.put(("ocioso", ident))
+            avisou = True
+        while True:
+            try:
+                mensagem = caixa.get() if ocioso else caixa.get_nowait()
+            except queue.Empty:
+                break
+            ocioso = False
+            tipo = mensagem[0]
+            if tipo == "nos":
+                estatisticas.recebidos += 1
+                avisou = False
+                for no in mensagem[1]:
+                    inserir(*no)
+            elif tipo == "limite":
+                limite = min(limite, mensagem[1])
+            elif tipo == "sonda":
+                controle.put(("estado", mensagem[1], ident, not lista_aberta,
+                              estatisticas.enviados, estatisticas.recebidos))
+            elif tipo == "direcao":
+                i = indice[mensagem[1]]
+                controle.put(("direcao", mensagem[1], armazem.movimentos[i]))
+            elif tipo == "fim":
+                controle.put(("estatisticas", estatisticas))
+                return
+
+        # Expande até "lote" nós antes de mandar os filhos e olhar a caixa de novo
+        expandidos = 0
+        while lista_aberta and expandidos < lote:
+            atual = lista_aberta.remover()
+            if fechados[atual]:
+                continue  # entrada antiga na lista aberta
+            componentes_atual = armazem.componentes[atual]
+            g_atual = g[atual]
+            if g_atual + valor(componentes_atual, heuristica) >= limite:
+                # A lista sai em ordem de f: nada do que sobrou pode melhorar a solução
+                lista_aberta = criar_lista_aberta(custos_inteiros)
+                avisou = False
+                break
+            fechados[atual] = 1
+            expandidos += 1
+            codigo_atual = armazem.codigos[atual]
+            if codigo_atual == codigo_destino:
+                limite = g_atual
+                controle.put(("solucao", g_atual))
+                continue
+
+            vazio_atual = armazem.vazios[atual]
+            novo_g = g_atual + 1
+            for direcao, vazio_vizinho in movimentos_direcao[vazio_atual]:
+                codigo_vizinho, peca = mover(codigo_atual, vazio_atual, vazio_vizinho)
+                componentes = filho(componentes_atual, codigo_vizinho, peca, vazio_vizinho, vazio_atual)
+                destino = dono(codigo_vizinho, trabalhadores)
+                if destino == ident:
+                    inserir(codigo_vizinho, novo_g, vazio_vizinho, direcao, componentes)
+                elif novo_g + valor(componentes, heuristica) < limite:
+                    saidas[destino].append((codigo_vizinho, novo_g, vazio_vizinho, direcao, componentes))
+
+        if expandidos:
+            estatisticas.nodos_expandidos += expandidos
+            avisou = False
+        for destino, saida in enumerate(saidas):
+            if saida:
+                caixas[destino].put(("nos", saida))
+                estatisticas.enviados += 1
+                saidas[destino] = []
+
+
+def hda_estrela(codificador, motor, heuristica, matriz_destino, codigo_inicial, trabalhadores,
+                lote=256, metodo_inicio=None):
+    """
+    A* distribuído por hash (HDA*, Kishimoto et al., 2009) em "trabalhadores" processos.
+
+    Cada estado pertence ao processo dono(codigo); quem gera um filho o
+    manda ao dono, que faz a detecção de duplicados e guarda o nó. Este
+    processo só coordena: repassa a melhor solução encontrada (limite para
+    podar f >= custo) e detecta o fim por ondas de sonda, em que cada
+    processo informa se está ocioso e quantos lotes enviou e recebeu.
+    A busca acaba quando duas ondas seguidas encontram todos ociosos, com
+    enviados == recebidos e os mesmos totais (nenhum lote em trânsito e
+    nenhum trabalho novo entre as ondas). Com heurística admissível, o
+    limite nesse momento é o custo ótimo.
+
+    O caminho é remontado perguntando a cada dono a direção que levou ao
+    nó, do destino até a raiz.
+
+    "motor" só é usado aqui, para a raiz; os processos recebem o destino e
+    reabrem o próprio motor (abrir_motor), então as tabelas em disco já
+    devem existir. metodo_inicio é o de multiprocessing ("fork", "spawn",
+    ...; None = padrão da plataforma). Se um processo falhar ou morrer, a
+    busca para com RuntimeError.
+    Retorna (direções do vazio ou None, lista de EstatisticasTrabalhador).
+    """
+    contexto = multiprocessing.get_context(metodo_inicio)
+    codigo_destino = codificador.empacotar(matriz_destino)
+    caixas = [contexto.Queue() for _ in range(trabalhadores)]
+    controle = contexto.Queue()
+    processos = [contexto.Process(target=_trabalhador,
+                                  args=(ident, codificador.n, matriz_destino, heuristica,
+                                        caixas, controle, lote),
+                                  daemon=True)
+                 for ident in range(trabalhadores)]
+    finalizados = set()  # processos que já mandaram as estatísticas e podem sair
+    for processo in processos:
+        processo.start()
+
+    def para_todos(mensagem):
+        for caixa in caixas:
+            caixa.put(mensagem)
+
+    def receber():
+        """Próxima mensagem do controle, sem esperar para sempre por um processo que já morreu"""
+        while True:
+            try:
+                mensagem = controle.get(timeout=ESPERA)
+            except queue.Empty:
+                for ident, processo in enumerate(processos):
+                    if ident not in finalizados and not processo.is_alive():
+                        raise RuntimeError(f"Processo {ident} do HDA* terminou sem avisar "
+                                           f"(código de saída {processo.exitcode})") from None
+                continue
+            if mensagem[0] == "erro":
+                raise RuntimeError(f"Processo {mensagem[1]} do HDA* falhou:\n{mensagem[2]}")
+            return mensagem
+
+    try:
+        raiz = (codigo_inicial, 0, codificador.posicao_vazio(codigo_inicial), RAIZ, motor.inicial(codigo_inicial))
+        caixas[dono(codigo_inicial, trabalhadores)].put(("nos", [raiz]))
+        enviados = 1  # o lote da raiz conta como enviado pelo coordenador
+
+        limite = float('inf')
+        rodada = 0
+        respostas = {}
+        sondando = False
+        aviso_pendente = False  # alguém ficou ocioso durante a onda em andamento
+        onda_anterior = None
+        while True:
+            mensagem = receber()
+            tipo = mensagem[0]
+            if tipo == "solucao":
+                if mensagem[1] < limite:
+                    limite = mensagem[1]
+                    para_todos(("limite", limite))
+                continue
+            if tipo == "ocioso":
+                if sondando:
+                    aviso_pendente = True
+                    continue
+            elif tipo == "estado" and mensagem[1] == rodada:
+                _, _, ident, ocioso, enviados_trabalhador, recebidos = mensagem
+                respostas[ident] = (ocioso, enviados_trabalhador, recebidos)
+                if len(respostas) < trabalhadores:
+                    continue
+                sondando = False
+                onda = (enviados + sum(r[1] for r in respostas.values()),
+                        sum(r[2] for r in respostas.values()))
+                if all(r[0] for r in respostas.values()) and onda[0] == onda[1]:
+                    if onda == onda_anterior:
+                        break
+                    onda_anterior = onda  # primeira onda limpa: confirma com outra
+                else:
+                    # Alguém trabalhando ou lote em trânsito: espera o próximo aviso de ociosidade
+                    onda_anterior = None
+                    if not aviso_pendente:
+                        continue
+            else:
+                continue
+            rodada += 1
+            respostas = {}
+            sondando = True
+            aviso_pendente = False
+            para_todos(("sonda", rodada))
+
+        direcoes = None
+        if limite != float('inf'):
+            direcoes = []
+            codigo = codigo_destino
+            while True:
+                caixas[dono(codigo, trabalhadores)].put(("direcao", codigo))
+                mensagem = receber()
+                while mensagem[0] != "direcao":
+                    mensagem = receber()  # avisos atrasados de ociosidade
+                direcao = mensagem[2]
+                if direcao == RAIZ:
+                    break
+                direcoes.append(direcao)
+                vazio = codificador.posicao_vazio(codigo)
+                codigo, _ = codificador.mover(codigo, vazio, vazio - codificador.passos[direcao])
+            direcoes.reverse()
+
+        para_todos(("fim",))
+        estatisticas = []
+        while len(estatisticas) < trabalhadores:
+            mensagem = receber()
+            if mensagem[0] == "estatisticas":
+                estatisticas.append(mensagem[1])
+                finalizados.add(mensagem[1].ident)
+        for processo in processos:
+            processo.join()
+    finally:
+        for processo in processos:
+            if processo.is_alive():
+                processo.terminate()
+
+    estatisticas.sort(key=lambda e: e.ident)
+    return direcoes, estatisticas
@@ -0,0 +1,93 @@
+import numpy as np
+
+# Heurísticas com valores não inteiros (não podem usar a lista aberta de baldes)
+HEURISTICAS_FRACIONARIAS = {3}
+
+
+class MotorHeuristico:
+    """
+    Avalia as heurísticas do SlidingPuzzle com tabelas pré-calculadas
+    uma única vez por matriz_destino.
+
+    As quatro heurísticas de calcular_valor_h dependem só de duas grandezas:
+    a soma das distâncias de Manhattan e o número de posições diferentes
+    do destino. As duas ficam juntas em um único inteiro ("componentes"),
+    manhattan * 256 + diferentes, e o filho é obtido somando ao valor do
+    pai o delta pré-calculado da peça que se moveu, em O(1).
+
+    Interface usada pelas buscas (e seguida pelas outras fontes de heurística):
+    inicial(codigo), filho(componentes, codigo, peca, de, para) e
+    valor(componentes, heuristica).
+    """
+    def __init__(self, matriz_destino, codificador):
+        self.codificador = codificador
+        n = codificador.n
+        tamanho = codificador.tamanho
+        # Maior Manhattan possível acima dos 8 bits de "diferentes"
+        self.bits_componentes = (2 * (n - 1) * (tamanho - 1)).bit_length() + 8
+        destino = [int(numero) for numero in np.asarray(matriz_destino).ravel()]
+        self.destino = destino
+
+        # Posição de destino de cada peça (tabela de consulta)
+        self.linha_destino = [0] * tamanho
+        self.coluna_destino = [0] * tamanho
+        for pos, numero in enumerate(destino):
+            self.linha_destino[numero], self.coluna_destino[numero] = divmod(pos, n)
+
+        # distancias[peca][pos] = distância de Manhattan da peça em pos até o destino dela
+        self.distancias = [[0] * tamanho for _ in range(tamanho)]
+        for peca in range(1, tamanho):
+            for pos in range(tamanho):
+                linha, coluna = divmod(pos, n)
+                self.distancias[peca][pos] = (abs(linha - self.linha_destino[peca]) +
+                                              abs(coluna - self.coluna_destino[peca]))
+
+        # deltas[(peca * tamanho + de) * tamanho + para] = variação dos componentes
+        # quando a peça desliza de "de" para "para" (o vazio faz o caminho inverso)
+        self.deltas = [0] * (tamanho * tamanho * tamanho)
+        for peca in range(1, tamanho):
+            for de in range(tamanho):
+                for para in codificador.movimentos[de]:
+                    delta_manhattan = self.distancias[peca][para] - self.distancias[peca][de]
+                    delta_diferentes = ((destino[para] != peca) + (destino[de] != 0)
+                                        - (destino[para] != 0) - (destino[de] != peca))
+                    self.deltas[(peca * tamanho + de) * tamanho + para] = \
+                        delta_manhattan * 256 + delta_diferentes
+
+    def inicial(self, codigo):
+        """Calcula do zero os componentes (Manhattan e posições diferentes) de um estado"""
+        manhattan = 0
+        diferentes = 0
+        for pos in range(self.codificador.tamanho):
+            peca = self.codificador.peca(codigo, pos)
+            if peca != 0:
+                manhattan += self.distancias[peca][pos]
+            if peca != self.destino[pos]:
+                diferentes += 1
+        return manhattan * 256 + diferentes
+
+    def filho(self, componentes, codigo, peca, de, para):
+        """Componentes do filho em que a peça deslizou de "de" para "para" (O(1))"""
+        tamanho = self.codificador.tamanho
+        return componentes + self.deltas[(peca * tamanho + de) * tamanho + para]
+
+    @staticmethod
+    def manhattan(componentes, peso=1):
+        return (componentes >> 8) * peso
+
+    @staticmethod
+    def hamming(componentes):
+        diferentes = componentes & 0xFF
+        return diferentes - 1 if diferentes > 0 else 0
+
+    def valor(self, componentes, heuristica):
+        """Valor da heurística selecionada (mesma numeração de calcular_valor_h)"""
+        if heuristica == 1:
+            return self.manhattan(componentes)
+        elif heuristica == 2:
+            return self.hamming(componentes)
+        elif heuristica == 3:
+            return self.manhattan(componentes, 1.5)
+        elif heuristica == 4:
+            return max(self.manhattan(componentes), self.hamming(componentes) * 2)
+        return 0
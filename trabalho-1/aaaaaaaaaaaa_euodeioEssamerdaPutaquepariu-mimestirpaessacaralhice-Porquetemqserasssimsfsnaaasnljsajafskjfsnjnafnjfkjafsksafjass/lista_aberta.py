@@ -0,0 +1,76 @@
+import heapq
+import itertools
+
+
+class ListaAbertaHeap:
+    """
+    Lista aberta com heapq, para qualquer custo (inclusive fracionário).
+    Empates em f vão para o maior g e, depois, para o último inserido.
+    """
+    def __init__(self):
+        self.heap = []
+        self.contador = itertools.count()
+
+    def inserir(self, f, g, item):
+        heapq.heappush(self.heap, (f, -g, -next(self.contador), item))
+
+    def remover(self):
+        """Retira o item de menor f (IndexError se vazia)"""
+        return heapq.heappop(self.heap)[3]
+
+    def primeiro(self):
+        """(f, g, item) do próximo a sair, sem retirá-lo (IndexError se vazia)"""
+        f, menos_g, _, item = self.heap[0]
+        return f, -menos_g, item
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class ListaAbertaBaldes:
+    """
+    Lista aberta de dois níveis para custos inteiros (array de pilhas).
+
+    baldes[f][g] é uma pilha com os itens de custo f e profundidade g.
+    Inserir é um append; remover pega o menor f não vazio e, dentro dele,
+    o maior g, em ordem LIFO. Como f só cresce aos poucos durante o A*,
+    o custo amortizado das duas operações é O(1).
+    """
+    def __init__(self):
+        self.baldes = []   # baldes[f] = lista de pilhas indexada por g (sem pilhas vazias no fim)
+        self.f_min = 0     # nenhum balde abaixo dele tem itens
+        self.tamanho = 0
+
+    def inserir(self, f, g, item):
+        baldes = self.baldes
+        while len(baldes) <= f:
+            baldes.append([])
+        por_g = baldes[f]
+        while len(por_g) <= g:
+            por_g.append([])
+        por_g[g].append(item)
+        if f < self.f_min:
+            self.f_min = f
+        self.tamanho += 1
+
+    def remover(self):
+        """Retira o item de menor f e maior g (IndexError se vazia)"""
+        if not self.tamanho:
+            raise IndexError("remover de lista aberta vazia")
+        while not self.baldes[self.f_min]:
+            self.f_min += 1
+        por_g = self.baldes[self.f_min]
+        item = por_g[-1].pop()
+        # Mantém o invariante: a última pilha de cada balde não é vazia
+        while por_g and not por_g[-1]:
+            por_g.pop()
+        self.tamanho -= 1
+        return item
+
+    def __len__(self):
+        return self.tamanho
+
+
+def criar_lista_aberta(custos_inteiros):
+    """Baldes quando f é sempre inteiro; heapq como alternativa para heurísticas fracionárias"""
+    return ListaAbertaBaldes() if custos_inteiros else ListaAbertaHeap()
@@ -0,0 +1,117 @@
+import numpy as np
+
+# Heurísticas que têm versão vetorizada (mesma numeração de calcular_valor_h)
+HEURISTICAS_LOTE = {1, 2, 3, 4}
+
+
+# As operações de conjunto abaixo usam ordenação: np.unique/np.isin com hash
+# ficam ordens de grandeza mais lentos com as chaves empacotadas.
+
+def unicos(chaves):
+    """Chaves sem repetição (ordenadas) e o índice da primeira ocorrência de cada uma"""
+    ordem = np.argsort(chaves, kind="stable")
+    ordenadas = chaves[ordem]
+    primeira = np.ones(len(ordem), dtype=bool)
+    primeira[1:] = ordenadas[1:] != ordenadas[:-1]
+    return ordenadas[primeira], ordem[primeira]
+
+
+def contidas(chaves, ordenadas):
+    """Máscara das chaves que aparecem no array ordenado"""
+    if not len(ordenadas):
+        return np.zeros(len(chaves), dtype=bool)
+    posicoes = np.minimum(np.searchsorted(ordenadas, chaves), len(ordenadas) - 1)
+    return ordenadas[posicoes] == chaves
+
+
+def inserir_ordenadas(ordenadas, chaves):
+    """
+    Insere chaves novas mantendo o array ordenado (cópia linear, sem reordenar tudo).
+    As chaves podem vir em qualquer ordem (ex.: depois de argpartition): são
+    ordenadas aqui, senão duas que caem na mesma posição entrariam trocadas.
+    """
+    chaves = np.sort(chaves)
+    return np.insert(ordenadas, np.searchsorted(ordenadas, chaves), chaves)
+
+
+class AvaliadorLote:
+    """
+    Expansão e heurísticas de blocos inteiros de estados com NumPy.
+
+    Um bloco é um array 2D com um estado por linha (as n² peças em ordem
+    de posição) e um vetor com a posição do vazio de cada linha. As
+    heurísticas usam tabelas de consulta por (peça, posição), então um
+    bloco de qualquer tamanho é avaliado com poucas chamadas NumPy, sem
+    laço Python por estado.
+    """
+    def __init__(self, matriz_destino, codificador):
+        self.codificador = codificador
+        n = codificador.n
+        tamanho = codificador.tamanho
+        self.destino = np.asarray(matriz_destino).ravel().astype(np.int8)
+        self.posicoes = np.arange(tamanho)
+
+        # distancias[peca, pos] = Manhattan da peça em pos até o destino dela (0 para o vazio)
+        posicao_destino = np.empty(tamanho, dtype=np.int64)
+        posicao_destino[self.destino] = self.posicoes
+        linha, coluna = np.divmod(self.posicoes, n)
+        self.distancias = (np.abs(linha[None, :] - linha[posicao_destino][:, None]) +
+                           np.abs(coluna[None, :] - coluna[posicao_destino][:, None]))
+        self.distancias[0] = 0
+
+        # Vazio pode ir para cima/baixo/esquerda/direita (mesma ordem de Codificador.passos)
+        self.validos = np.array([linha > 0, linha < n - 1, coluna > 0, coluna < n - 1])
+        self.passos = np.array(codificador.passos)
+
+        # Chave por estado: inteiro de 64 bits quando cabe (até 4x4), senão os bytes da linha
+        self.empacota_64 = tamanho * 4 <= 64
+        self.deslocamentos = (4 * self.posicoes).astype(np.uint64)
+
+    def manhattan(self, estados):
+        return self.distancias[estados, self.posicoes].sum(axis=1)
+
+    def hamming(self, estados):
+        diferentes = (estados != self.destino).sum(axis=1)
+        return np.maximum(diferentes - 1, 0)
+
+    def valores(self, estados, heuristica):
+        """Valor da heurística para cada linha do bloco"""
+        if heuristica == 1:
+            return self.manhattan(estados)
+        elif heuristica == 2:
+            return self.hamming(estados)
+        elif heuristica == 3:
+            return self.manhattan(estados) * 1.5
+        elif heuristica == 4:
+            return np.maximum(self.manhattan(estados), self.hamming(estados) * 2)
+        raise ValueError(f"Heurística sem versão em lote: {heuristica}")
+
+    def expandir(self, estados, vazios):
+        """
+        Todos os filhos do bloco de uma vez.
+        Retorna (filhos, vazios dos filhos, linha do pai de cada filho, direção do vazio).
+        """
+        filhos = []
+        vazios_filhos = []
+        pais = []
+        direcoes = []
+        for direcao, passo in enumerate(self.passos):
+            pais_direcao = np.flatnonzero(self.validos[direcao][vazios])
+            filhos_direcao = estados[pais_direcao]
+            origem = vazios[pais_direcao]
+            destino = origem + passo
+            linhas = np.arange(len(pais_direcao))
+            filhos_direcao[linhas, origem] = filhos_direcao[linhas, destino]
+            filhos_direcao[linhas, destino] = 0
+            filhos.append(filhos_direcao)
+            vazios_filhos.append(destino)
+            pais.append(pais_direcao)
+            direcoes.append(np.full(len(pais_direcao), direcao, dtype=np.int8))
+        return (np.concatenate(filhos), np.concatenate(vazios_filhos),
+                np.concatenate(pais), np.concatenate(direcoes))
+
+    def chaves(self, estados):
+        """Uma chave comparável por linha (para unicos, contidas e inserir_ordenadas)"""
+        if self.empacota_64:
+            return np.bitwise_or.reduce(estados.astype(np.uint64) << self.deslocamentos, axis=1)
+        return np.ascontiguousarray(estados).view(np.dtype((np.void, estados.shape[1]))).ravel()
@@ -0,0 +1,79 @@
+import os
+import sys
+
+# A implementação é a mesma das buscas em grade (search_observer.py, na raiz do repositório);
+# a raiz vai para o fim do sys.path para não esconder os módulos desta pasta
+RAIZ_REPOSITORIO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if RAIZ_REPOSITORIO not in sys.path:
+    sys.path.append(RAIZ_REPOSITORIO)
+
+from search_observer import SearchObserver  # noqa: E402
+
+# Fases cronometradas separadamente; o tempo que sobra é o da expansão (gerar filhos, armazém)
+FASES = ("heuristica", "fila", "tabela_hash")
+
+
+class Observador(SearchObserver):
+    """
+    Instrumentação opcional de busca_a_estrela (parâmetro observador).
+
+    É o SearchObserver das grades com as fases do puzzle, os nomes da saída
+    em português e o código empacotado como estado de cada amostra. Mede
+    expansões (chamando ao_expandir(codigo, g, tamanho_aberta) a cada
+    "amostragem" expansões), inserções, duplicados, melhorados, o pico da
+    lista aberta, o tempo de cada fase e, com memoria=True (bem mais lento),
+    o pico de memória do Python.
+
+    O resultado vai para metricas.perfil e pode ser salvo em JSON ou como
+    trace do Chrome (chrome://tracing ou Perfetto).
+    """
+    PHASES = FASES
+    NAMES = {
+        "expansions": "expansoes",
+        "pushes": "insercoes",
+        "duplicates": "duplicados",
+        "improved": "melhorados",
+        "peak_open": "pico_aberta",
+        "peak_memory": "pico_memoria",
+        "total_time": "tempo_total",
+        "times": "tempos",
+        "expansion": "expansao",
+        "samples": "amostras",
+        "events": "eventos",
+        "time": "tempo",
+        "open": "aberta",
+        "search": "busca_a_estrela",
+        "expand": "expansao",
+        "open_list": "lista_aberta",
+        "size": "tamanho",
+    }
+
+    def __init__(self, amostragem=1, ao_expandir=None, memoria=False):
+        if amostragem < 1:
+            raise ValueError("A amostragem deve ser pelo menos 1")
+        super().__init__(amostragem, ao_expandir, memoria)
+
+    def state(self, codigo):
+        return {"codigo": codigo}
+
+    def iniciar(self):
+        """Chamado pela busca logo antes do laço principal"""
+        self.start()
+
+    def cronometrar(self, funcao, fase, conta_insercoes=False):
+        """Versão de funcao que soma o tempo de cada chamada na fase"""
+        return self.timed(funcao, fase, conta_insercoes)
+
+    def expandiu(self, codigo, g, tamanho_aberta):
+        """Chamado a cada expansão"""
+        self.expanded(codigo, g, tamanho_aberta)
+
+    def finalizar(self, restantes, nos):
+        """Fecha as contas com o que sobrou na lista aberta e o número de nós distintos gerados"""
+        self.finish(remaining=restantes, distinct=nos)
+
+    def salvar_json(self, caminho):
+        self.save_json(caminho)
+
+    def salvar_trace_chrome(self, caminho):
+        self.save_chrome_trace(caminho)
@@ -0,0 +1,148 @@
+import os
+import tempfile
+from collections import deque
+from math import factorial
+
+import numpy as np
+
+# Valor gravado na tabela para permutações que não alcançam o destino
+INALCANCAVEL = 255
+
+# Diretório padrão das tabelas geradas (não versionado)
+DIRETORIO_TABELAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tabelas")
+
+
+def gravar_atomico(caminho, dados):
+    """
+    Grava um array cru em um temporário da mesma pasta e troca pelo arquivo
+    final com os.replace: outro processo abrindo a tabela ao mesmo tempo vê
+    o arquivo inteiro ou não vê nenhum, nunca um pedaço.
+    """
+    pasta = os.path.dirname(os.path.abspath(caminho))
+    os.makedirs(pasta, exist_ok=True)
+    descritor, temporario = tempfile.mkstemp(dir=pasta, suffix=".tmp")
+    try:
+        with os.fdopen(descritor, "wb") as arquivo:
+            np.asarray(dados).tofile(arquivo)
+        os.replace(temporario, caminho)
+    except BaseException:
+        os.remove(temporario)
+        raise
+
+
+def rank_permutacao(codigo, codificador):
+    """
+    Rank da permutação (código de Lehmer) do tabuleiro empacotado, em [0, n²!).
+    Cada dígito conta quantas peças menores ainda não apareceram.
+    """
+    tamanho = codificador.tamanho
+    usados = 0
+    rank = 0
+    for pos in range(tamanho):
+        peca = codificador.peca(codigo, pos)
+        menores_livres = peca - (usados & ((1 << peca) - 1)).bit_count()
+        rank = rank * (tamanho - pos) + menores_livres
+        usados |= 1 << peca
+    return rank
+
+
+def caminho_padrao(matriz_destino):
+    """Nome do arquivo da tabela para um destino, ex.: tabelas/distancias_3x3_123456780.bin"""
+    destino = np.asarray(matriz_destino)
+    digitos = "".join(str(int(numero)) for numero in destino.ravel())
+    return os.path.join(DIRETORIO_TABELAS, f"distancias_{destino.shape[0]}x{destino.shape[1]}_{digitos}.bin")
+
+
+class TabelaDistancias:
+    """
+    Oráculo de distância exata para o 8-puzzle.
+
+    Guarda, para cada uma das 9! permutações (indexadas pelo rank de Lehmer),
+    o número mínimo de movimentos até matriz_destino, um byte por estado
+    (INALCANCAVEL para a metade sem solução). A tabela é gerada uma vez por
+    BFS reversa a partir do destino e depois lida do disco via mmap.
+
+    Segue a mesma interface do MotorHeuristico, com a distância como "componentes".
+    """
+    def __init__(self, distancias, codificador):
+        if codificador.tamanho != 9:
+            raise ValueError("A tabela de distâncias só é viável para o tabuleiro 3x3")
+        if len(distancias) != factorial(codificador.tamanho):
+            raise ValueError("Tamanho da tabela não corresponde ao tabuleiro")
+        self.distancias = distancias
+        self.codificador = codificador
+        self.bits_componentes = 8
+
+    @classmethod
+    def construir(cls, matriz_destino, codificador):
+        """Gera a tabela por BFS reversa a partir do destino (todos os movimentos são reversíveis)"""
+        # Antes de alocar: para o 4x4 seriam 16! bytes
+        if codificador.tamanho != 9:
+            raise ValueError("A tabela de distâncias só é viável para o tabuleiro 3x3")
+        distancias = bytearray([INALCANCAVEL]) * factorial(codificador.tamanho)
+        codigo_destino = codificador.empacotar(matriz_destino)
+        distancias[rank_permutacao(codigo_destino, codificador)] = 0
+
+        fila = deque([(codigo_destino, codificador.posicao_vazio(codigo_destino), 0)])
+        while fila:
+            codigo, vazio, distancia = fila.popleft()
+            for codigo_vizinho, vazio_vizinho, _ in codificador.vizinhos(codigo, vazio):
+                rank = rank_permutacao(codigo_vizinho, codificador)
+                if distancias[rank] == INALCANCAVEL:
+                    distancias[rank] = distancia + 1
+                    fila.append((codigo_vizinho, vazio_vizinho, distancia + 1))
+
+        return cls(np.frombuffer(distancias, dtype=np.uint8), codificador)
+
+    def salvar(self, caminho):
+        """Grava a tabela crua (um byte por permutação)"""
+        gravar_atomico(caminho, np.asarray(self.distancias, dtype=np.uint8))
+
+    @classmethod
+    def carregar(cls, caminho, codificador):
+        """Mapeia o arquivo em memória somente leitura (páginas compartilhadas entre processos)"""
+        return cls(np.memmap(caminho, dtype=np.uint8, mode="r"), codificador)
+
+    @classmethod
+    def obter(cls, matriz_destino, codificador, caminho=None):
+        """Carrega a tabela do disco, gerando e salvando na primeira vez"""
+        caminho = caminho or caminho_padrao(matriz_destino)
+        if not os.path.exists(caminho):
+            cls.construir(matriz_destino, codificador).salvar(caminho)
+        return cls.carregar(caminho, codificador)
+
+    def distancia(self, codigo):
+        """Distância exata do estado até o destino (None se não houver solução)"""
+        distancia = int(self.distancias[rank_permutacao(codigo, self.codificador)])
+        return None if distancia == INALCANCAVEL else distancia
+
+    def descer(self, codigo):
+        """
+        Resolve sem busca: a cada passo vai para o vizinho com distância um a menos.
+        Retorna a lista de códigos do estado até o destino (ou None se não houver solução).
+        """
+        distancia = self.distancia(codigo)
+        if distancia is None:
+            return None
+
+        codificador = self.codificador
+        vazio = codificador.posicao_vazio(codigo)
+        caminho = [codigo]
+        while distancia > 0:
+            for codigo_vizinho, vazio_vizinho, _ in codificador.vizinhos(codigo, vazio):
+                if self.distancias[rank_permutacao(codigo_vizinho, codificador)] == distancia - 1:
+                    codigo, vazio = codigo_vizinho, vazio_vizinho
+                    break
+            distancia -= 1
+            caminho.append(codigo)
+        return caminho
+
+    # Interface de heurística (ver MotorHeuristico)
+    def inicial(self, codigo):
+        return int(self.distancias[rank_permutacao(codigo, self.codificador)])
+
+    def filho(self, componentes, codigo, peca, de, para):
+        return int(self.distancias[rank_permutacao(codigo, self.codificador)])
+
+    def valor(self, componentes, heuristica):
+        return componentes
@@ -1,8 +1,18 @@
+import os
 import heapq
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 from time import time
-import copy
+from estado_compacto import Codificador, destino_padrao
+from heuristicas import MotorHeuristico, HEURISTICAS_FRACIONARIAS
+from oraculo import TabelaDistancias
+from banco_padroes import BancoPadroes
+from lista_aberta import criar_lista_aberta, ListaAbertaHeap
+from armazem_nos import ArmazemNos, RAIZ
+from lote import AvaliadorLote, HEURISTICAS_LOTE, unicos, contidas, inserir_ordenadas
+from hda_estrela import hda_estrela
+from gerador_movimentos import SorteioProfundidade, e_solucionavel, gerar_lote, paridade, passeio_lote
 
 class Metricas:
     """
@@ -13,16 +23,20 @@ class Metricas:
         self.nodos_expandidos = nodos_expandidos
         self.profundidade = profundidade
         self.tempo = tempo
+        self.perfil = None  # Observador da busca, quando houver (ver observador.py)
         
     def __str__(self):
         """Retorna uma representação em string das métricas para exibição"""
         if self.profundidade == -1:
             return "Sem solução encontrada"
         
-        return (f"Estatísticas:\n"
-                f"Nós expandidos: {self.nodos_expandidos}\n"
-                f"Profundidade da solução: {self.profundidade}\n"
-                f"Tempo de execução: {self.tempo:.4f} segundos")
+        texto = (f"Estatísticas:\n"
+                 f"Nós expandidos: {self.nodos_expandidos}\n"
+                 f"Profundidade da solução: {self.profundidade}\n"
+                 f"Tempo de execução: {self.tempo:.4f} segundos")
+        if self.perfil is not None:
+            texto += f"\n{self.perfil}"
+        return texto
                 
     def atualizar_tempo(self, inicio_tempo):
         """Atualiza o tempo de execução com base no tempo inicial fornecido"""
@@ -30,56 +44,240 @@ class Metricas:
         
     def to_dict(self):
         """Converte as métricas para um dicionário (para compatibilidade)"""
-        return {
+        dados = {
             "nodos_expandidos": self.nodos_expandidos,
             "profundidade": self.profundidade,
             "tempo": self.tempo
         }
+        if self.perfil is not None:
+            dados["perfil"] = self.perfil.to_dict()
+        return dados
 
 
-class Estado:
-    """Representa um estado do puzzle com métodos para comparação e análise"""
-    def __init__(self, matriz, d, h, pai=None):
-        self.matriz = matriz  # representação da matriz do puzzle
-        self.d = d            # profundidade (custo até aqui)
-        self.h = h            # heurística
-        self.c = d + h        # custo total
-        self.pai = pai        # estado pai (objeto Estado ou None)
+class MetricasBidirecionais(Metricas):
+    """Métricas da busca bidirecional: o total e as de cada fronteira"""
+    def __init__(self, direta, reversa, profundidade=-1, tempo=0):
+        super().__init__(direta.nodos_expandidos + reversa.nodos_expandidos, profundidade, tempo)
+        self.direta = direta
+        self.reversa = reversa
 
-    def __lt__(self, outro):
-        """Para ordenação na fila de prioridade"""
-        return self.c < outro.c
-        
-    def eh_igual(self, outro_estado):
-        """Verifica se dois estados são iguais comparando suas matrizes"""
-        return np.array_equal(self.matriz, outro_estado.matriz)
-        
-    def get_matriz_tupla(self):
-        """Converte a matriz numpy para tupla de tuplas (para uso como chave em dicionários)"""
-        return tuple(map(tuple, self.matriz))
+    def __str__(self):
+        if self.profundidade == -1:
+            return "Sem solução encontrada"
+        return (super().__str__() +
+                f"\nExpandidos pela frente (a partir do início): {self.direta.nodos_expandidos}"
+                f"\nExpandidos por trás (a partir do destino): {self.reversa.nodos_expandidos}")
+
+    def to_dict(self):
+        dados = super().to_dict()
+        dados["direta"] = self.direta.to_dict()
+        dados["reversa"] = self.reversa.to_dict()
+        return dados
+
+
+class MetricasAnytime(Metricas):
+    """Métricas de uma solução da busca anytime: o peso usado e o limite de qualidade provado"""
+    def __init__(self, nodos_expandidos=0, profundidade=-1, tempo=0, peso=1.0, limitante=1.0):
+        super().__init__(nodos_expandidos, profundidade, tempo)
+        self.peso = peso
+        self.limitante = limitante  # custo da solução <= limitante * custo ótimo
+
+    def __str__(self):
+        if self.profundidade == -1:
+            return "Sem solução encontrada"
+        return (super().__str__() +
+                f"\nPeso: {self.peso:.2f} (solução no máximo {self.limitante:.3f} vezes a ótima)")
+
+    def to_dict(self):
+        dados = super().to_dict()
+        dados["peso"] = self.peso
+        dados["limitante"] = self.limitante
+        return dados
+
+
+class MetricasParalelas(Metricas):
+    """Métricas do A* paralelo: o total e os contadores de cada processo"""
+    def __init__(self, trabalhadores, profundidade=-1, tempo=0):
+        super().__init__(sum(t.nodos_expandidos for t in trabalhadores), profundidade, tempo)
+        self.trabalhadores = trabalhadores
+
+    @property
+    def expandidos_por_trabalhador(self):
+        return [t.nodos_expandidos for t in self.trabalhadores]
+
+    def __str__(self):
+        if self.profundidade == -1:
+            return "Sem solução encontrada"
+        return (super().__str__() +
+                f"\nExpandidos por processo: {self.expandidos_por_trabalhador}"
+                f"\nReabertos: {sum(t.reabertos for t in self.trabalhadores)}, "
+                f"lotes trocados: {sum(t.enviados for t in self.trabalhadores)}")
+
+    def to_dict(self):
+        dados = super().to_dict()
+        dados["trabalhadores"] = [t.to_dict() for t in self.trabalhadores]
+        return dados
+
+
+class Fronteira:
+    """
+    Um lado da busca bidirecional: nós num ArmazemNos, heurística até a
+    outra ponta e três filas com remoção preguiçosa, por prioridade
+    max(f, 2g), por f e por g (as duas últimas só para o teste de parada).
+    Cada entrada é (chave, -g, índice), com empates indo para o maior g, e
+    só vale enquanto o nó está aberto com aquele g.
+    """
+    def __init__(self, codificador, motor, heuristica, codigo_raiz):
+        self.codificador = codificador
+        self.motor = motor
+        self.heuristica = heuristica
+        self.armazem = ArmazemNos(codificador, motor.bits_componentes)
+        self.filas = ([], [], [])
+        self.metricas = Metricas()
+        componentes = motor.inicial(codigo_raiz)
+        raiz = self.armazem.adicionar(codigo_raiz, 0, codificador.posicao_vazio(codigo_raiz),
+                                      RAIZ, componentes)
+        self.inserir(raiz, 0, componentes)
+
+    def inserir(self, indice, g, componentes):
+        f = g + self.motor.valor(componentes, self.heuristica)
+        heapq.heappush(self.filas[0], (max(f, 2 * g), -g, indice))
+        heapq.heappush(self.filas[1], (f, -g, indice))
+        heapq.heappush(self.filas[2], (g, -g, indice))
+
+    def minimo(self, fila):
+        """Menor chave válida da fila (0 = prioridade, 1 = f, 2 = g); inf se vazia"""
+        entradas = self.filas[fila]
+        fechados = self.armazem.fechados
+        g = self.armazem.g
+        while entradas:
+            chave, menos_g, indice = entradas[0]
+            if not fechados[indice] and g[indice] == -menos_g:
+                return chave
+            heapq.heappop(entradas)
+        return float('inf')
+
+    def expandir(self, outra):
+        """
+        Expande o nó de menor prioridade e retorna (custo, código) do melhor
+        encontro com a outra fronteira visto nos filhos (inf, None se nenhum)
+        """
+        self.minimo(0)  # descarta entradas antigas do topo
+        atual = heapq.heappop(self.filas[0])[2]
+        armazem = self.armazem
+        codificador = self.codificador
+        motor = self.motor
+        indice = armazem.indice
+        g = armazem.g
+        indice_oposto = outra.armazem.indice
+        g_oposto = outra.armazem.g
+
+        armazem.fechados[atual] = 1
+        self.metricas.nodos_expandidos += 1
+        codigo_atual = armazem.codigos[atual]
+        vazio_atual = armazem.vazios[atual]
+        componentes_atual = armazem.componentes[atual]
+        novo_g = g[atual] + 1
+        melhor = (float('inf'), None)
+        for direcao, vazio_vizinho in codificador.movimentos_direcao[vazio_atual]:
+            codigo_vizinho, peca = codificador.mover(codigo_atual, vazio_atual, vazio_vizinho)
+            vizinho = indice.get(codigo_vizinho)
+            if vizinho is not None and novo_g >= g[vizinho]:
+                continue
+
+            componentes = motor.filho(componentes_atual, codigo_vizinho, peca, vazio_vizinho, vazio_atual)
+            if vizinho is None:
+                vizinho = armazem.adicionar(codigo_vizinho, novo_g, vazio_vizinho, direcao, componentes)
+            else:
+                # A ordem por max(f, 2g) não é monótona em g: um nó fechado pode ser reaberto
+                armazem.atualizar(vizinho, novo_g, direcao, componentes)
+                armazem.fechados[vizinho] = 0
+            self.inserir(vizinho, novo_g, componentes)
+
+            oposto = indice_oposto.get(codigo_vizinho)
+            if oposto is not None and novo_g + g_oposto[oposto] < melhor[0]:
+                melhor = (novo_g + g_oposto[oposto], codigo_vizinho)
+        return melhor
 
 
 class SlidingPuzzle:
-    """Classe principal para resolver o jogo Sliding Puzzle usando A*"""
-    def __init__(self):
-        # Estado objetivo padrão
-        self.matriz_destino = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+    """Classe principal para resolver o jogo Sliding Puzzle NxN usando A*"""
+    def __init__(self, n=3):
+        if n < 2:
+            raise ValueError("O tabuleiro deve ter pelo menos 2x2")
+        self.n = n
+        # Estado objetivo padrão: 1..n²-1 em ordem e o espaço vazio no fim
+        self.matriz_destino = destino_padrao(n)
+        self.codificador = Codificador(n)
+        self.motores = {}  # código do destino -> MotorHeuristico
+        self.tabelas = {}  # código do destino -> TabelaDistancias
+        self.bancos = {}   # código do destino -> BancoPadroes
+        self.avaliadores = {}  # código do destino -> AvaliadorLote
+        self.sorteios = {}  # código do destino -> SorteioProfundidade (só 3x3)
+        
+    def motor_heuristico(self, matriz_destino, heuristica=1):
+        """Retorna o motor de heurísticas (tabelas pré-calculadas) para o destino dado"""
+        if heuristica == 5:
+            return self.tabela_distancias(matriz_destino)
+        if heuristica == 6:
+            return self.banco_padroes(matriz_destino)
+        codigo_destino = self.codificador.empacotar(matriz_destino)
+        motor = self.motores.get(codigo_destino)
+        if motor is None:
+            motor = MotorHeuristico(matriz_destino, self.codificador)
+            self.motores[codigo_destino] = motor
+        return motor
+
+    def tabela_distancias(self, matriz_destino):
+        """Retorna o oráculo de distâncias exatas do 3x3 (gerado e salvo em disco na primeira vez)"""
+        codigo_destino = self.codificador.empacotar(matriz_destino)
+        tabela = self.tabelas.get(codigo_destino)
+        if tabela is None:
+            tabela = TabelaDistancias.obter(matriz_destino, self.codificador)
+            self.tabelas[codigo_destino] = tabela
+        return tabela
+
+    def sorteio_profundidade(self, matriz_destino):
+        """Retorna o sorteio de estados 3x3 por distância exata, sobre a tabela de distâncias do destino"""
+        codigo_destino = self.codificador.empacotar(matriz_destino)
+        sorteio = self.sorteios.get(codigo_destino)
+        if sorteio is None:
+            sorteio = SorteioProfundidade(matriz_destino, self.tabela_distancias(matriz_destino))
+            self.sorteios[codigo_destino] = sorteio
+        return sorteio
+
+    def banco_padroes(self, matriz_destino):
+        """Retorna os bancos de padrões aditivos do destino (gerados e salvos em disco na primeira vez)"""
+        codigo_destino = self.codificador.empacotar(matriz_destino)
+        banco = self.bancos.get(codigo_destino)
+        if banco is None:
+            banco = BancoPadroes.obter(matriz_destino, self.codificador)
+            self.bancos[codigo_destino] = banco
+        return banco
+
+    def avaliador_lote(self, matriz_destino):
+        """Retorna o avaliador vetorizado (blocos de estados) para o destino dado"""
+        codigo_destino = self.codificador.empacotar(matriz_destino)
+        avaliador = self.avaliadores.get(codigo_destino)
+        if avaliador is None:
+            avaliador = AvaliadorLote(matriz_destino, self.codificador)
+            self.avaliadores[codigo_destino] = avaliador
+        return avaliador
+
+    def componentes_h(self, matriz_atual, matriz_destino, heuristica=1):
+        """Componentes de heurística (ver MotorHeuristico) de uma matriz"""
+        motor = self.motor_heuristico(matriz_destino, heuristica)
+        return motor, motor.inicial(self.codificador.empacotar(matriz_atual))
         
     def manhattan(self, matriz_atual, matriz_destino, peso=1):
         """Calcula a distância de Manhattan entre a matriz atual e o objetivo"""
-        distancia = 0
-        for linha_atual in range(3):
-            for coluna_atual in range(3):
-                numero = matriz_atual[linha_atual, coluna_atual]
-                if numero != 0:
-                    linha_destino, coluna_destino = np.where(matriz_destino == numero)
-                    distancia += (abs(linha_atual - linha_destino[0]) + 
-                                 abs(coluna_atual - coluna_destino[0])) * peso
-        return distancia 
+        motor, componentes = self.componentes_h(matriz_atual, matriz_destino)
+        return motor.manhattan(componentes, peso)
 
     def hamming(self, matriz_atual, matriz_destino):
         """Calcula a distância de Hamming (número de peças fora do lugar)"""
-        return np.sum(matriz_atual != matriz_destino) - 1 if np.sum(matriz_atual != matriz_destino) > 0 else 0
+        motor, componentes = self.componentes_h(matriz_atual, matriz_destino)
+        return motor.hamming(componentes)
 
     def manhattan_ponderada(self, matriz_atual, matriz_destino):
         """Manhattan com peso adicional para valorizar mais certas posições"""
@@ -95,145 +293,590 @@ class SlidingPuzzle:
 
     def calcular_valor_h(self, matriz_atual, matriz_destino, heuristica):
         """Calcula o valor da heurística baseado na função selecionada"""
-        if heuristica == 1:
-            return self.manhattan(matriz_atual, matriz_destino)
-        elif heuristica == 2:
-            return self.hamming(matriz_atual, matriz_destino)
-        elif heuristica == 3:
-            return self.manhattan_ponderada(matriz_atual, matriz_destino)
-        elif heuristica == 4:
-            return self.heuristicas_combinadas(matriz_atual, matriz_destino)
-        return 0
-        
-    def get_vizinhos(self, matriz):
-        """Gera todos os estados vizinhos possíveis"""
-        vizinhos = []
-        linha_zero, coluna_zero = np.where(matriz == 0)
-        linha_zero, coluna_zero = linha_zero[0], coluna_zero[0]
-
-        movimentos = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # cima, baixo, esquerda, direita
-
-        for move_linha, move_coluna in movimentos:
-            nova_linha, nova_coluna = linha_zero + move_linha, coluna_zero + move_coluna
-
-            if 0 <= nova_linha < 3 and 0 <= nova_coluna < 3:
-                nova_matriz = matriz.copy()
-                nova_matriz[linha_zero, coluna_zero], nova_matriz[nova_linha, nova_coluna] = (
-                    nova_matriz[nova_linha, nova_coluna],
-                    nova_matriz[linha_zero, coluna_zero],
-                )
-                vizinhos.append(nova_matriz)
-
-        return vizinhos
-    
-    def e_solucionavel(self, matriz):
-        """Verifica se a configuração do puzzle tem solução"""
-        array = [num for row in matriz for num in row if num != 0]
+        motor, componentes = self.componentes_h(matriz_atual, matriz_destino, heuristica)
+        return motor.valor(componentes, heuristica)
         
-        inversoes = 0
-        for i in range(len(array)):
-            for j in range(i + 1, len(array)):
-                if array[i] > array[j]:
-                    inversoes += 1
-        
-        return inversoes % 2 == 0
+    def paridade(self, matriz):
+        """
+        Invariante de paridade do tabuleiro: nenhum movimento a altera.
+        Em larguras ímpares é a paridade das inversões; em larguras pares
+        um movimento vertical troca a paridade das inversões e a linha do
+        vazio ao mesmo tempo, então a linha do vazio entra na soma.
+        As inversões são contadas em O(n² log n) (gerador_movimentos.paridade).
+        """
+        return paridade(matriz)
     
-    def array_pra_tupla(self, array):
-        """Converte um array NumPy para uma tupla de tuplas"""
-        return tuple(map(tuple, array))
+    def e_solucionavel(self, matriz, matriz_destino=None):
+        """
+        Verifica se a configuração do puzzle tem solução (chega em matriz_destino).
+        Peças repetidas ou fora de 0..n²-1 nunca têm solução.
+        """
+        if matriz_destino is None:
+            matriz_destino = self.matriz_destino
+        return e_solucionavel(matriz, matriz_destino)
     
-    def reconstruir_caminho(self, estado_final, estados):
-        """Reconstrói o caminho da solução a partir do estado final"""
-        caminho = []
-        estado_atual = estado_final
-        while estado_atual:
-            caminho.append(np.array(estado_atual.matriz))
-            estado_atual = estados.get(estado_atual.pai)
-        caminho.reverse()
-        return caminho
+    def gerar_instancia(self, rng=None, matriz_destino=None):
+        """Gera um tabuleiro aleatório uniforme entre os que têm solução (ver gerador_movimentos.gerar_lote)"""
+        if matriz_destino is None:
+            matriz_destino = self.matriz_destino
+        return gerar_lote(self.n, 1, rng, matriz_destino)[0].astype(int)
+    
+    def reconstruir_caminho(self, armazem, indice_final, codigo_inicial):
+        """Reconstrói o caminho da solução reproduzindo os movimentos guardados no armazém"""
+        return self.codificador.reproduzir(codigo_inicial, armazem.direcoes_ate(indice_final))
         
-    def busca_a_estrela(self, matriz_inicial, matriz_destino, heuristica):
+    def busca_a_estrela(self, matriz_inicial, matriz_destino, heuristica, observador=None):
         """
         Implementa o algoritmo A* para buscar uma solução.
+        Os nós ficam em um ArmazemNos (arrays compactos); a lista aberta
+        guarda só o índice de cada nó. Com um Observador (observador.py) a
+        busca é instrumentada e o perfil fica em metricas.perfil.
         Retorna uma tupla (solução, métricas)
         """
+        if np.shape(matriz_inicial) != (self.n, self.n) or np.shape(matriz_destino) != (self.n, self.n):
+            raise ValueError(f"O tabuleiro deve ser {self.n}x{self.n}")
+        
         # Verificar se é solucionável
-        if not self.e_solucionavel(matriz_inicial) == self.e_solucionavel(matriz_destino):
+        if not self.e_solucionavel(matriz_inicial, matriz_destino):
             return None, Metricas()  # Retorna objeto Metricas vazio
         
         # Inicializar métricas
         metricas = Metricas()
         inicio_tempo = time()
         
-        lista_aberta = []
-        lista_fechada = set()  # Estados já expandidos
-        estados_abertos = {}   # Estados na lista aberta
-        estados = {}          # Mapeamento matriz -> estado
+        codificador = self.codificador
+        mover = codificador.mover
+        codigo_inicial = codificador.empacotar(matriz_inicial)
+        codigo_destino = codificador.empacotar(matriz_destino)
+        motor = self.motor_heuristico(matriz_destino, heuristica)
+        componentes_iniciais = motor.inicial(codigo_inicial)
         
-        # Criar estado inicial
-        estado_inicial = Estado(
-            self.array_pra_tupla(matriz_inicial), 
-            0, 
-            self.calcular_valor_h(matriz_inicial, matriz_destino, heuristica)
-        )
+        # Baldes para f inteiro (desempate pelo maior g); heapq para heurísticas fracionárias
+        lista_aberta = criar_lista_aberta(heuristica not in HEURISTICAS_FRACIONARIAS)
+        armazem = ArmazemNos(codificador, motor.bits_componentes)
+        indice = armazem.indice      # código -> nó (abertos e expandidos)
+        g = armazem.g
+        fechados = armazem.fechados  # 1 = já expandido
+        
+        # Funções do laço em variáveis locais; com observador, trocadas pelas cronometradas
+        inserir = lista_aberta.inserir
+        remover = lista_aberta.remover
+        buscar = indice.get
+        filho = motor.filho
+        valor = motor.valor
+        if observador is not None:
+            inserir = observador.cronometrar(inserir, "fila", conta_insercoes=True)
+            remover = observador.cronometrar(remover, "fila")
+            buscar = observador.cronometrar(buscar, "tabela_hash")
+            filho = observador.cronometrar(filho, "heuristica")
+            valor = observador.cronometrar(valor, "heuristica")
+            observador.iniciar()
         
-        heapq.heappush(lista_aberta, (estado_inicial.c, id(estado_inicial), estado_inicial))
-        estados_abertos[estado_inicial.get_matriz_tupla()] = estado_inicial
+        # Criar nó inicial
+        raiz = armazem.adicionar(codigo_inicial, 0, codificador.posicao_vazio(codigo_inicial),
+                                 RAIZ, componentes_iniciais)
+        inserir(valor(componentes_iniciais, heuristica), 0, raiz)
         
         while lista_aberta:
-            _, _, estado_atual = heapq.heappop(lista_aberta)
-            estados_abertos.pop(estado_atual.get_matriz_tupla(), None)
+            atual = remover()
             
-            # Se já verificamos este estado, pule
-            if estado_atual.get_matriz_tupla() in lista_fechada:
+            # Se já verificamos este estado, pule (entrada antiga na lista aberta)
+            if fechados[atual]:
                 continue
                 
             # Marcar como expandido
-            lista_fechada.add(estado_atual.get_matriz_tupla())
-            estados[estado_atual.get_matriz_tupla()] = estado_atual
+            fechados[atual] = 1
             metricas.nodos_expandidos += 1  # Incrementar contador de nós
+            codigo_atual = armazem.codigos[atual]
+            if observador is not None:
+                observador.expandiu(codigo_atual, g[atual], len(lista_aberta))
             
             # Se encontramos a solução
-            if estado_atual.get_matriz_tupla() == self.array_pra_tupla(matriz_destino):
-                metricas.profundidade = estado_atual.d
+            if codigo_atual == codigo_destino:
+                metricas.profundidade = g[atual]
                 metricas.atualizar_tempo(inicio_tempo)
-                return self.reconstruir_caminho(estado_atual, estados), metricas
+                if observador is not None:
+                    observador.finalizar(len(lista_aberta), len(armazem))
+                    metricas.perfil = observador
+                return self.reconstruir_caminho(armazem, atual, codigo_inicial), metricas
                 
-            # Expandir vizinhos
-            for vizinho in self.get_vizinhos(np.array(estado_atual.matriz)):
-                matriz_vizinho = self.array_pra_tupla(vizinho)
+            # Expandir vizinhos direto no código empacotado
+            vazio_atual = armazem.vazios[atual]
+            componentes_atual = armazem.componentes[atual]
+            novo_g = g[atual] + 1
+            for direcao, vazio_vizinho in codificador.movimentos_direcao[vazio_atual]:
+                codigo_vizinho, peca = mover(codigo_atual, vazio_atual, vazio_vizinho)
+                vizinho = buscar(codigo_vizinho)
                 
-                # Pular estados já expandidos
-                if matriz_vizinho in lista_fechada:
+                # Pular estados já expandidos, ou abertos com caminho tão bom quanto
+                if vizinho is not None and (fechados[vizinho] or novo_g >= g[vizinho]):
                     continue
-                    
-                # Calcular g para o novo caminho
-                novo_g = estado_atual.d + 1
                 
-                # Se já está na lista aberta, verificar se este caminho é melhor
-                if matriz_vizinho in estados_abertos:
-                    estado_existente = estados_abertos[matriz_vizinho]
-                    if novo_g >= estado_existente.d:
-                        continue  # Caminho atual não é melhor
+                # Heurística incremental: só a peça movida muda em relação ao pai
+                componentes = filho(componentes_atual, codigo_vizinho, peca, vazio_vizinho, vazio_atual)
                 
-                # Criar novo estado
-                estado_vizinho = Estado(
-                    matriz_vizinho,
-                    novo_g,
-                    self.calcular_valor_h(vizinho, matriz_destino, heuristica),
-                    estado_atual.get_matriz_tupla()  # Guarda o pai como a matriz em forma de tupla
-                )
+                if vizinho is None:
+                    vizinho = armazem.adicionar(codigo_vizinho, novo_g, vazio_vizinho, direcao, componentes)
+                else:
+                    armazem.atualizar(vizinho, novo_g, direcao, componentes)
                 
                 # Adicionar à lista aberta
-                heapq.heappush(lista_aberta, (estado_vizinho.c, id(estado_vizinho), estado_vizinho))
-                estados_abertos[matriz_vizinho] = estado_vizinho
+                inserir(novo_g + valor(componentes, heuristica), novo_g, vizinho)
         
         # Não encontrou solução
         metricas.atualizar_tempo(inicio_tempo)
+        if observador is not None:
+            observador.finalizar(len(lista_aberta), len(armazem))
+            metricas.perfil = observador
         return None, metricas
 
-    def executar_experimentos(self, num_experimentos=100, limite_movimentos=30):
-        """Executa experimentos para comparar diferentes heurísticas"""
+    def busca_ida_estrela(self, matriz_inicial, matriz_destino, heuristica):
+        """
+        Implementa o IDA* (A* com aprofundamento iterativo).
+        Faz buscas em profundidade limitadas por f = g + h, aumentando o limite
+        para o menor f que o excedeu. Só o caminho atual fica na memória
+        (movimento ao descer, desfazer ao voltar), e o movimento que desfaz o
+        anterior é podado.
+        Retorna uma tupla (solução, métricas)
+        """
+        if np.shape(matriz_inicial) != (self.n, self.n) or np.shape(matriz_destino) != (self.n, self.n):
+            raise ValueError(f"O tabuleiro deve ser {self.n}x{self.n}")
+        
+        # Verificar se é solucionável
+        if not self.e_solucionavel(matriz_inicial, matriz_destino):
+            return None, Metricas()
+        
+        metricas = Metricas()
+        inicio_tempo = time()
+        
+        codificador = self.codificador
+        motor = self.motor_heuristico(matriz_destino, heuristica)
+        movimentos = codificador.movimentos
+        codigo_destino = codificador.empacotar(matriz_destino)
+        codigo_inicial = codificador.empacotar(matriz_inicial)
+        vazio_inicial = codificador.posicao_vazio(codigo_inicial)
+        
+        encontrado = -1          # sentinela devolvida quando o destino é atingido
+        caminho = [vazio_inicial]  # posições do vazio no caminho atual
+        
+        def buscar(codigo, vazio, anterior, componentes, g, limite):
+            f = g + motor.valor(componentes, heuristica)
+            if f > limite:
+                return f
+            if codigo == codigo_destino:
+                return encontrado
+            
+            metricas.nodos_expandidos += 1
+            minimo = float('inf')
+            for destino in movimentos[vazio]:
+                if destino == anterior:
+                    continue  # Desfaria o movimento anterior
+                
+                # Mover
+                codigo_filho, peca = codificador.mover(codigo, vazio, destino)
+                caminho.append(destino)
+                t = buscar(codigo_filho, destino, vazio,
+                           motor.filho(componentes, codigo_filho, peca, destino, vazio),
+                           g + 1, limite)
+                if t == encontrado:
+                    return encontrado
+                # Desfazer
+                caminho.pop()
+                minimo = min(minimo, t)
+            return minimo
+        
+        componentes_iniciais = motor.inicial(codigo_inicial)
+        limite = motor.valor(componentes_iniciais, heuristica)
+        while True:
+            t = buscar(codigo_inicial, vazio_inicial, -1, componentes_iniciais, 0, limite)
+            if t == encontrado:
+                break
+            if t == float('inf'):
+                metricas.atualizar_tempo(inicio_tempo)
+                return None, metricas
+            limite = t
+        
+        # Reproduzir os movimentos do vazio para montar as matrizes da solução
+        solucao = [codificador.desempacotar(codigo_inicial)]
+        codigo = codigo_inicial
+        for vazio, destino in zip(caminho, caminho[1:]):
+            codigo, _ = codificador.mover(codigo, vazio, destino)
+            solucao.append(codificador.desempacotar(codigo))
+        
+        metricas.profundidade = len(caminho) - 1
+        metricas.atualizar_tempo(inicio_tempo)
+        return solucao, metricas
+
+    def busca_bidirecional(self, matriz_inicial, matriz_destino, heuristica):
+        """
+        A* bidirecional MM (Holte et al., 2016): uma busca parte de cada
+        ponta, a direta com a heurística até matriz_destino e a reversa com a
+        mesma heurística até matriz_inicial. Os dois lados expandem pela
+        prioridade max(f, 2g), então nenhum passa do meio do caminho ótimo.
+        A melhor solução vista (U) é ótima quando
+        U <= max(C, fmin_direta, fmin_reversa, gmin_direta + gmin_reversa + 1),
+        com C a menor prioridade das duas filas.
+        As tabelas 5 e 6 só existem para destinos fixos, então nesses casos
+        a fronteira reversa usa Manhattan.
+        Retorna uma tupla (solução, MetricasBidirecionais)
+        """
+        if np.shape(matriz_inicial) != (self.n, self.n) or np.shape(matriz_destino) != (self.n, self.n):
+            raise ValueError(f"O tabuleiro deve ser {self.n}x{self.n}")
+        
+        # Verificar se é solucionável
+        if not self.e_solucionavel(matriz_inicial, matriz_destino):
+            return None, MetricasBidirecionais(Metricas(), Metricas())
+        
+        inicio_tempo = time()
+        codificador = self.codificador
+        codigo_inicial = codificador.empacotar(matriz_inicial)
+        codigo_destino = codificador.empacotar(matriz_destino)
+        direta = Fronteira(codificador, self.motor_heuristico(matriz_destino, heuristica),
+                           heuristica, codigo_inicial)
+        # O motor até a matriz inicial não entra no cache de motores (um por instância)
+        heuristica_reversa = heuristica if heuristica <= 4 else 1
+        reversa = Fronteira(codificador, MotorHeuristico(matriz_inicial, codificador),
+                            heuristica_reversa, codigo_destino)
+        
+        melhor, encontro = (0, codigo_inicial) if codigo_inicial == codigo_destino else (float('inf'), None)
+        while True:
+            prioridade_direta = direta.minimo(0)
+            prioridade_reversa = reversa.minimo(0)
+            limite = max(min(prioridade_direta, prioridade_reversa),
+                         direta.minimo(1), reversa.minimo(1),
+                         direta.minimo(2) + reversa.minimo(2) + 1)
+            if melhor <= limite or limite == float('inf'):
+                break
+            
+            # Expande o lado de menor prioridade (empate: a frente)
+            if prioridade_direta <= prioridade_reversa:
+                custo, codigo = direta.expandir(reversa)
+            else:
+                custo, codigo = reversa.expandir(direta)
+            if custo < melhor:
+                melhor, encontro = custo, codigo
+        
+        metricas = MetricasBidirecionais(direta.metricas, reversa.metricas)
+        metricas.atualizar_tempo(inicio_tempo)
+        if encontro is None:
+            return None, metricas
+        
+        # Direções até o encontro e, do encontro ao destino, as da reversa invertidas
+        direcoes = direta.armazem.direcoes_ate(direta.armazem.indice[encontro])
+        volta = reversa.armazem.direcoes_ate(reversa.armazem.indice[encontro])
+        direcoes += [direcao ^ 1 for direcao in reversed(volta)]
+        
+        metricas.profundidade = len(direcoes)
+        metricas.atualizar_tempo(inicio_tempo)
+        return codificador.reproduzir(codigo_inicial, direcoes), metricas
+
+    def busca_anytime(self, matriz_inicial, matriz_destino, heuristica=1, peso_inicial=3.0,
+                      decremento=0.5, limite_tempo=None, limite_nos=None):
+        """
+        A* anytime com peso (ARA*, Likhachev et al., 2003). A primeira
+        solução sai de uma busca gulosa com f = g + peso * h; depois o peso
+        diminui de "decremento" em "decremento" até 1 e cada rodada continua
+        a anterior: os nós já gerados são mantidos, a lista aberta só é
+        reordenada com o novo peso, e os nós melhorados depois de fechados
+        (inconsistentes) voltam para ela.
+
+        Gerador: publica (solução, MetricasAnytime) a cada rodada que melhora
+        o custo ou o limitante provado, custo / min(g + h) sobre os abertos e
+        inconsistentes (nunca maior que o peso). Para quando a solução é ótima (limitante 1)
+        ou quando acaba o orçamento: limite_tempo em segundos desde o início
+        ou limite_nos expansões no total. A Manhattan ponderada (3) vira a
+        Manhattan (1), já que aqui o peso é variável; o limitante só vale
+        para heurísticas admissíveis.
+        """
+        if np.shape(matriz_inicial) != (self.n, self.n) or np.shape(matriz_destino) != (self.n, self.n):
+            raise ValueError(f"O tabuleiro deve ser {self.n}x{self.n}")
+        if peso_inicial < 1 or decremento <= 0:
+            raise ValueError("O peso inicial deve ser pelo menos 1 e o decremento positivo")
+        
+        # Verificar se é solucionável
+        if not self.e_solucionavel(matriz_inicial, matriz_destino):
+            return
+        
+        inicio_tempo = time()
+        if heuristica == 3:
+            heuristica = 1
+        codificador = self.codificador
+        mover = codificador.mover
+        codigo_inicial = codificador.empacotar(matriz_inicial)
+        codigo_destino = codificador.empacotar(matriz_destino)
+        motor = self.motor_heuristico(matriz_destino, heuristica)
+        valor = motor.valor
+        
+        armazem = ArmazemNos(codificador, motor.bits_componentes)
+        indice = armazem.indice
+        g = armazem.g
+        fechados = armazem.fechados  # 1 = expandido na rodada atual
+        componentes_nos = armazem.componentes
+        raiz = armazem.adicionar(codigo_inicial, 0, codificador.posicao_vazio(codigo_inicial),
+                                 RAIZ, motor.inicial(codigo_inicial))
+        objetivo = raiz if codigo_inicial == codigo_destino else None
+        
+        peso = float(peso_inicial)
+        abertos = {raiz}
+        inconsistentes = set()
+        lista_aberta = ListaAbertaHeap()
+        lista_aberta.inserir(peso * valor(componentes_nos[raiz], heuristica), 0, raiz)
+        nodos_expandidos = 0
+        publicada = (float('inf'), float('inf'))  # (custo, limitante) da última solução publicada
+        
+        while True:
+            # Melhora o caminho até o destino ficar com o menor f (com peso) da lista aberta
+            while abertos:
+                f, g_entrada, atual = lista_aberta.primeiro()
+                if atual not in abertos or g_entrada != g[atual]:
+                    lista_aberta.remover()  # entrada antiga
+                    continue
+                if objetivo is not None and g[objetivo] <= f:
+                    break
+                if ((limite_nos is not None and nodos_expandidos >= limite_nos) or
+                        (limite_tempo is not None and time() - inicio_tempo >= limite_tempo)):
+                    return
+                
+                lista_aberta.remover()
+                abertos.remove(atual)
+                fechados[atual] = 1
+                nodos_expandidos += 1
+                
+                codigo_atual = armazem.codigos[atual]
+                vazio_atual = armazem.vazios[atual]
+                componentes_atual = componentes_nos[atual]
+                novo_g = g[atual] + 1
+                for direcao, vazio_vizinho in codificador.movimentos_direcao[vazio_atual]:
+                    codigo_vizinho, peca = mover(codigo_atual, vazio_atual, vazio_vizinho)
+                    vizinho = indice.get(codigo_vizinho)
+                    if vizinho is not None and novo_g >= g[vizinho]:
+                        continue
+                    
+                    componentes = motor.filho(componentes_atual, codigo_vizinho, peca, vazio_vizinho, vazio_atual)
+                    if vizinho is None:
+                        vizinho = armazem.adicionar(codigo_vizinho, novo_g, vazio_vizinho, direcao, componentes)
+                        if codigo_vizinho == codigo_destino:
+                            objetivo = vizinho
+                    else:
+                        armazem.atualizar(vizinho, novo_g, direcao, componentes)
+                    
+                    # Fechado nesta rodada: fica para a próxima em vez de ser reaberto
+                    if fechados[vizinho]:
+                        inconsistentes.add(vizinho)
+                    else:
+                        abertos.add(vizinho)
+                        lista_aberta.inserir(novo_g + peso * valor(componentes, heuristica), novo_g, vizinho)
+            
+            if objetivo is None:
+                return
+            
+            # Limitante provado: nenhum caminho melhor que min(g + h) dos nós ainda não resolvidos
+            custo = g[objetivo]
+            pendentes = abertos | inconsistentes
+            menor_f = min((g[i] + valor(componentes_nos[i], heuristica) for i in pendentes),
+                          default=float('inf'))
+            limitante = 1.0 if custo == 0 or menor_f == float('inf') else max(1.0, min(peso, custo / menor_f))
+            if custo < publicada[0] or limitante < publicada[1]:
+                publicada = (custo, limitante)
+                direcoes = armazem.direcoes_ate(objetivo)
+                metricas = MetricasAnytime(nodos_expandidos, len(direcoes), 0, peso, limitante)
+                metricas.atualizar_tempo(inicio_tempo)
+                yield codificador.reproduzir(codigo_inicial, direcoes), metricas
+            if limitante <= 1.0:
+                return
+            
+            # Próxima rodada: peso menor, inconsistentes de volta à lista aberta e nada fechado
+            peso = max(1.0, peso - decremento)
+            abertos = pendentes
+            inconsistentes = set()
+            lista_aberta = ListaAbertaHeap()
+            for i in abertos:
+                lista_aberta.inserir(g[i] + peso * valor(componentes_nos[i], heuristica), g[i], i)
+            fechados[:] = bytes(len(fechados))
+
+    def busca_paralela(self, matriz_inicial, matriz_destino, heuristica, trabalhadores=None, lote=256,
+                       metodo_inicio=None):
+        """
+        A* paralelo distribuído por hash (HDA*, ver hda_estrela): os estados
+        são repartidos entre "trabalhadores" processos (padrão: um por núcleo),
+        cada um com sua lista aberta e seus nós, trocando filhos em lotes.
+        metodo_inicio escolhe como os processos são criados ("fork", "spawn", ...).
+        Encontra o mesmo custo ótimo do A* quando a heurística é admissível.
+        Retorna uma tupla (solução, MetricasParalelas)
+        """
+        if np.shape(matriz_inicial) != (self.n, self.n) or np.shape(matriz_destino) != (self.n, self.n):
+            raise ValueError(f"O tabuleiro deve ser {self.n}x{self.n}")
+        
+        # Verificar se é solucionável
+        if not self.e_solucionavel(matriz_inicial, matriz_destino):
+            return None, MetricasParalelas([])
+        
+        inicio_tempo = time()
+        codificador = self.codificador
+        codigo_inicial = codificador.empacotar(matriz_inicial)
+        # O motor é criado (e as tabelas em disco geradas) aqui, antes de iniciar os processos
+        motor = self.motor_heuristico(matriz_destino, heuristica)
+        direcoes, estatisticas = hda_estrela(codificador, motor, heuristica, np.asarray(matriz_destino),
+                                             codigo_inicial, trabalhadores or os.cpu_count(), lote,
+                                             metodo_inicio)
+        
+        metricas = MetricasParalelas(estatisticas)
+        metricas.atualizar_tempo(inicio_tempo)
+        if direcoes is None:
+            return None, metricas
+        metricas.profundidade = len(direcoes)
+        return codificador.reproduzir(codigo_inicial, direcoes), metricas
+
+    def busca_feixe(self, matriz_inicial, matriz_destino, heuristica, largura=2000, limite_profundidade=1000):
+        """
+        Busca em feixe vetorizada: cada camada é um bloco NumPy (um estado
+        por linha); todos os filhos da camada são gerados e avaliados de uma
+        vez pelo AvaliadorLote e só os "largura" de menor h seguem adiante.
+        Estados já mantidos em camadas anteriores são descartados.
+        Memória limitada e muito rápida por nó, mas a solução não é ótima
+        (e um feixe estreito demais pode não achar nenhuma).
+        Retorna uma tupla (solução, métricas)
+        """
+        if np.shape(matriz_inicial) != (self.n, self.n) or np.shape(matriz_destino) != (self.n, self.n):
+            raise ValueError(f"O tabuleiro deve ser {self.n}x{self.n}")
+        if heuristica not in HEURISTICAS_LOTE:
+            raise ValueError(f"A busca em feixe só aceita as heurísticas {sorted(HEURISTICAS_LOTE)}")
+        
+        # Verificar se é solucionável
+        if not self.e_solucionavel(matriz_inicial, matriz_destino):
+            return None, Metricas()
+        
+        metricas = Metricas()
+        inicio_tempo = time()
+        avaliador = self.avaliador_lote(matriz_destino)
+        
+        estados = np.asarray(matriz_inicial).reshape(1, -1).astype(np.int8)
+        vazios = np.flatnonzero(estados[0] == 0)
+        chave_destino = avaliador.chaves(avaliador.destino[None, :])
+        visitados = avaliador.chaves(estados)
+        camadas = []  # por camada: (linha do pai, direção do vazio) de cada estado mantido
+        encontrado = 0 if visitados[0] == chave_destino[0] else None
+        
+        while encontrado is None and len(estados) and len(camadas) < limite_profundidade:
+            metricas.nodos_expandidos += len(estados)
+            filhos, vazios_filhos, pais, direcoes = avaliador.expandir(estados, vazios)
+            
+            # Sem repetidos dentro da camada nem estados de camadas anteriores
+            chaves, primeiros = unicos(avaliador.chaves(filhos))
+            novos = ~contidas(chaves, visitados)
+            chaves = chaves[novos]
+            selecionados = primeiros[novos]
+            
+            destino = np.flatnonzero(chaves == chave_destino[0])
+            if len(destino):
+                selecionados = selecionados[destino]
+                encontrado = 0
+            elif len(selecionados) > largura:
+                h = avaliador.valores(filhos[selecionados], heuristica)
+                melhores = np.argpartition(h, largura)[:largura]
+                selecionados = selecionados[melhores]
+                chaves = chaves[melhores]
+            
+            estados = filhos[selecionados]
+            vazios = vazios_filhos[selecionados]
+            camadas.append((pais[selecionados], direcoes[selecionados]))
+            visitados = inserir_ordenadas(visitados, chaves)
+        
+        metricas.atualizar_tempo(inicio_tempo)
+        if encontrado is None:
+            return None, metricas
+        
+        # Volta pelas camadas seguindo a linha do pai
+        caminho = []
+        linha = encontrado
+        for pais_camada, direcoes_camada in reversed(camadas):
+            caminho.append(int(direcoes_camada[linha]))
+            linha = pais_camada[linha]
+        caminho.reverse()
+        
+        metricas.profundidade = len(caminho)
+        codigo_inicial = self.codificador.empacotar(matriz_inicial)
+        return self.codificador.reproduzir(codigo_inicial, caminho), metricas
+
+    def resolver(self, matriz_inicial, matriz_destino, heuristica, algoritmo=1):
+        """
+        Resolve com o algoritmo selecionado: 1 = A*, 2 = IDA*,
+        3 = descida pela tabela de distâncias (ignora a heurística),
+        4 = A* bidirecional, 5 = busca em feixe vetorizada (não ótima),
+        6 = A* paralelo (HDA*, um processo por núcleo),
+        7 = A* anytime (ARA*, a última solução publicada, que é a ótima sem orçamento).
+        Retorna uma tupla (solução, métricas)
+        """
+        if algoritmo == 1:
+            return self.busca_a_estrela(matriz_inicial, matriz_destino, heuristica)
+        elif algoritmo == 2:
+            return self.busca_ida_estrela(matriz_inicial, matriz_destino, heuristica)
+        elif algoritmo == 3:
+            return self.resolver_por_tabela(matriz_inicial, matriz_destino)
+        elif algoritmo == 4:
+            return self.busca_bidirecional(matriz_inicial, matriz_destino, heuristica)
+        elif algoritmo == 5:
+            return self.busca_feixe(matriz_inicial, matriz_destino, heuristica)
+        elif algoritmo == 6:
+            return self.busca_paralela(matriz_inicial, matriz_destino, heuristica)
+        elif algoritmo == 7:
+            solucao, metricas = None, MetricasAnytime()
+            for solucao, metricas in self.busca_anytime(matriz_inicial, matriz_destino, heuristica):
+                pass
+            return solucao, metricas
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo}")
+
+    def resolver_por_tabela(self, matriz_inicial, matriz_destino):
+        """
+        Resolve o 3x3 sem busca, descendo pela tabela de distâncias exatas.
+        Retorna uma tupla (solução, métricas) como busca_a_estrela
+        """
+        if self.n != 3 or np.shape(matriz_inicial) != (3, 3) or np.shape(matriz_destino) != (3, 3):
+            raise ValueError("A tabela de distâncias só é viável para o tabuleiro 3x3")
+        
+        metricas = Metricas()
+        inicio_tempo = time()
+        
+        tabela = self.tabela_distancias(matriz_destino)
+        codigos = tabela.descer(self.codificador.empacotar(matriz_inicial))
+        metricas.atualizar_tempo(inicio_tempo)
+        if codigos is None:
+            return None, metricas
+        
+        metricas.nodos_expandidos = len(codigos) - 1
+        metricas.profundidade = len(codigos) - 1
+        return [self.codificador.desempacotar(codigo) for codigo in codigos], metricas
+
+    def embaralhar(self, rng, limite_movimentos=30):
+        """Gera uma instância a entre 10 e limite_movimentos movimentos do destino (ver embaralhar_lote)"""
+        return self.embaralhar_lote(rng, 1, limite_movimentos)[0]
+
+    def embaralhar_lote(self, rng, quantidade, limite_movimentos=30):
+        """
+        Gera "quantidade" instâncias de uma vez, cada uma a um número de
+        movimentos sorteado entre 10 e limite_movimentos a partir do destino.
+        No 3x3 esse número é a distância exata (sorteio uniforme entre os
+        estados a essa distância, limitada à maior que existe); nos maiores é
+        o tamanho de um passeio aleatório do vazio, então a distância pode ser
+        menor. Um tabuleiro uniforme seria difícil demais para o A* a partir do 4x4.
+        """
+        movimentos = rng.integers(10, limite_movimentos + 1, size=quantidade)
+        if self.n == 3:
+            sorteio = self.sorteio_profundidade(self.matriz_destino)
+            return gerar_lote(3, quantidade, rng, self.matriz_destino,
+                              np.minimum(movimentos, sorteio.maxima), sorteio).astype(int)
+        return passeio_lote(self.n, movimentos, rng, self.matriz_destino).astype(int)
+
+    def executar_experimentos(self, num_experimentos=100, limite_movimentos=30,
+                              processos=1, semente=None, tamanho_lote=None):
+        """
+        Executa experimentos para comparar diferentes heurísticas.
+        As instâncias são geradas todas de uma vez aqui (embaralhar_lote, com
+        "semente"), então a mesma semente reproduz os mesmos resultados, serial
+        ou paralelo. Cada par (instância, heurística) é uma tarefa independente;
+        com processos > 1 as tarefas são distribuídas em lotes para um pool de
+        processos.
+        """
         # Classe para armazenar resultados por heurística
         class ResultadosHeuristica:
             def __init__(self):
@@ -261,29 +904,22 @@ class SlidingPuzzle:
         # Inicializar resultados para cada heurística
         resultados = {i: ResultadosHeuristica() for i in range(1, 5)}
         
-        for _ in range(num_experimentos):
-            # Começar com o estado objetivo
-            matriz_inicial = copy.deepcopy(self.matriz_destino)
-            
-            # Embaralhar com movimentos válidos
-            for _ in range(np.random.randint(10, limite_movimentos + 1)):
-                vizinhos = self.get_vizinhos(matriz_inicial)
-                if vizinhos:
-                    matriz_inicial = vizinhos[np.random.randint(0, len(vizinhos))]
-            
-            # Garantir que é solucionável
-            while not self.e_solucionavel(matriz_inicial) == self.e_solucionavel(self.matriz_destino):
-                # Troque duas peças (exceto o espaço vazio)
-                indices = [(i, j) for i in range(3) for j in range(3) if matriz_inicial[i, j] != 0]
-                idx1, idx2 = np.random.choice(len(indices), 2, replace=False)
-                i1, j1 = indices[idx1]
-                i2, j2 = indices[idx2]
-                matriz_inicial[i1, j1], matriz_inicial[i2, j2] = matriz_inicial[i2, j2], matriz_inicial[i1, j1]
-                
-            # Testar cada heurística
-            for heur in range(1, 5):
-                _, metricas = self.busca_a_estrela(matriz_inicial, self.matriz_destino, heur)
-                resultados[heur].adicionar_metrica(metricas)
+        # As 4 heurísticas recebem a mesma instância
+        tabuleiros = self.embaralhar_lote(np.random.default_rng(semente), num_experimentos, limite_movimentos)
+        tarefas = [(self.n, self.matriz_destino, tabuleiro, heur)
+                   for tabuleiro in tabuleiros for heur in range(1, 5)]
+        
+        if processos > 1:
+            if tamanho_lote is None:
+                tamanho_lote = max(1, len(tarefas) // (processos * 4))
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                metricas_tarefas = list(executor.map(_executar_tarefa, tarefas, chunksize=tamanho_lote))
+        else:
+            metricas_tarefas = [_executar_tarefa(tarefa) for tarefa in tarefas]
+        
+        # map preserva a ordem das tarefas, então a agregação é igual à serial
+        for (_, _, _, heur), metricas in zip(tarefas, metricas_tarefas):
+            resultados[heur].adicionar_metrica(metricas)
         
         # Converter resultados para o formato esperado pela função de visualização
         resultados_dict = {i: resultado.to_dict() for i, resultado in resultados.items()}
@@ -345,9 +981,22 @@ class SlidingPuzzle:
         print("=" * 50)
 
 
+# Um SlidingPuzzle por tamanho em cada processo do pool, para reaproveitar as tabelas
+_puzzles_processo = {}
+
+def _executar_tarefa(tarefa):
+    """Executa uma tarefa (instância, heurística) de executar_experimentos e retorna as métricas"""
+    n, matriz_destino, matriz_inicial, heuristica = tarefa
+    puzzle = _puzzles_processo.get(n)
+    if puzzle is None:
+        puzzle = SlidingPuzzle(n)
+        _puzzles_processo[n] = puzzle
+    _, metricas = puzzle.busca_a_estrela(matriz_inicial, matriz_destino, heuristica)
+    return metricas
+
 def exibir_matriz(matriz):
-    """Formata uma matriz 3x3 para exibição"""
-    for i in range(3):
+    """Formata uma matriz NxN para exibição"""
+    for i in range(len(matriz)):
         print(" ".join(f"{num:2d}" if num != 0 else "  " for num in matriz[i]))
     print()
 
@@ -363,8 +1012,14 @@ def exibir_solucao(solucao):
         exibir_matriz(estado)
     
 def main():
-    print("Bem vindo a RESOLVE TUDO SLIDING PUZZLES 3X3 ULTIMATE")
-    puzzle = SlidingPuzzle()  # Criar instância da classe principal
+    print("Bem vindo a RESOLVE TUDO SLIDING PUZZLES NXN ULTIMATE")
+    while True:
+        try:
+            n = int(input("Tamanho do tabuleiro (3 = 8-puzzle, 4 = 15-puzzle, 5 = 24-puzzle): "))
+            puzzle = SlidingPuzzle(n)  # Criar instância da classe principal
+            break
+        except ValueError as e:
+            print(f"Erro: entrada inválida - {e}")
 
     while True:
         try:
@@ -385,36 +1040,49 @@ def main():
                 print("2. Hamming")
                 print("3. Manhattan ponderada (peso 1.5)")
                 print("4. Heurísticas combinadas (manhattan e hamming)")
+                print("5. Distância exata (tabela pré-calculada, só 3x3)")
+                print("6. Bancos de padrões aditivos (gerados em disco na primeira vez)")
                 heuristica = int(input("Sua escolha: "))
                 
-                if heuristica not in [1, 2, 3, 4]:
+                if heuristica not in [1, 2, 3, 4, 5, 6]:
                     print("Heurística inválida!")
                     continue
                 
-                matriz_destino = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+                print("\nSelecione o algoritmo de busca:")
+                print("1. A*")
+                print("2. IDA* (memória linear, recomendado para 4x4 e 5x5)")
+                print("3. Sem busca: descer pela tabela de distâncias (só 3x3)")
+                print("4. A* bidirecional (encontro no meio, para instâncias profundas)")
+                print("5. Busca em feixe vetorizada (NumPy, rápida mas não ótima; heurísticas 1 a 4)")
+                print(f"6. A* paralelo (HDA*, {os.cpu_count()} processos, para instâncias difíceis)")
+                print("7. A* anytime (ARA*: solução rápida com peso, melhorada até a ótima)")
+                algoritmo = int(input("Sua escolha: "))
+                
+                if algoritmo not in [1, 2, 3, 4, 5, 6, 7]:
+                    print("Algoritmo inválido!")
+                    continue
+                
+                matriz_destino = puzzle.matriz_destino
 
                 if escolha == 1:
-                    matriz_inicial = np.zeros((3, 3), dtype=int)
-                    print("\nDigite os valores da matriz 3x3 (use 0 para o espaço vazio):")
-                    for linha in range(3):
-                        for coluna in range(3):
+                    matriz_inicial = np.zeros((n, n), dtype=int)
+                    print(f"\nDigite os valores da matriz {n}x{n} (use 0 para o espaço vazio):")
+                    for linha in range(n):
+                        for coluna in range(n):
                             matriz_inicial[linha][coluna] = int(input(f"Digite o valor em [{linha}][{coluna}]: "))
                 
                 elif escolha == 2:
-                    rng = np.random.default_rng()
-                    matriz_inicial = np.arange(9)
-                    rng.shuffle(matriz_inicial)
-                    matriz_inicial = matriz_inicial.reshape(3, 3)
+                    matriz_inicial = puzzle.gerar_instancia()
                     print("\nMatriz aleatória gerada:")
                     exibir_matriz(matriz_inicial)
                 
                 # Verificar se é solucionável antes de tentar resolver
-                if not puzzle.e_solucionavel(matriz_inicial) == puzzle.e_solucionavel(matriz_destino):
+                if not puzzle.e_solucionavel(matriz_inicial, matriz_destino):
                     print("\nAtenção: Esta configuração NÃO tem solução!")
                     continue
                     
                 print("\nResolvendo...\n")
-                solucao, metricas = puzzle.busca_a_estrela(matriz_inicial, matriz_destino, heuristica)
+                solucao, metricas = puzzle.resolver(matriz_inicial, matriz_destino, heuristica, algoritmo)
                 
                 if solucao is None:
                     print("Sem solução possível para esta configuração!")
@@ -429,8 +1097,13 @@ def main():
                     print("Número de experimentos deve ser positivo!")
                     continue
                 
+                processos = int(input(f"Quantos processos em paralelo? (1 = serial, esta máquina tem {os.cpu_count()}): "))
+                if processos <= 0:
+                    print("Número de processos deve ser positivo!")
+                    continue
+                
                 print(f"\nExecutando {num_experimentos} experimentos. Isso pode levar algum tempo...")
-                resultados = puzzle.executar_experimentos(num_experimentos)
+                resultados = puzzle.executar_experimentos(num_experimentos, processos=processos)
                 puzzle.mostrar_resultados(resultados)
                 print("\nAnálise completa! Gráficos salvos em 'comparacao_heuristicas.png'")
 
@@ -1,14 +1,25 @@
 import numpy as np
 
+_tabelas_destino = {}
+
+def tabela_destino(matriz_destino):
+    # linha e coluna de destino de cada peca, calculadas uma vez por matriz_destino
+    chave = (matriz_destino.shape, matriz_destino.tobytes())
+    if chave not in _tabelas_destino:
+        linhas = np.zeros(matriz_destino.size, dtype=int)
+        colunas = np.zeros(matriz_destino.size, dtype=int)
+        for (linha, coluna), numero in np.ndenumerate(matriz_destino):
+            linhas[numero] = linha
+            colunas[numero] = coluna
+        _tabelas_destino[chave] = (linhas, colunas)
+    return _tabelas_destino[chave]
+
 def manhattan(matriz_atual,matriz_destino):
-    distancia = 0;
-    for linha_atual in range(3):
-        for coluna_atual in range(3):
-            numero = matriz_atual[linha_atual,coluna_atual]
-            if numero !=0:
-                linha_destino,coluna_destino = np.where(matriz_destino == numero)
-                distancia += np.abs(linha_atual-linha_destino[0])+np.abs(coluna_atual-coluna_destino[0])
-                return distancia
+    linhas_destino,colunas_destino = tabela_destino(matriz_destino)
+    linhas_atuais,colunas_atuais = np.indices(matriz_atual.shape)
+    pecas = matriz_atual != 0
+    numeros = matriz_atual[pecas]
+    return int(np.sum(np.abs(linhas_atuais[pecas]-linhas_destino[numeros])+np.abs(colunas_atuais[pecas]-colunas_destino[numeros])))
 
 def hamming(matriz_atual,matriz_destino):
     qtde_fora_lugar = len(matriz_atual[np.where(matriz_atual!=matriz_destino)])